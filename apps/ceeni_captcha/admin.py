@@ -32,13 +32,17 @@ class BaseCaptchaAdmin(admin.ModelAdmin):
         "question_text",
         "correct_answer",
         "difficulty",
+        "calibrated_difficulty",
+        "solve_rate",
         "active",
         "updated_at",
     )
+    # Filters on the normalized tag table, offering only the tags linked to
+    # rows of the model being viewed (not every tag of every captcha model)
     list_filter = (
         "active",
         "difficulty",
-        "tags",
+        ("normalized_tags", admin.RelatedOnlyFieldListFilter),
     )
     search_fields = (
         "question_text",
@@ -46,7 +50,17 @@ class BaseCaptchaAdmin(admin.ModelAdmin):
         "tags",
     )
     ordering = ("-updated_at",)
-    readonly_fields = ("created_at", "updated_at", "slug")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "slug",
+        "attempt_count",
+        "solve_count",
+        "timed_solve_count",
+        "solve_time_ms_total",
+        "solve_rate",
+        "calibrated_difficulty",
+    )
     fieldsets = (
         (None, {
             "fields": (
@@ -60,6 +74,17 @@ class BaseCaptchaAdmin(admin.ModelAdmin):
                 "slug",
             )
         }),
+        ("Attempt Telemetry", {
+            "fields": (
+                "attempt_count",
+                "solve_count",
+                "timed_solve_count",
+                "solve_time_ms_total",
+                "solve_rate",
+                "calibrated_difficulty",
+            ),
+            "classes": ("collapse",),
+        }),
         ("Timestamps", {
             "fields": ("created_at", "updated_at"),
             "classes": ("collapse",),
@@ -4,3 +4,13 @@ from django.apps import AppConfig
 class CeeniCaptchaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.ceeni_captcha'
+
+    def ready(self):
+        # Token mode's replay protection needs a shared cache
+        import apps.ceeni_captcha.checks
+
+        # Keep the in-memory captcha pool index in sync with row changes
+        import apps.ceeni_captcha.signals.pool_index_sync
+
+        # Free registry slugs when captcha rows are deleted
+        import apps.ceeni_captcha.signals.slug_registry_sync
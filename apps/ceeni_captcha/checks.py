@@ -0,0 +1,38 @@
+# apps/ceeni_captcha/checks.py
+
+from django.conf import settings
+from django.core.checks import Error, Warning, register
+
+from apps.common.utils.process_cache import cache_is_shared
+
+# Shared, but every burned token would cost a database write on each POST
+DATABASE_CACHE_BACKENDS = {
+    "django.core.cache.backends.db.DatabaseCache",
+}
+
+
+@register()
+def check_token_mode_cache(app_configs, **kwargs):
+    """
+    Token mode burns used tokens in Django's cache. With a per-process cache
+    each worker keeps its own list, so a token could be replayed once per
+    worker. The database cache is shared, but burning a token is then an
+    INSERT on every captcha POST, which token mode exists to avoid. Refuse
+    both outside DEBUG, warn during development.
+    """
+    if not getattr(settings, "CEENI_CAPTCHA_TOKEN_MODE", False):
+        return []
+
+    hint = "Configure CACHES['default'] with Redis or Memcached (see config/settings/prod.py)."
+    if not cache_is_shared():
+        message = "CEENI_CAPTCHA_TOKEN_MODE needs a cache shared by all workers for replay protection."
+        code = "001"
+    elif settings.CACHES["default"].get("BACKEND") in DATABASE_CACHE_BACKENDS:
+        message = "CEENI_CAPTCHA_TOKEN_MODE should not burn tokens in the database cache."
+        code = "002"
+    else:
+        return []
+
+    if settings.DEBUG:
+        return [Warning(message, hint=hint, id=f"ceeni_captcha.W{code}")]
+    return [Error(message, hint=hint, id=f"ceeni_captcha.E{code}")]
@@ -1,8 +1,9 @@
 # apps/ceeni_captcha/forms/captcha_mixin.py
 
-import random
+import time
 
 from django import forms
+from django.conf import settings
 from django.core.exceptions import ValidationError
 
 # Import all supported Captcha models
@@ -14,7 +15,16 @@ from apps.ceeni_captcha.models import (
     JumbledConstituencyCaptcha,
     JumbledCountyCaptcha,
     PoliticalPartyLeaderCaptcha,
+    CaptchaSlugRegistry,
 )
+from apps.ceeni_captcha.utils.pool_index import get_pool_index
+from apps.ceeni_captcha.utils.location_captcha import (
+    GeneratedCountyCaptcha,
+    GeneratedConstituencyCaptcha,
+    GeneratedWardCaptcha,
+)
+from apps.ceeni_captcha.utils.challenge_tokens import issue_token, verify_token
+from apps.ceeni_captcha.utils.telemetry import captcha_telemetry
 
 # Default whitelist of models to draw captchas from
 # Can be overridden by a custom whitelist passed to the form/mixin.
@@ -25,8 +35,15 @@ DEFAULT_CAPTCHA_MODELS = [
     JumbledConstituencyCaptcha,
     JumbledCountyCaptcha,
     PoliticalPartyLeaderCaptcha,
+    # Generated on the fly from the location tables (no stored rows)
+    GeneratedWardCaptcha,
+    GeneratedConstituencyCaptcha,
+    GeneratedCountyCaptcha,
 ]
 
+# Token payloads identify the captcha source by its label
+CAPTCHA_MODELS_BY_LABEL = {model._meta.label_lower: model for model in DEFAULT_CAPTCHA_MODELS}
+
 
 
 
@@ -37,15 +54,20 @@ class CaptchaFieldMixin(forms.Form):
     A reusable Django form mixin that injects a civic/jumbled captcha challenge into any form.
 
     Features:
-    - Supports randomized selection from multiple models
+    - Supports randomized selection from multiple models via the process-level pool index
     - Prevents repetition using session-based tracking
     - Allows difficulty range control
     - Fully backend-validated for security
+    - Optional stateless mode: signed, expiring challenge tokens verified
+      without DB queries or session writes (CEENI_CAPTCHA_TOKEN_MODE)
     """
 
     # Captcha ID used to fetch the model instance on form submission (hidden)
     captcha_slug = forms.CharField(widget=forms.HiddenInput())
 
+    # Signed challenge token (token mode only, hidden)
+    captcha_token = forms.CharField(widget=forms.HiddenInput(), required=False)
+
     # Captcha response field shown to the user
     captcha_response = forms.CharField(
         label="Captcha Challenge",
@@ -62,26 +84,66 @@ class CaptchaFieldMixin(forms.Form):
         request=None,
         difficulty_range=(0, 3),
         model_whitelist=None,
+        token_mode=None,
+        solve_rate_band=None,
+        tags=None,
         **kwargs
     ):
         """
-        Initializes the captcha challenge on form load.
+        Prepares the captcha challenge on form load.
 
         Accepts:
         - request: Django HttpRequest, used to track captcha models seen in session
         - difficulty_range: Tuple of min/max difficulty for filtering
         - model_whitelist: Optional list of captcha model classes to restrict selection
+        - token_mode: Use signed challenge tokens instead of slugs
+          (defaults to settings.CEENI_CAPTCHA_TOKEN_MODE)
+        - solve_rate_band: Optional (low, high) calibrated solve-rate band,
+          e.g. (0.6, 0.9); uncalibrated captchas always qualify
+          (defaults to settings.CEENI_CAPTCHA_SOLVE_RATE_BAND)
+        - tags: Optional list of topic tags, e.g. ["elections"]; a captcha
+          qualifies if it carries any of them
+
+        A question is only picked for unbound forms. Bound (submitted) forms
+        validate the challenge they were given and pick a fresh one only if
+        validation fails and the form has to be shown again.
         """
         self.request = request
         super().__init__(*args, **kwargs)
 
-        # Track used captcha model types in session to avoid repetition
-        used_labels = self.request.session.get("used_captcha_models", []) if self.request else []
+        if token_mode is None:
+            token_mode = getattr(settings, "CEENI_CAPTCHA_TOKEN_MODE", False)
+        self.captcha_token_mode = token_mode
+        self.captcha_difficulty_range = difficulty_range
+        self.captcha_models = model_whitelist or DEFAULT_CAPTCHA_MODELS
+        if solve_rate_band is None:
+            solve_rate_band = getattr(settings, "CEENI_CAPTCHA_SOLVE_RATE_BAND", None)
+        self.captcha_solve_rate_band = solve_rate_band
+        self.captcha_tags = [tag.strip().lower() for tag in tags] if tags else None
 
-        # Use custom whitelist if provided, otherwise fallback to default models
-        available_models = model_whitelist or DEFAULT_CAPTCHA_MODELS
+        if token_mode:
+            # The token replaces the slug entirely
+            self.fields["captcha_slug"].required = False
+            self.fields["captcha_token"].required = True
+
+        if not self.is_bound:
+            self.materialize_captcha()
+
+    def materialize_captcha(self):
+        """
+        Picks a question and populates the captcha fields with it.
+
+        On a bound form the submitted challenge is swapped out as well, so a
+        re-rendered form carries the new slug/token and an empty answer box.
+        """
+        # Session tracking is skipped in token mode so the flow stays stateless
+        session = self.request.session if self.request and not self.captcha_token_mode else None
+
+        # Track used captcha model types in session to avoid repetition
+        used_labels = session.get("used_captcha_models", []) if session is not None else []
 
         # Filter out captcha models already used by the user in this session
+        available_models = self.captcha_models
         unused_models = [
             model for model in available_models
             if model._meta.model_name not in used_labels
@@ -90,40 +152,75 @@ class CaptchaFieldMixin(forms.Form):
         # Fallback: if all have been used, reset session and reuse all models
         if not unused_models:
             unused_models = available_models
-            if self.request:
-                self.request.session["used_captcha_models"] = []
+            if session is not None:
+                session["used_captcha_models"] = []
 
-        # Gather eligible questions from selected models based on difficulty
-        eligible_questions = []
-        for model_cls in unused_models:
-            qs = model_cls.objects.filter(active=True, difficulty__range=difficulty_range)
-            eligible_questions += list(qs)
+        # Pick a question from the in-memory pool index (no per-request table reads)
+        instance = get_pool_index().choose(
+            unused_models,
+            self.captcha_difficulty_range,
+            solve_rate_band=self.captcha_solve_rate_band,
+            tags=self.captcha_tags,
+        )
 
         # Graceful handling if no captchas are available
-        if not eligible_questions:
+        if instance is None:
+            self._rebind_captcha(slug="", token="")
             self.fields["captcha_slug"].initial = ''
             self.fields["captcha_response"].label = 'Captcha unavailable'
             self.fields["captcha_response"].help_text = 'No available captcha questions at this time.'
             return
 
-        # Randomly select one captcha instance
-        instance = random.choice(eligible_questions)
+        # Generated sources hand back a template; jumble it for this challenge
+        if getattr(instance.model, "generated", False):
+            instance = instance.model.materialize(instance)
+
         self._current_captcha = instance
 
         # Populate form fields with selected captcha details
-        self.fields["captcha_slug"].initial = instance.slug
+        if self.captcha_token_mode:
+            token = issue_token(instance.model, instance.pk, instance.correct_answer)
+            self.fields["captcha_token"].initial = token
+            self._rebind_captcha(slug="", token=token)
+        else:
+            self.fields["captcha_slug"].initial = instance.slug
+            self._rebind_captcha(slug=instance.slug, token="")
         self.fields["captcha_response"].label = instance.question_text
 
         # Optionally show hint if available
+        help_text = self.base_fields["captcha_response"].help_text
         if instance.hint:
-            self.fields["captcha_response"].help_text += f" Hint: {instance.hint}"
+            help_text += f" Hint: {instance.hint}"
+        self.fields["captcha_response"].help_text = help_text
 
         # Log the model as used for this session
-        if self.request:
-            model_name = instance.__class__._meta.model_name
+        if session is not None:
+            model_name = instance.model._meta.model_name
             if model_name not in used_labels:
                 used_labels.append(model_name)
-                self.request.session["used_captcha_models"] = used_labels
+                session["used_captcha_models"] = used_labels
+
+    def _rebind_captcha(self, slug, token):
+        """
+        Replaces the submitted challenge in a bound form's data.
+        No-op for unbound forms, which render field initials instead.
+        """
+        if not self.is_bound:
+            return
+        data = self.data.copy()
+        data[self.add_prefix("captcha_slug")] = slug
+        data[self.add_prefix("captcha_token")] = token
+        data[self.add_prefix("captcha_response")] = ""
+        self.data = data
+
+    def full_clean(self):
+        """
+        Validates the submitted challenge, then issues a fresh one if the form
+        failed and will be re-rendered. Valid submissions never pick a question.
+        """
+        super().full_clean()
+        if self.is_bound and self._errors:
+            self.materialize_captcha()
 
     def clean(self):
         """
@@ -133,25 +230,78 @@ class CaptchaFieldMixin(forms.Form):
         - Captcha still exists and is active
         - Answer matches (case- and whitespace-insensitive)
         - Secure fallback if model is missing
+
+        The slug is resolved through the in-memory pool index, so checking an
+        answer costs a single primary-key lookup whatever the outcome (or one
+        registry-joined lookup for a slug this process has not indexed yet). In token mode the signed
+        token is checked instead, with no query at all.
+
+        Every answer check is counted in memory by `captcha_telemetry`;
+        nothing is written to the database here.
         """
         cleaned_data = super().clean()
-        slug = cleaned_data.get("captcha_slug")
         response = cleaned_data.get("captcha_response")
 
+        if self.captcha_token_mode:
+            token = cleaned_data.get("captcha_token")
+            if not token or not response:
+                raise ValidationError("Captcha question or response missing.")
+
+            verify_token(token, response, on_checked=self._record_token_attempt)
+            return cleaned_data
+
+        slug = cleaned_data.get("captcha_slug")
+
         if not slug or not response:
             raise ValidationError("Captcha question or response missing.")
 
-        # Search through all known captcha models to find matching slug
-        for model in DEFAULT_CAPTCHA_MODELS:
-            try:
-                obj = model.objects.get(slug=slug, active=True)
-                if obj.correct_answer.strip().lower() != response.strip().lower():
-                    raise ValidationError("Incorrect captcha answer. Try again.")
-                break
-            except model.DoesNotExist:
-                continue
-        else:
-            # If no model matched, assume stale or tampered captcha
+        resolved = self._resolve_captcha(slug)
+        if resolved is None:
+            # Unknown, inactive or tampered slug
             raise ValidationError("This captcha is no longer valid. Please reload the page.")
 
+        model, pk, correct_answer = resolved
+        solved = correct_answer.strip().lower() == response.strip().lower()
+        # Slugs carry no issue time, so time-to-answer is only known in token mode
+        captcha_telemetry.record(model, pk, solved)
+
+        if not solved:
+            raise ValidationError("Incorrect captcha answer. Try again.")
+
         return cleaned_data
+
+    @staticmethod
+    def _record_token_attempt(payload, solved):
+        """Counts a token-mode answer, with its time-to-answer."""
+        model = CAPTCHA_MODELS_BY_LABEL.get(payload["m"])
+        if model is not None:
+            elapsed_ms = (time.time() - payload["t"]) * 1000
+            captcha_telemetry.record(model, payload["i"], solved, elapsed_ms)
+
+    def _resolve_captcha(self, slug):
+        """
+        Returns (model, pk, correct_answer) for an active captcha slug, or None.
+        """
+        choice = get_pool_index().lookup(slug)
+        if choice is None:
+            # Not in this process's index (e.g. index not yet refreshed): one
+            # query for the active row the registry says owns the slug
+            stored_models = [model for model in DEFAULT_CAPTCHA_MODELS if not getattr(model, "generated", False)]
+            return CaptchaSlugRegistry.resolve_active(slug, stored_models)
+
+        model, pk = choice.model, choice.pk
+        if model not in DEFAULT_CAPTCHA_MODELS:
+            return None
+
+        # Generated captchas are checked against the in-memory location name
+        if getattr(model, "generated", False):
+            return model, pk, choice.correct_answer
+
+        correct_answer = (
+            model.objects.filter(pk=pk, active=True)
+            .values_list("correct_answer", flat=True)
+            .first()
+        )
+        if correct_answer is None:
+            return None
+        return model, pk, correct_answer
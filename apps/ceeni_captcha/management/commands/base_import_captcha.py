@@ -3,9 +3,13 @@ FILE: apps/ceeni_captcha/management/commands/base_import_captcha.py
 
 PURPOSE:
     This is an abstract base management command for importing captcha questions
-    into the CEENI platform from standardized CSV files. This command provides
-    the core logic for parsing CSV data and inserting or updating records in
-    corresponding Django models derived from CaptchaBase.
+    into the CEENI platform from standardized CSV files. Parsing, diffing and
+    the bulk, single-transaction write are handled by
+    `apps/ceeni_captcha/utils/bulk_import.py`.
+
+OPTIONS:
+    --dry-run       Print the change report without writing anything
+    --batch-size    Rows per bulk statement (default 500)
 
 USAGE:
     Subclasses must define:
@@ -18,6 +22,9 @@ EXAMPLE SUBCLASSES:
     - import_jumbled_constituency_captcha.py
     - import_jumbled_leader_captcha.py
     - import_jumbled_ward_captcha.py
+    - import_political_leader_captcha.py
+
+    To import every captcha file at once, use `import_all_captcha`.
 
 CSV FILE STRUCTURE (common for all captcha CSVs):
     question_text,correct_answer,hint,explanation,difficulty,tags,active
@@ -27,11 +34,11 @@ DEPENDENCIES:
 
 """
 
-import csv
 from django.core.management.base import BaseCommand, CommandError
-from django.utils.text import slugify
 from config.settings.base import CSV_DATA_DIR
 
+from apps.ceeni_captcha.utils.bulk_import import import_captcha_file, write_import_report
+
 
 class BaseImportCaptchaCommand(BaseCommand):
     help = "Imports captcha data from a CSV file into the specified model."
@@ -42,6 +49,19 @@ class BaseImportCaptchaCommand(BaseCommand):
     # Filename for the CSV data file (relative to data/csv/captcha/)
     file_name = None
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report what would change without writing to the database.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Rows per bulk_create / bulk_update statement.",
+        )
+
+    def get_file_path(self):
+        return CSV_DATA_DIR / "captcha" / self.file_name
+
     def handle(self, *args, **options):
         # Ensure subclass correctly defines 'model'
         if not self.model:
@@ -52,52 +72,27 @@ class BaseImportCaptchaCommand(BaseCommand):
             raise CommandError("The 'file_name' attribute must be set in the subclass.")
 
         # Construct full CSV file path
-        file_path = CSV_DATA_DIR / "captcha" / self.file_name
-
-        created_count = 0
-        updated_count = 0
+        file_path = self.get_file_path()
 
-        # Attempt to read and import CSV data
+        # Diff and apply the whole file in one transaction
         try:
-            with open(file_path, newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                for row in reader:
-                    # Generate a unique slug based on question_text
-                    slug = slugify(row['question_text'][:80])
-
-                    # Default values extracted from CSV columns
-                    defaults = {
-                        'correct_answer': row['correct_answer'].strip(),
-                        'hint': row['hint'].strip(),
-                        'explanation': row['explanation'].strip(),
-                        'difficulty': int(row['difficulty']),
-                        'tags': row['tags'].strip(),
-                        'active': row['active'].strip().lower() == 'true'
-                    }
-
-                    # Create or update captcha record
-                    obj, created = self.model.objects.update_or_create(
-                        slug=slug,
-                        defaults={**defaults, 'question_text': row['question_text']}
-                    )
-
-                    # Increment counters based on created or updated status
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
-            # Success message after completing import
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"Import completed: {created_count} created, {updated_count} updated."
-                )
+            report = import_captcha_file(
+                self.model,
+                file_path,
+                dry_run=options["dry_run"],
+                batch_size=options["batch_size"],
             )
 
         # Error handling for missing CSV file
         except FileNotFoundError:
             raise CommandError(f"CSV file not found: {file_path}")
 
+        # Malformed rows abort the import before anything is written
+        except ValueError as e:
+            raise CommandError(f"Invalid row in {self.file_name}: {e}")
+
         # General exception handling for debugging and stability
         except Exception as e:
             raise CommandError(f"An unexpected error occurred: {e}")
+
+        write_import_report(self, report, verbosity=options["verbosity"])
@@ -0,0 +1,92 @@
+"""
+FILE: apps/ceeni_captcha/management/commands/benchmark_captcha_pool.py
+
+PURPOSE:
+    Micro-benchmark for captcha challenge selection. Builds synthetic, in-memory
+    pools of increasing size and compares:
+        - index:  `CaptchaPoolIndex.choose()` (what CaptchaFieldMixin uses)
+        - legacy: gathering every eligible row into one list, then random.choice()
+                  (the previous per-request behaviour, minus the DB round trips)
+
+    Index latency should stay flat as the pool grows; legacy latency grows linearly.
+    No database access is needed.
+
+USAGE:
+    python manage.py benchmark_captcha_pool
+    python manage.py benchmark_captcha_pool --sizes 1000 10000 100000 --iterations 5000
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.ceeni_captcha.utils.pool_index import (
+    INDEXED_CAPTCHA_MODELS,
+    CaptchaChoice,
+    CaptchaPoolIndex,
+)
+
+
+def build_synthetic_index(size, difficulties=range(0, 6)):
+    """
+    Spreads `size` fake rows evenly across every captcha model and difficulty level.
+    """
+    keys = [
+        (model, difficulty)
+        for model in INDEXED_CAPTCHA_MODELS
+        for difficulty in difficulties
+    ]
+    buckets = {(model._meta.label_lower, difficulty): [] for model, difficulty in keys}
+
+    for pk in range(size):
+        model, difficulty = keys[pk % len(keys)]
+        buckets[(model._meta.label_lower, difficulty)].append(
+            CaptchaChoice(model, pk, f"synthetic-{pk}", f"Synthetic question {pk}?", "", "answer")
+        )
+
+    return CaptchaPoolIndex({key: tuple(bucket) for key, bucket in buckets.items()})
+
+
+class Command(BaseCommand):
+    help = "Benchmarks in-memory captcha selection as the pool grows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000],
+            help="Synthetic pool sizes to benchmark.",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=2_000,
+            help="Selections per pool size.",
+        )
+
+    def handle(self, *args, **options):
+        models = list(INDEXED_CAPTCHA_MODELS)
+        difficulty_range = (0, 3)
+        iterations = options["iterations"]
+
+        self.stdout.write(f"{'rows':>10} {'index µs/op':>14} {'legacy µs/op':>14}")
+
+        for size in options["sizes"]:
+            index = build_synthetic_index(size)
+
+            # Pool index selection
+            start = time.perf_counter()
+            for _ in range(iterations):
+                index.choose(models, difficulty_range)
+            index_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+            # Legacy: gather every eligible row, then pick one (fewer rounds — it is slow)
+            legacy_rounds = max(1, iterations // 20)
+            start = time.perf_counter()
+            for _ in range(legacy_rounds):
+                eligible = []
+                for bucket in index.eligible_buckets(models, difficulty_range):
+                    eligible += list(bucket)
+                random.choice(eligible)
+            legacy_us = (time.perf_counter() - start) / legacy_rounds * 1_000_000
+
+            self.stdout.write(f"{size:>10} {index_us:>14.2f} {legacy_us:>14.2f}")
+
+        self.stdout.write(self.style.SUCCESS("Benchmark completed."))
@@ -0,0 +1,283 @@
+"""
+FILE: apps/ceeni_captcha/management/commands/benchmark_captcha_suite.py
+
+PURPOSE:
+    End-to-end benchmark and query budget for the captcha subsystem.
+
+    For each pool size, synthetic captcha rows are spread evenly across the six
+    stored captcha models (bulk-inserted inside a transaction that is rolled
+    back at the end, so nothing is left behind), then these scenarios are
+    measured for wall time, queries and peak allocated memory per operation:
+
+        index_build        rebuilding the process-level pool index (cold start)
+        selection          CaptchaFieldMixin() on an unbound form
+        validation_slug    is_valid() on a correct slug-mode submission
+        validation_token   is_valid() on a correct token-mode submission
+        render_cold        reload view with an empty fragment pool (renders a batch)
+        render_pooled      reload view served from the fragment pool
+
+    Results are printed as a table and can be written as JSON (--output).
+    With --compare, the run fails when any scenario regresses a stored JSON
+    baseline: time or memory beyond --threshold (default 25%), or any increase
+    in queries per operation.
+
+USAGE:
+    python manage.py benchmark_captcha_suite --output captcha_bench.json
+    python manage.py benchmark_captcha_suite --compare captcha_bench.json --threshold 0.3
+    python manage.py benchmark_captcha_suite --sizes 1000 --iterations 50
+"""
+
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+
+import django
+from django.contrib.sessions.backends.signed_cookies import SessionStore
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from apps.ceeni_captcha.forms.captcha_mixin import CaptchaFieldMixin
+from apps.ceeni_captcha.utils.fragment_pool import captcha_fragment_pool
+from apps.ceeni_captcha.utils.pool_index import INDEXED_CAPTCHA_MODELS, captcha_pool
+from apps.ceeni_captcha.views.htmx.captcha_reload import reload_captcha_partial_view
+
+# Metrics compared against a baseline, and whether they use the relative threshold
+COMPARED_METRICS = {
+    "us_per_op": True,
+    "peak_kib": True,
+    "queries_per_op": False,  # Any increase is a regression
+}
+
+
+class RollbackBenchmark(Exception):
+    """Raised to roll back the synthetic rows once a size has been measured."""
+
+
+def seed_synthetic_pool(size, batch_size=2_000):
+    """
+    Bulk-inserts `size` active captchas spread across the stored models.
+    Returns one (model, slug, correct_answer) sample per model.
+    """
+    per_model = max(1, size // len(INDEXED_CAPTCHA_MODELS))
+    samples = []
+
+    for model in INDEXED_CAPTCHA_MODELS:
+        name = model._meta.model_name
+        model.objects.bulk_create(
+            (
+                model(
+                    question_text=f"Benchmark {name} question {i}?",
+                    correct_answer=f"answer-{i}",
+                    slug=f"bench-{name}-{i}",
+                    difficulty=i % 4,
+                    tags="benchmark",
+                )
+                for i in range(per_model)
+            ),
+            batch_size=batch_size,
+        )
+        samples.append((model, f"bench-{name}-0", "answer-0"))
+
+    return samples
+
+
+def measure(operation, iterations, setup=None):
+    """
+    Runs `operation(state)` `iterations` times (state from `setup()`), then once
+    more under tracemalloc. Returns µs/op, queries/op and peak KiB of one op.
+    """
+    states = [setup() if setup else None for _ in range(iterations + 1)]
+
+    with CaptureQueriesContext(connection) as queries:
+        start = time.perf_counter()
+        for state in states[:iterations]:
+            operation(state)
+        elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        operation(states[-1])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "us_per_op": round(elapsed / iterations * 1_000_000, 2),
+        "queries_per_op": round(len(queries) / iterations, 2),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmarks captcha selection, validation and rendering at several pool sizes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000],
+            help="Synthetic pool sizes (rows across all captcha models).",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=200,
+            help="Operations per scenario and size.",
+        )
+        parser.add_argument(
+            "--output", type=Path,
+            help="Write results as JSON to this path.",
+        )
+        parser.add_argument(
+            "--compare", type=Path,
+            help="Baseline JSON to compare against; fails on regressions.",
+        )
+        parser.add_argument(
+            "--threshold", type=float, default=0.25,
+            help="Allowed relative slowdown / memory growth before failing (0.25 = 25%%).",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        results = {}
+
+        # Telemetry would only buffer counters for rows that are about to vanish
+        with override_settings(CEENI_CAPTCHA_TELEMETRY=False):
+            for size in options["sizes"]:
+                results[str(size)] = self.run_size(size, iterations)
+
+        # Drop snapshots built from the rolled-back rows
+        captcha_pool.invalidate()
+        captcha_fragment_pool.clear()
+
+        report = {
+            "meta": {
+                "iterations": iterations,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "database": connection.vendor,
+            },
+            "results": results,
+        }
+
+        self.write_table(results)
+
+        if options["output"]:
+            options["output"].write_text(json.dumps(report, indent=2) + "\n")
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options["compare"]:
+            self.compare(report, options["compare"], options["threshold"])
+
+    # =============================
+    # Scenarios
+    # =============================
+
+    def run_size(self, size, iterations):
+        self.stdout.write(f"Seeding {size} synthetic captchas...")
+        scenarios = {}
+
+        try:
+            with transaction.atomic():
+                samples = seed_synthetic_pool(size)
+                model, slug, answer = samples[0]
+                factory = RequestFactory()
+
+                def request():
+                    request = factory.get("/captcha/reload/")
+                    request.session = SessionStore()
+                    return request
+
+                def cold_index(_):
+                    captcha_pool.invalidate()
+                    captcha_pool.get()
+
+                scenarios["index_build"] = measure(cold_index, max(1, iterations // 50))
+
+                def select(_):
+                    CaptchaFieldMixin(request=request(), token_mode=False)
+
+                scenarios["selection"] = measure(select, iterations)
+
+                def validate_slug(_):
+                    form = CaptchaFieldMixin(
+                        {"captcha_slug": slug, "captcha_response": answer}, token_mode=False
+                    )
+                    form.is_valid()
+
+                scenarios["validation_slug"] = measure(validate_slug, iterations)
+
+                def issue_token_form():
+                    form = CaptchaFieldMixin(model_whitelist=[model], token_mode=True)
+                    return form.fields["captcha_token"].initial, form._current_captcha.correct_answer
+
+                def validate_token(state):
+                    token, correct_answer = state
+                    form = CaptchaFieldMixin(
+                        {"captcha_token": token, "captcha_response": correct_answer}, token_mode=True
+                    )
+                    form.is_valid()
+
+                scenarios["validation_token"] = measure(validate_token, iterations, setup=issue_token_form)
+
+                with override_settings(CEENI_CAPTCHA_TOKEN_MODE=False):
+                    def render_cold(_):
+                        captcha_fragment_pool.clear()
+                        reload_captcha_partial_view(request())
+
+                    scenarios["render_cold"] = measure(render_cold, max(1, iterations // 10))
+
+                    captcha_fragment_pool.clear()
+
+                    def render_pooled(_):
+                        reload_captcha_partial_view(request())
+
+                    scenarios["render_pooled"] = measure(render_pooled, iterations)
+
+                raise RollbackBenchmark
+        except RollbackBenchmark:
+            pass
+
+        captcha_pool.invalidate()
+        captcha_fragment_pool.clear()
+        return scenarios
+
+    # =============================
+    # Reporting
+    # =============================
+
+    def write_table(self, results):
+        self.stdout.write(f"{'rows':>8} {'scenario':<18} {'µs/op':>12} {'queries/op':>11} {'peak KiB':>10}")
+        for size, scenarios in results.items():
+            for name, metrics in scenarios.items():
+                self.stdout.write(
+                    f"{size:>8} {name:<18} {metrics['us_per_op']:>12.2f} "
+                    f"{metrics['queries_per_op']:>11.2f} {metrics['peak_kib']:>10.1f}"
+                )
+
+    def compare(self, report, baseline_path, threshold):
+        try:
+            baseline = json.loads(baseline_path.read_text())
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read baseline {baseline_path}: {e}")
+
+        regressions = []
+        for size, scenarios in report["results"].items():
+            for name, metrics in scenarios.items():
+                previous = baseline.get("results", {}).get(size, {}).get(name)
+                if not previous:
+                    continue
+                for metric, relative in COMPARED_METRICS.items():
+                    old, new = previous.get(metric), metrics[metric]
+                    if old is None:
+                        continue
+                    limit = old * (1 + threshold) if relative else old
+                    if new > limit:
+                        regressions.append(f"{size} rows / {name} / {metric}: {old} → {new}")
+
+        if regressions:
+            raise CommandError(
+                "Captcha benchmark regressed against the baseline:\n  " + "\n  ".join(regressions)
+            )
+
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path} (threshold {threshold:.0%})."))
@@ -0,0 +1,110 @@
+"""
+FILE: apps/ceeni_captcha/management/commands/calibrate_captcha_difficulty.py
+
+PURPOSE:
+    Recomputes each captcha's empirical difficulty from the attempt telemetry
+    collected by `apps/ceeni_captcha/utils/telemetry.py`.
+
+    For every captcha with at least --min-attempts answers:
+        solve_rate            = solve_count / attempt_count
+        calibrated_difficulty = round(5 × (0.8 × miss rate + 0.2 × time factor))
+
+    where the time factor is the average time-to-answer of timed solves
+    relative to --slow-seconds (capped at 1). Captchas without timed solves are
+    scored on miss rate alone. The hand-set `difficulty` is left untouched;
+    selection prefers `calibrated_difficulty` once it is set.
+
+    Rows are updated with bulk_update in one transaction, and the captcha pool
+    index is rebuilt afterwards. A dry run writes nothing, not even this
+    process's buffered telemetry.
+
+USAGE:
+    python manage.py calibrate_captcha_difficulty
+    python manage.py calibrate_captcha_difficulty --min-attempts 50 --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.ceeni_captcha.utils.pool_index import INDEXED_CAPTCHA_MODELS, captcha_pool
+from apps.ceeni_captcha.utils.telemetry import captcha_telemetry
+
+MISS_RATE_WEIGHT = 0.8
+TIME_WEIGHT = 0.2
+
+
+def empirical_difficulty(attempts, solves, timed_solves, solve_ms_total, slow_seconds):
+    """
+    Returns (solve_rate, difficulty 0-5) for one captcha's counters.
+    """
+    solve_rate = solves / attempts
+    miss_rate = 1 - solve_rate
+
+    if timed_solves:
+        average_seconds = solve_ms_total / timed_solves / 1000
+        time_factor = min(average_seconds / slow_seconds, 1.0)
+        score = MISS_RATE_WEIGHT * miss_rate + TIME_WEIGHT * time_factor
+    else:
+        score = miss_rate
+
+    return solve_rate, round(score * 5)
+
+
+class Command(BaseCommand):
+    help = "Recomputes captcha difficulty from recorded solve rates and time-to-answer."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--min-attempts", type=int, default=30,
+            help="Attempts needed before a captcha is calibrated.",
+        )
+        parser.add_argument(
+            "--slow-seconds", type=float, default=60.0,
+            help="Average time-to-answer treated as maximally slow.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report changes without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        # Include whatever this process has buffered (normally nothing)
+        if not options["dry_run"]:
+            captcha_telemetry.flush()
+
+        total_changed = 0
+
+        with transaction.atomic():
+            for model in INDEXED_CAPTCHA_MODELS:
+                captchas = model.objects.filter(attempt_count__gte=options["min_attempts"]).only(
+                    "pk", "attempt_count", "solve_count", "timed_solve_count",
+                    "solve_time_ms_total", "solve_rate", "calibrated_difficulty",
+                )
+
+                changed = []
+                for captcha in captchas:
+                    solve_rate, difficulty = empirical_difficulty(
+                        captcha.attempt_count,
+                        captcha.solve_count,
+                        captcha.timed_solve_count,
+                        captcha.solve_time_ms_total,
+                        options["slow_seconds"],
+                    )
+                    if captcha.calibrated_difficulty != difficulty or captcha.solve_rate != solve_rate:
+                        captcha.solve_rate = solve_rate
+                        captcha.calibrated_difficulty = difficulty
+                        changed.append(captcha)
+
+                if changed and not options["dry_run"]:
+                    model.objects.bulk_update(
+                        changed, ["solve_rate", "calibrated_difficulty"], batch_size=500
+                    )
+
+                total_changed += len(changed)
+                self.stdout.write(f"{model._meta.verbose_name}: {len(changed)} recalibrated.")
+
+            if total_changed and not options["dry_run"]:
+                transaction.on_commit(captcha_pool.invalidate)
+
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(f"{prefix}Calibration completed: {total_changed} captchas updated."))
@@ -0,0 +1,117 @@
+"""
+FILE: apps/ceeni_captcha/management/commands/import_all_captcha.py
+
+PURPOSE:
+    Imports every captcha CSV in one run. Each file is handled by the same bulk
+    engine as its individual command (one transaction per file). Files are
+    imported one after another by default; with --workers > 1 they run
+    concurrently on a small thread pool, each thread with its own database
+    connection. Per-file timing and change counts are printed as files
+    finish, followed by the total wall-clock time.
+
+    Parallel imports are opt-in: SQLite allows a single writer ("database is
+    locked"), and every file reconciles the global slug registry, so two
+    files claiming the same slug at once fail one of them (its transaction
+    is rolled back; re-run it sequentially).
+
+USAGE:
+    python manage.py import_all_captcha
+    python manage.py import_all_captcha --dry-run -v 2
+    python manage.py import_all_captcha --workers 4
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import import_module
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.ceeni_captcha.utils.bulk_import import import_captcha_file, write_import_report
+
+# Individual captcha import commands; each supplies `model` and `file_name`
+CAPTCHA_IMPORT_COMMANDS = (
+    "import_civic_captcha",
+    "import_jumbled_county_captcha",
+    "import_jumbled_constituency_captcha",
+    "import_jumbled_ward_captcha",
+    "import_jumbled_leader_captcha",
+    "import_political_leader_captcha",
+)
+
+
+class Command(BaseCommand):
+    help = "Imports all captcha CSV files, one transaction per file (optionally in parallel)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report what would change without writing to the database.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Rows per bulk_create / bulk_update statement.",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=1,
+            help="Files imported in parallel (default: 1, sequential).",
+        )
+
+    def handle(self, *args, **options):
+        if options["workers"] > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING(
+                "⚠️ SQLite allows one writer at a time; parallel imports may fail with 'database is locked'."
+            ))
+
+        commands = [
+            import_module(f"apps.ceeni_captcha.management.commands.{name}").Command()
+            for name in CAPTCHA_IMPORT_COMMANDS
+        ]
+
+        def run(command):
+            return import_captcha_file(
+                command.model,
+                command.get_file_path(),
+                dry_run=options["dry_run"],
+                batch_size=options["batch_size"],
+            )
+
+        def run_in_worker(command):
+            try:
+                return run(command)
+            finally:
+                # Worker threads open their own connections; don't leak them
+                connection.close()
+
+        start = time.perf_counter()
+        failures = []
+
+        def collect(command, result):
+            try:
+                report = result()
+            except Exception as e:
+                failures.append(command.file_name)
+                self.stderr.write(self.style.ERROR(f"❌ {command.file_name}: {e}"))
+                return
+            write_import_report(self, report, verbosity=options["verbosity"])
+
+        if options["workers"] <= 1:
+            # Sequential, on this thread's connection
+            for command in commands:
+                collect(command, lambda: run(command))
+        else:
+            with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+                futures = {executor.submit(run_in_worker, command): command for command in commands}
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+
+        elapsed = time.perf_counter() - start
+        if failures:
+            raise CommandError(
+                f"{len(failures)} of {len(commands)} captcha files failed "
+                f"(others were committed): {', '.join(failures)}"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ Imported {len(commands)} captcha files in {elapsed * 1000:.0f} ms.")
+        )
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+CAPTCHA_MODEL_NAMES = [
+    'civiccaptcha',
+    'jumbledleadercaptcha',
+    'jumbledwardcaptcha',
+    'jumbledconstituencycaptcha',
+    'jumbledcountycaptcha',
+    'politicalpartyleadercaptcha',
+]
+
+
+def backfill_slug_registry(apps, schema_editor):
+    """
+    Registers the slugs of captcha rows that predate the registry.
+    Cross-model slug clashes are skipped; re-saving those rows surfaces them.
+    """
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+    CaptchaSlugRegistry = apps.get_model('ceeni_captcha', 'CaptchaSlugRegistry')
+
+    for model_name in CAPTCHA_MODEL_NAMES:
+        model = apps.get_model('ceeni_captcha', model_name)
+        content_type, _ = ContentType.objects.get_or_create(app_label='ceeni_captcha', model=model_name)
+        CaptchaSlugRegistry.objects.bulk_create(
+            [
+                CaptchaSlugRegistry(slug=slug, content_type=content_type, object_id=pk)
+                for pk, slug in model.objects.values_list('pk', 'slug').iterator()
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ceeni_captcha', '0003_politicalpartyleadercaptcha'),
+        ('contenttypes', '0002_remove_content_type_name'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaptchaSlugRegistry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(help_text='Captcha slug, unique across all captcha models', max_length=100, unique=True)),
+                ('object_id', models.PositiveBigIntegerField(help_text='Primary key of the captcha row')),
+                ('content_type', models.ForeignKey(help_text='Concrete captcha model that owns this slug', on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype')),
+            ],
+            options={
+                'verbose_name': 'Captcha Slug',
+                'verbose_name_plural': 'Captcha Slug Registry',
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(backfill_slug_registry, migrations.RunPython.noop),
+    ]
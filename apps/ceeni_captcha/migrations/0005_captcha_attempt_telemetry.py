@@ -0,0 +1,193 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ceeni_captcha', '0004_captchaslugregistry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='attempt_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='calibrated_difficulty',
+            field=models.PositiveSmallIntegerField(blank=True, editable=False, help_text='Empirical difficulty (0-5); overrides `difficulty` for selection when set', null=True),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers submitted for this captcha'),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='solve_rate',
+            field=models.FloatField(blank=True, editable=False, help_text='Empirical share of attempts answered correctly', null=True),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='solve_time_ms_total',
+            field=models.PositiveBigIntegerField(default=0, editable=False, help_text='Sum of time-to-answer (ms) over timed correct answers'),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='timed_solve_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Correct answers with a known time-to-answer'),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:01
+
+from django.db import migrations, models
+
+CAPTCHA_MODEL_NAMES = [
+    'civiccaptcha',
+    'jumbledleadercaptcha',
+    'jumbledwardcaptcha',
+    'jumbledconstituencycaptcha',
+    'jumbledcountycaptcha',
+    'politicalpartyleadercaptcha',
+]
+
+
+def backfill_captcha_tags(apps, schema_editor):
+    """
+    Creates tags from the existing comma-separated `tags` strings and links them.
+    """
+    CaptchaTag = apps.get_model('ceeni_captcha', 'CaptchaTag')
+
+    rows = {}
+    for model_name in CAPTCHA_MODEL_NAMES:
+        model = apps.get_model('ceeni_captcha', model_name)
+        rows[model_name] = {
+            pk: {name.strip().lower()[:50] for name in (tags or '').split(',') if name.strip()}
+            for pk, tags in model.objects.values_list('pk', 'tags').iterator()
+        }
+
+    all_names = {name for by_pk in rows.values() for names in by_pk.values() for name in names}
+    CaptchaTag.objects.bulk_create([CaptchaTag(name=name) for name in all_names], ignore_conflicts=True)
+    tag_ids = dict(CaptchaTag.objects.values_list('name', 'pk'))
+
+    for model_name, by_pk in rows.items():
+        through = apps.get_model('ceeni_captcha', model_name).normalized_tags.through
+        through.objects.bulk_create(
+            [
+                through(**{f'{model_name}_id': pk, 'captchatag_id': tag_ids[name]})
+                for pk, names in by_pk.items()
+                for name in names
+            ],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ceeni_captcha', '0005_captcha_attempt_telemetry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CaptchaTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Normalized (lower-case) tag name', max_length=50, unique=True)),
+            ],
+            options={
+                'verbose_name': 'Captcha Tag',
+                'verbose_name_plural': 'Captcha Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='civiccaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.AddField(
+            model_name='jumbledconstituencycaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.AddField(
+            model_name='jumbledcountycaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.AddField(
+            model_name='jumbledleadercaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.AddField(
+            model_name='jumbledwardcaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.AddField(
+            model_name='politicalpartyleadercaptcha',
+            name='normalized_tags',
+            field=models.ManyToManyField(blank=True, editable=False, help_text='Indexed tag links, kept in sync with `tags`', related_name='%(class)s_captchas', to='ceeni_captcha.captchatag'),
+        ),
+        migrations.RunPython(backfill_captcha_tags, migrations.RunPython.noop),
+    ]
@@ -18,6 +18,8 @@ from .jumbled_wards import JumbledWardCaptcha
 from .jumbled_constituencies import JumbledConstituencyCaptcha
 from .jumbled_counties import JumbledCountyCaptcha
 from .political_leaders import PoliticalPartyLeaderCaptcha
+from .slug_registry import CaptchaSlugRegistry
+from .tags import CaptchaTag
 
 __all__ = [
     "CivicCaptcha",
@@ -26,6 +28,8 @@ __all__ = [
     "JumbledConstituencyCaptcha",
     "JumbledCountyCaptcha",
     "PoliticalPartyLeaderCaptcha",
+    "CaptchaSlugRegistry",
+    "CaptchaTag",
 ]
 
 
@@ -1,8 +1,12 @@
 # apps/ceeni_captcha/models/captcha_base.py
 
-from django.db import models
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 from django.utils.text import slugify
 
+from .slug_registry import CaptchaSlugRegistry
+from .tags import CaptchaTag, parse_tags
+
 
 class CaptchaBase(models.Model):
     """
@@ -34,6 +38,13 @@ class CaptchaBase(models.Model):
         blank=True,
         help_text="Comma-separated keywords like 'elections,leadership,constitution'"
     )
+    normalized_tags = models.ManyToManyField(
+        CaptchaTag,
+        blank=True,
+        editable=False,
+        related_name="%(class)s_captchas",
+        help_text="Indexed tag links, kept in sync with `tags`"
+    )
 
     slug = models.SlugField(
         max_length=100,  # explicitly set length to a larger value
@@ -46,6 +57,40 @@ class CaptchaBase(models.Model):
         help_text="Only active captchas will be used during registration or civic flow"
     )
 
+    # Attempt telemetry, flushed in batches by `utils/telemetry.py`
+    attempt_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Answers submitted for this captcha"
+    )
+    solve_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Correct answers submitted for this captcha"
+    )
+    timed_solve_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Correct answers with a known time-to-answer"
+    )
+    solve_time_ms_total = models.PositiveBigIntegerField(
+        default=0,
+        editable=False,
+        help_text="Sum of time-to-answer (ms) over timed correct answers"
+    )
+
+    # Set by `calibrate_captcha_difficulty` once enough attempts are recorded
+    solve_rate = models.FloatField(
+        null=True, blank=True,
+        editable=False,
+        help_text="Empirical share of attempts answered correctly"
+    )
+    calibrated_difficulty = models.PositiveSmallIntegerField(
+        null=True, blank=True,
+        editable=False,
+        help_text="Empirical difficulty (0-5); overrides `difficulty` for selection when set"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -60,11 +105,57 @@ class CaptchaBase(models.Model):
         # Auto-generate slug from question (if not already set)
         if not self.slug:
             self.slug = slugify(self.question_text[:80])
-        super().save(*args, **kwargs)
+
+        # Partial saves (e.g. counters) that write neither slug nor tags
+        # leave the registry and tag links as they are
+        update_fields = kwargs.get("update_fields")
+        sync_slug = update_fields is None or "slug" in update_fields
+        sync_tags = update_fields is None or "tags" in update_fields
+        if not (sync_slug or sync_tags):
+            super().save(*args, **kwargs)
+            return
+
+        # Row and registry entry succeed or fail together, so a slug owned
+        # by another captcha model rolls the whole save back
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if sync_slug:
+                CaptchaSlugRegistry.register(self)
+            if sync_tags:
+                self.sync_normalized_tags()
+
+    def validate_unique(self, exclude=None):
+        """
+        Extends per-table uniqueness with the global slug registry so admin
+        forms report cross-model slug clashes instead of failing on save.
+        """
+        super().validate_unique(exclude=exclude)
+
+        slug = self.slug or slugify(self.question_text[:80])
+        owner = CaptchaSlugRegistry.slug_owner(slug)
+        if owner and owner != (type(self), self.pk):
+            owner_model, _ = owner
+            raise ValidationError({
+                "question_text": (
+                    f"A {owner_model._meta.verbose_name} already uses this question's slug ({slug})."
+                )
+            })
 
     def __str__(self):
         return f"{self.question_text[:60]}..."
 
+    def sync_normalized_tags(self):
+        """Points `normalized_tags` at the tags listed in the `tags` string."""
+        tag_ids = CaptchaTag.ensure(parse_tags(self.tags))
+        self.normalized_tags.set(tag_ids.values())
+
+    @property
+    def effective_difficulty(self):
+        """Calibrated difficulty when available, otherwise the hand-set one."""
+        if self.calibrated_difficulty is not None:
+            return self.calibrated_difficulty
+        return self.difficulty
+
     def get_model_label(self):
         """
         Returns a short, human-friendly name for the captcha source model.
@@ -0,0 +1,167 @@
+# apps/ceeni_captcha/models/slug_registry.py
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.db.models import Exists, OuterRef, Value
+
+
+class CaptchaSlugRegistry(models.Model):
+    """
+    Global directory of captcha slugs across every captcha model.
+
+    Each row maps one slug to the concrete captcha model and primary key that
+    owns it, so validation can resolve a submitted slug with a single indexed
+    lookup. The unique constraint on `slug` also makes slugs unique across all
+    captcha tables, not just within one.
+
+    Kept in sync by `CaptchaBase.save()` and a post_delete signal, and
+    backfilled in bulk by `BaseImportCaptchaCommand`.
+    """
+
+    slug = models.SlugField(
+        max_length=100,
+        unique=True,
+        help_text="Captcha slug, unique across all captcha models"
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        help_text="Concrete captcha model that owns this slug"
+    )
+    object_id = models.PositiveBigIntegerField(
+        help_text="Primary key of the captcha row"
+    )
+
+    class Meta:
+        unique_together = ("content_type", "object_id")
+        verbose_name = "Captcha Slug"
+        verbose_name_plural = "Captcha Slug Registry"
+
+    def __str__(self):
+        return f"{self.slug} → {self.content_type.model} #{self.object_id}"
+
+    # =============================
+    # Registry Utilities
+    # =============================
+
+    @classmethod
+    def register(cls, captcha):
+        """
+        Records (or moves) the slug of a saved captcha instance.
+        Raises IntegrityError if another captcha already owns the slug.
+        """
+        content_type = ContentType.objects.get_for_model(captcha)
+        cls.objects.update_or_create(
+            content_type=content_type,
+            object_id=captcha.pk,
+            defaults={"slug": captcha.slug},
+        )
+
+    @classmethod
+    def unregister(cls, captcha):
+        """Removes the registry entry of a deleted captcha."""
+        content_type = ContentType.objects.get_for_model(captcha)
+        cls.objects.filter(content_type=content_type, object_id=captcha.pk).delete()
+
+    @classmethod
+    def slug_owner(cls, slug):
+        """
+        Returns (model_class, object_id) for a slug, or None if unknown.
+        Costs one indexed query; the ContentType lookup is served from Django's cache.
+        """
+        entry = cls.objects.filter(slug=slug).values_list("content_type_id", "object_id").first()
+        if entry is None:
+            return None
+        content_type_id, object_id = entry
+        return ContentType.objects.get_for_id(content_type_id).model_class(), object_id
+
+    @classmethod
+    def slug_owners(cls, slugs):
+        """
+        Returns {slug: (model_class, object_id)} for the registered slugs
+        among `slugs`, in one query.
+        """
+        return {
+            slug: (ContentType.objects.get_for_id(content_type_id).model_class(), object_id)
+            for slug, content_type_id, object_id in (
+                cls.objects.filter(slug__in=slugs).values_list("slug", "content_type_id", "object_id")
+            )
+        }
+
+    @classmethod
+    def claimed_slugs(cls, model, slugs):
+        """Returns the slugs among `slugs` already owned by another captcha model (one query)."""
+        return set(
+            cls.objects.filter(slug__in=slugs)
+            .exclude(content_type=ContentType.objects.get_for_model(model))
+            .values_list("slug", flat=True)
+        )
+
+    @classmethod
+    def resolve_active(cls, slug, models):
+        """
+        Returns (model_class, object_id, correct_answer) for the active captcha
+        among `models` that owns `slug`, or None.
+
+        Costs one query (a UNION over the captcha tables). Each row must match
+        its own registry entry, so a row that merely repeats another model's
+        slug (e.g. left behind by an older import) is never returned.
+        """
+        content_types = ContentType.objects.get_for_models(*models)
+        querysets = [
+            model.objects.filter(slug=slug, active=True)
+            .filter(Exists(cls.objects.filter(slug=slug, content_type=content_type, object_id=OuterRef("pk"))))
+            .order_by()
+            .values_list(Value(content_type.pk), "pk", "correct_answer")
+            for model, content_type in content_types.items()
+        ]
+        if not querysets:
+            return None
+
+        rows = list(querysets[0].union(*querysets[1:])[:1])
+        if not rows:
+            return None
+        content_type_id, object_id, correct_answer = rows[0]
+        return ContentType.objects.get_for_id(content_type_id).model_class(), object_id, correct_answer
+
+    @classmethod
+    def sync_model(cls, model):
+        """
+        Bulk-reconciles the registry with every row of one captcha model.
+
+        Returns a dict of counts: created, updated, removed and conflicts
+        (slugs already owned by a different captcha model).
+        """
+        content_type = ContentType.objects.get_for_model(model)
+        rows = dict(model.objects.order_by().values_list("pk", "slug"))
+        entries = {
+            entry.object_id: entry
+            for entry in cls.objects.filter(content_type=content_type)
+        }
+
+        to_create, to_update = [], []
+        for pk, slug in rows.items():
+            entry = entries.get(pk)
+            if entry is None:
+                to_create.append(cls(slug=slug, content_type=content_type, object_id=pk))
+            elif entry.slug != slug:
+                entry.slug = slug
+                to_update.append(entry)
+
+        # Slugs already held by another model are left alone and reported
+        claimed = cls.claimed_slugs(model, [entry.slug for entry in to_create + to_update])
+        to_create = [entry for entry in to_create if entry.slug not in claimed]
+        to_update = [entry for entry in to_update if entry.slug not in claimed]
+
+        stale_ids = [pk for pk in entries if pk not in rows]
+
+        cls.objects.bulk_create(to_create, batch_size=500)
+        cls.objects.bulk_update(to_update, ["slug"], batch_size=500)
+        removed, _ = cls.objects.filter(content_type=content_type, object_id__in=stale_ids).delete()
+
+        return {
+            "created": len(to_create),
+            "updated": len(to_update),
+            "removed": removed,
+            "conflicts": len(claimed),
+        }
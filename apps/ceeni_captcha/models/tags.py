@@ -0,0 +1,95 @@
+# apps/ceeni_captcha/models/tags.py
+
+from django.db import models
+
+
+def parse_tags(value):
+    """
+    Splits a comma-separated tags string into normalized tag names:
+    trimmed, lower-cased, de-duplicated, order preserved.
+    """
+    names = []
+    for raw in (value or "").split(","):
+        name = raw.strip().lower()[:50]
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class CaptchaTag(models.Model):
+    """
+    Shared topic tag for every captcha model (e.g. 'elections', 'ward').
+
+    Captchas link to tags through their `normalized_tags` many-to-many field,
+    whose through tables are indexed on both sides. The comma-separated
+    `CaptchaBase.tags` string stays the editable source; the links are kept in
+    sync by `CaptchaBase.save()` and rebuilt in bulk by `sync_model()`.
+    """
+
+    name = models.CharField(
+        max_length=50,
+        unique=True,
+        help_text="Normalized (lower-case) tag name"
+    )
+
+    class Meta:
+        ordering = ["name"]
+        verbose_name = "Captcha Tag"
+        verbose_name_plural = "Captcha Tags"
+
+    def __str__(self):
+        return self.name
+
+    # =============================
+    # Tag Utilities
+    # =============================
+
+    @classmethod
+    def ensure(cls, names):
+        """
+        Returns {name: pk} for the given tag names, creating missing tags in bulk.
+        """
+        names = set(names)
+        if not names:
+            return {}
+        cls.objects.bulk_create([cls(name=name) for name in names], ignore_conflicts=True)
+        return dict(cls.objects.filter(name__in=names).values_list("name", "pk"))
+
+    @classmethod
+    def sync_model(cls, model):
+        """
+        Bulk-reconciles the tag links of every row of one captcha model with
+        its `tags` string. Returns a dict of counts: linked and unlinked.
+        """
+        field = model._meta.get_field("normalized_tags")
+        through = field.remote_field.through
+        source, target = f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}_id"
+
+        wanted_names = {
+            pk: parse_tags(tags)
+            for pk, tags in model.objects.order_by().values_list("pk", "tags")
+        }
+        tag_ids = cls.ensure(name for names in wanted_names.values() for name in names)
+
+        wanted = {
+            (pk, tag_ids[name])
+            for pk, names in wanted_names.items()
+            for name in names
+        }
+        existing = {
+            (pk, tag_id): link_id
+            for link_id, pk, tag_id in through.objects.values_list("pk", source, target)
+        }
+
+        to_link = wanted - existing.keys()
+        to_unlink = [link_id for key, link_id in existing.items() if key not in wanted]
+
+        through.objects.bulk_create(
+            [through(**{source: pk, target: tag_id}) for pk, tag_id in to_link],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+        for start in range(0, len(to_unlink), 500):
+            through.objects.filter(pk__in=to_unlink[start:start + 500]).delete()
+
+        return {"linked": len(to_link), "unlinked": len(to_unlink)}
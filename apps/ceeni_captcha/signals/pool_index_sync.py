@@ -0,0 +1,31 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Keep the process-level captcha pool index in sync with the database
+# ------------------------------------------------------------------------------
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from apps.ceeni_captcha.utils.pool_index import INDEXED_CAPTCHA_MODELS, captcha_pool
+from apps.user_profiles.models import County, Constituency, Ward
+
+
+def invalidate_captcha_pool(sender, **kwargs):
+    """
+    Marks the captcha pool index stale whenever a captcha or location row
+    (the source of generated captchas) is saved or deleted.
+    The rebuild itself happens lazily on the next challenge selection,
+    once the surrounding transaction has committed. Other workers only see
+    the invalidation through a shared cache (see `ProcessCache`).
+    """
+    transaction.on_commit(captcha_pool.invalidate)
+
+
+# Captcha models share an abstract base, so connect each concrete model explicitly
+for captcha_model in INDEXED_CAPTCHA_MODELS:
+    post_save.connect(invalidate_captcha_pool, sender=captcha_model)
+    post_delete.connect(invalidate_captcha_pool, sender=captcha_model)
+
+# Generated location captchas are derived from the location tables
+for location_model in (County, Constituency, Ward):
+    post_save.connect(invalidate_captcha_pool, sender=location_model)
+    post_delete.connect(invalidate_captcha_pool, sender=location_model)
@@ -0,0 +1,20 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Remove captcha slugs from the global registry when rows are deleted
+# ------------------------------------------------------------------------------
+
+from django.db.models.signals import post_delete
+
+from apps.ceeni_captcha.models import CaptchaSlugRegistry
+from apps.ceeni_captcha.utils.pool_index import INDEXED_CAPTCHA_MODELS
+
+
+def unregister_captcha_slug(sender, instance, **kwargs):
+    """
+    Frees the slug of a deleted captcha (saves are handled in `CaptchaBase.save()`).
+    Also fires for queryset deletes, which bypass `Model.delete()`.
+    """
+    CaptchaSlugRegistry.unregister(instance)
+
+
+for captcha_model in INDEXED_CAPTCHA_MODELS:
+    post_delete.connect(unregister_captcha_slug, sender=captcha_model)
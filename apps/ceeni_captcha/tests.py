@@ -1,3 +1,725 @@
-from django.test import TestCase
+import importlib
+import itertools
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core import signing
+from django.core.cache import cache
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import IntegrityError
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.ceeni_captcha.models import CaptchaSlugRegistry, CaptchaTag, CivicCaptcha, JumbledCountyCaptcha
+from apps.ceeni_captcha.models.tags import parse_tags
+from apps.ceeni_captcha.checks import check_token_mode_cache
+from apps.ceeni_captcha.forms.captcha_mixin import CaptchaFieldMixin
+from apps.ceeni_captcha.utils.bulk_import import import_captcha_file
+from apps.ceeni_captcha.utils.challenge_tokens import TOKEN_SALT, issue_token, verify_token
+from apps.ceeni_captcha.utils.fragment_pool import CaptchaFragmentPool
+from apps.ceeni_captcha.utils.location_captcha import GeneratedCountyCaptcha, GeneratedLocationCaptcha
+from apps.ceeni_captcha.utils.pool_index import build_pool_index, captcha_pool
+from apps.ceeni_captcha.utils.telemetry import CaptchaTelemetry
+from apps.ceeni_captcha.views.htmx.captcha_reload import reload_captcha_partial_view
+from apps.common.utils.process_cache import ProcessCache
+from apps.user_profiles.models import County
+
+
+class PoolIndexTests(TestCase):
+    """
+    The pool index groups the active captchas by (model, difficulty), picks
+    from them without queries and is rebuilt after captcha edits.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.easy = CivicCaptcha.objects.create(
+            question_text="How many counties does Kenya have?", correct_answer="47",
+            difficulty=1, tags="devolution",
+        )
+        cls.hard = CivicCaptcha.objects.create(
+            question_text="Which article of the constitution covers devolution?", correct_answer="6",
+            difficulty=3, tags="constitution",
+        )
+        cls.inactive = CivicCaptcha.objects.create(
+            question_text="Retired question?", correct_answer="no", active=False,
+        )
+
+    def setUp(self):
+        captcha_pool.invalidate()
+
+    def build(self):
+        return build_pool_index(models=(CivicCaptcha,), sources=())
+
+    def test_build_indexes_active_rows(self):
+        # rows + tags
+        with self.assertNumQueries(2):
+            index = self.build()
+
+        self.assertEqual(len(index), 2)
+        self.assertEqual([choice.pk for choice in index.bucket(CivicCaptcha, 1)], [self.easy.pk])
+        self.assertEqual(index.lookup(self.hard.slug).tags, frozenset({"constitution"}))
+        self.assertIsNone(index.lookup(self.inactive.slug))
+
+    def test_calibrated_difficulty_wins(self):
+        CivicCaptcha.objects.filter(pk=self.hard.pk).update(calibrated_difficulty=1)
+
+        index = self.build()
+        self.assertEqual(len(index.bucket(CivicCaptcha, 1)), 2)
+        self.assertEqual(index.bucket(CivicCaptcha, 3), ())
+
+    def test_choose_filters_without_queries(self):
+        index = self.build()
+        rng = random.Random(7)
+
+        with self.assertNumQueries(0):
+            picks = {index.choose([CivicCaptcha], rng=rng).pk for _ in range(50)}
+            self.assertEqual(picks, {self.easy.pk, self.hard.pk})
+
+            self.assertEqual(index.choose([CivicCaptcha], difficulty_range=(2, 5), rng=rng).pk, self.hard.pk)
+            self.assertEqual(index.choose([CivicCaptcha], tags={"devolution"}, rng=rng).pk, self.easy.pk)
+            self.assertIsNone(index.choose([CivicCaptcha], difficulty_range=(4, 5), rng=rng))
+
+    def test_solve_rate_band_keeps_uncalibrated_rows(self):
+        CivicCaptcha.objects.filter(pk=self.easy.pk).update(solve_rate=0.2)
+
+        index = self.build()
+        self.assertEqual(index.choose([CivicCaptcha], solve_rate_band=(0.5, 0.9)).pk, self.hard.pk)
+
+    def test_edits_invalidate_the_pool(self):
+        self.assertIsNone(captcha_pool.get().lookup("new-question"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            CivicCaptcha.objects.create(question_text="New question", correct_answer="yes")
+
+        self.assertIsNone(captcha_pool.version)
+        self.assertIsNotNone(captcha_pool.get().lookup("new-question"))
+
+
+class DatabaseLikeCache(LocMemCache):
+    """LocMemCache with BaseCache.incr(), which re-sets the key with the default timeout (as DatabaseCache does)."""
+
+    incr = BaseCache.incr
+
+
+class ProcessCacheTests(TestCase):
+    """
+    Without a shared cache, invalidations cannot reach other workers, so
+    snapshots fall back to expiring on their own.
+    """
+
+    def make_cache(self, **kwargs):
+        self.builds = 0
+
+        def builder():
+            self.builds += 1
+            return self.builds
+
+        return ProcessCache("test_snapshot", builder, recheck_seconds=0, **kwargs)
+
+    def test_local_cache_caps_max_age(self):
+        with override_settings(CEENI_PROCESS_CACHE_LOCAL_MAX_AGE=300):
+            self.assertEqual(self.make_cache().effective_max_age, 300)
+            self.assertEqual(self.make_cache(max_age=60).effective_max_age, 60)
+
+            with mock.patch("apps.common.utils.process_cache.cache_is_shared", return_value=True):
+                self.assertIsNone(self.make_cache().effective_max_age)
+
+    def test_invalidation_survives_an_expiring_cache(self):
+        # Entries written with the default timeout expire after 60 seconds
+        expiring = DatabaseLikeCache("process-cache-expiry", {"TIMEOUT": 60})
+        self.addCleanup(expiring.clear)
+        stale, writer = self.make_cache(), self.make_cache()
+
+        with mock.patch("apps.common.utils.process_cache.cache", expiring), \
+                mock.patch("apps.common.utils.process_cache.cache_is_shared", return_value=True):
+            writer.invalidate()
+            built = stale.get()
+            writer.invalidate()
+
+            # An hour later: the version must still differ from the stale one
+            with mock.patch("time.time", return_value=time.time() + 3600):
+                writer.invalidate()
+                self.assertNotEqual(stale.get(), built)
+
+    def test_expired_snapshot_is_rebuilt(self):
+        snapshot = self.make_cache()
+        with override_settings(CEENI_PROCESS_CACHE_LOCAL_MAX_AGE=300):
+            self.assertEqual((snapshot.get(), snapshot.get()), (1, 1))
+        with override_settings(CEENI_PROCESS_CACHE_LOCAL_MAX_AGE=0):
+            self.assertEqual(snapshot.get(), 2)
+
+
+class SlugRegistryTests(TestCase):
+    """
+    Slugs are unique across every captcha model through the global registry,
+    which saves and deletes keep in sync.
+    """
+
+    def setUp(self):
+        self.captcha = CivicCaptcha.objects.create(
+            question_text="Who chairs the IEBC", correct_answer="chairperson", tags="elections",
+        )
+
+    def test_save_and_delete_sync_the_registry(self):
+        self.assertEqual(CaptchaSlugRegistry.slug_owner(self.captcha.slug), (CivicCaptcha, self.captcha.pk))
+
+        self.captcha.slug = "iebc-chair"
+        self.captcha.save()
+        self.assertIsNone(CaptchaSlugRegistry.slug_owner("who-chairs-the-iebc"))
+        self.assertEqual(CaptchaSlugRegistry.slug_owner("iebc-chair"), (CivicCaptcha, self.captcha.pk))
+
+        # post_delete signal, also fired by queryset deletes
+        CivicCaptcha.objects.filter(pk=self.captcha.pk).delete()
+        self.assertIsNone(CaptchaSlugRegistry.slug_owner("iebc-chair"))
+
+    def test_validate_unique_reports_cross_model_clashes(self):
+        clash = JumbledCountyCaptcha(question_text="Who chairs the IEBC", correct_answer="x")
+        with self.assertRaises(ValidationError) as raised:
+            clash.validate_unique()
+        self.assertIn("question_text", raised.exception.message_dict)
+
+        # The owner itself is not a clash
+        self.captcha.validate_unique()
+
+    def test_clashing_save_rolls_back(self):
+        with self.assertRaises(IntegrityError):
+            JumbledCountyCaptcha.objects.create(question_text="Who chairs the IEBC", correct_answer="x")
+        self.assertFalse(JumbledCountyCaptcha.objects.exists())
+
+    def add_clashing_row(self):
+        # As migration 0004 or an older import could leave it: same slug, no registry entry
+        return JumbledCountyCaptcha.objects.bulk_create([
+            JumbledCountyCaptcha(question_text="Who chairs the IEBC", slug=self.captcha.slug, correct_answer="x"),
+        ])[0]
+
+    def test_index_keeps_only_the_registry_owner_of_a_clashing_slug(self):
+        clash = self.add_clashing_row()
+
+        # rows + tags per model, plus one registry query for the clash
+        with self.assertNumQueries(5):
+            index = build_pool_index(models=(CivicCaptcha, JumbledCountyCaptcha), sources=())
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.lookup(self.captcha.slug)[:2], (CivicCaptcha, self.captcha.pk))
+        self.assertEqual(index.bucket(JumbledCountyCaptcha, clash.difficulty), ())
+
+    def test_resolve_active_uses_one_query_and_the_owner(self):
+        self.add_clashing_row()
+        models = [CivicCaptcha, JumbledCountyCaptcha]
+        ContentType.objects.get_for_models(*models)  # Warm Django's ContentType cache
+
+        with self.assertNumQueries(1):
+            resolved = CaptchaSlugRegistry.resolve_active(self.captcha.slug, models)
+        self.assertEqual(resolved, (CivicCaptcha, self.captcha.pk, "chairperson"))
+
+        # An inactive owner is not replaced by the unregistered clash
+        CivicCaptcha.objects.filter(pk=self.captcha.pk).update(active=False)
+        self.assertIsNone(CaptchaSlugRegistry.resolve_active(self.captcha.slug, models))
+        self.assertIsNone(CaptchaSlugRegistry.resolve_active("unknown-slug", models))
+
+    def test_partial_saves_skip_registry_and_tags(self):
+        self.captcha.attempt_count = 3
+        with self.assertNumQueries(1):
+            self.captcha.save(update_fields=["attempt_count"])
+
+        self.captcha.tags = "elections, iebc"
+        self.captcha.save(update_fields=["tags"])
+        self.assertEqual(
+            set(self.captcha.normalized_tags.values_list("name", flat=True)), {"elections", "iebc"},
+        )
+
+
+class CaptchaTagTests(TestCase):
+    """
+    The comma-separated `tags` string is parsed into shared `CaptchaTag`
+    rows; the links are reconciled in bulk, backfilled by migration 0006
+    and offered per model in the admin filter.
+    """
+
+    def setUp(self):
+        self.first = CivicCaptcha.objects.create(
+            question_text="Who chairs the IEBC", correct_answer="chairperson", tags="Elections, IEBC",
+        )
+        self.second = CivicCaptcha.objects.create(
+            question_text="How many counties", correct_answer="47", tags="devolution",
+        )
+        self.county = JumbledCountyCaptcha.objects.create(
+            question_text="Unscramble IBRONA", correct_answer="nairobi", tags="geography",
+        )
+
+    def tag_names(self, captcha):
+        return set(captcha.normalized_tags.values_list("name", flat=True))
+
+    def test_parse_tags(self):
+        self.assertEqual(parse_tags(" Elections,iebc , ELECTIONS,, "), ["elections", "iebc"])
+        self.assertEqual(parse_tags("x" * 60), ["x" * 50])
+        self.assertEqual(parse_tags(None), [])
+
+    def test_sync_model_reconciles_bulk_edits(self):
+        # Queryset updates bypass save(), leaving the links stale
+        CivicCaptcha.objects.filter(pk=self.first.pk).update(tags="elections, voting")
+        CivicCaptcha.objects.filter(pk=self.second.pk).update(tags="")
+
+        self.assertEqual(CaptchaTag.sync_model(CivicCaptcha), {"linked": 1, "unlinked": 2})
+        self.assertEqual(self.tag_names(self.first), {"elections", "voting"})
+        self.assertEqual(self.tag_names(self.second), set())
+        # Other models' links are untouched
+        self.assertEqual(self.tag_names(self.county), {"geography"})
+
+        self.assertEqual(CaptchaTag.sync_model(CivicCaptcha), {"linked": 0, "unlinked": 0})
+
+    def test_migration_backfill_links_existing_tags(self):
+        for model in (CivicCaptcha, JumbledCountyCaptcha):
+            model.normalized_tags.through.objects.all().delete()
+        CaptchaTag.objects.all().delete()
+
+        migration = importlib.import_module("apps.ceeni_captcha.migrations.0006_captcha_tags")
+        migration.backfill_captcha_tags(django_apps, None)
+
+        self.assertEqual(self.tag_names(self.first), {"elections", "iebc"})
+        self.assertEqual(self.tag_names(self.county), {"geography"})
+        self.assertEqual(CaptchaTag.objects.count(), 4)
+
+    def test_admin_filter_lists_only_the_models_tags(self):
+        admin_user = get_user_model().objects.create_superuser(
+            phone_number="+254700000001", password="a-long-admin-passphrase",
+        )
+        self.client.force_login(admin_user)
+
+        response = self.client.get(reverse("admin:ceeni_captcha_civiccaptcha_changelist"))
+
+        tag_filter = next(
+            spec for spec in response.context["cl"].filter_specs
+            if getattr(spec, "field_path", None) == "normalized_tags"
+        )
+        self.assertEqual(
+            {label for _, label in tag_filter.lookup_choices}, {"elections", "iebc", "devolution"},
+        )
+
+
+@override_settings(CEENI_CAPTCHA_TOKEN_MAX_AGE=600)
+class ChallengeTokenTests(SimpleTestCase):
+    """
+    Signed challenge tokens are checked without queries and can be
+    submitted once, right or wrong, before they expire.
+    """
+
+    def issue(self):
+        return issue_token(CivicCaptcha, 7, "Forty Seven")
+
+    def test_issue_and_verify(self):
+        checked = []
+        payload = verify_token(self.issue(), "  forty seven ", on_checked=lambda p, solved: checked.append(solved))
+
+        self.assertEqual((payload["m"], payload["i"]), ("ceeni_captcha.civiccaptcha", 7))
+        self.assertEqual(checked, [True])
+        self.assertNotIn("forty", payload["h"])
+
+    def test_tampered_token_is_rejected(self):
+        token = self.issue()
+        tampered = token[:-1] + ("A" if token[-1] != "A" else "B")
+
+        with self.assertRaisesMessage(ValidationError, "no longer valid"):
+            verify_token(tampered, "forty seven")
+
+    def test_expired_token_is_rejected(self):
+        token = self.issue()
+
+        with mock.patch("time.time", return_value=time.time() + 601):
+            with self.assertRaisesMessage(ValidationError, "expired"):
+                verify_token(token, "forty seven")
+
+    def test_replay_is_rejected(self):
+        token = self.issue()
+        verify_token(token, "forty seven")
+
+        with self.assertRaisesMessage(ValidationError, "already been used"):
+            verify_token(token, "forty seven")
+
+    def test_wrong_answer_burns_the_token(self):
+        token = self.issue()
+        checked = []
+
+        with self.assertRaisesMessage(ValidationError, "Incorrect"):
+            verify_token(token, "42", on_checked=lambda p, solved: checked.append(solved))
+        self.assertEqual(checked, [False])
+
+        with self.assertRaisesMessage(ValidationError, "already been used"):
+            verify_token(token, "forty seven")
+
+    def test_token_mode_requires_a_shared_cache(self):
+        with override_settings(CEENI_CAPTCHA_TOKEN_MODE=False):
+            self.assertEqual(check_token_mode_cache(None), [])
+
+        with override_settings(CEENI_CAPTCHA_TOKEN_MODE=True, DEBUG=False):
+            self.assertEqual([error.id for error in check_token_mode_cache(None)], ["ceeni_captcha.E001"])
+            with mock.patch("apps.ceeni_captcha.checks.cache_is_shared", return_value=True):
+                self.assertEqual(check_token_mode_cache(None), [])
+
+    def test_token_mode_rejects_the_database_cache(self):
+        database_cache = {"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "t"}}
+        redis_cache = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": "redis://"}}
+
+        with override_settings(CEENI_CAPTCHA_TOKEN_MODE=True, DEBUG=False, CACHES=database_cache):
+            self.assertEqual([error.id for error in check_token_mode_cache(None)], ["ceeni_captcha.E002"])
+        with override_settings(CEENI_CAPTCHA_TOKEN_MODE=True, DEBUG=True, CACHES=database_cache):
+            self.assertEqual([error.id for error in check_token_mode_cache(None)], ["ceeni_captcha.W002"])
+        with override_settings(CEENI_CAPTCHA_TOKEN_MODE=True, DEBUG=False, CACHES=redis_cache):
+            self.assertEqual(check_token_mode_cache(None), [])
+
+    def test_verification_costs_one_cache_round_trip(self):
+        token = self.issue()
+        # SimpleTestCase would fail on any database query
+        with mock.patch("apps.ceeni_captcha.utils.challenge_tokens.cache", wraps=cache) as spy:
+            verify_token(token, "forty seven")
+        self.assertEqual(len(spy.method_calls), 1)
+        self.assertEqual(spy.method_calls[0][0], "add")
+
+
+class FragmentPoolTests(TestCase):
+    """
+    The fragment pool serves rendered fieldsets from per-band rings and
+    drops them when the captcha pool index is rebuilt, also under
+    concurrent reloads.
+    """
+
+    def setUp(self):
+        self.captcha = CivicCaptcha.objects.create(
+            question_text="How many counties does Kenya have?", correct_answer="47",
+        )
+        captcha_pool.invalidate()
+        captcha_pool.get()
+        self.pool = CaptchaFragmentPool(capacity=8, batch_size=4, max_serves=4)
+
+    def test_rebuilt_index_drops_stale_fragments(self):
+        html, choice, _ = self.pool.pop(token_mode=False)
+        self.assertEqual(choice.pk, self.captcha.pk)
+
+        self.captcha.delete()
+        replacement = CivicCaptcha.objects.create(question_text="Who elects governors?", correct_answer="voters")
+        captcha_pool.invalidate()
+
+        html, choice, hit = self.pool.pop(token_mode=False)
+        self.assertEqual(choice.pk, replacement.pk)
+        self.assertFalse(hit)
+        self.assertIn("Who elects governors?", html)
+
+    def test_concurrent_pops(self):
+        self.pool.pop(token_mode=False)  # render outside the threads
+        served, errors = [], []
+
+        def reload():
+            try:
+                for _ in range(20):
+                    served.append(self.pool.pop(token_mode=False)[1].pk)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reload) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(set(served), {self.captcha.pk})
+        stats = self.pool.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 81)
+
+
+@override_settings(CEENI_CAPTCHA_TOKEN_MODE=False)
+class CaptchaReloadTests(TestCase):
+    """
+    The reload endpoint serves pooled fieldsets: hits come straight from the
+    ring, tokens are fresh on every serve and slug mode avoids the models
+    the session has already seen.
+    """
+
+    def setUp(self):
+        self.civic = CivicCaptcha.objects.create(
+            question_text="How many counties does Kenya have?", correct_answer="47",
+        )
+        self.session = SessionStore()
+        self.pool = CaptchaFragmentPool(capacity=4, batch_size=2, max_serves=4)
+        patcher = mock.patch("apps.ceeni_captcha.views.htmx.captcha_reload.captcha_fragment_pool", self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        captcha_pool.invalidate()
+
+    def reload(self, **params):
+        request = RequestFactory().get("/htmx/captcha/captcha/reload/", params)
+        request.session = self.session
+        return reload_captcha_partial_view(request)
+
+    def test_miss_then_hit(self):
+        first = self.reload()
+        second = self.reload()
+
+        self.assertEqual((first["X-Captcha-Pool"], second["X-Captcha-Pool"]), ("miss", "hit"))
+        self.assertIn("How many counties does Kenya have?", second.content.decode())
+        self.assertEqual(self.pool.stats()["rendered"], 2)
+
+    @override_settings(CEENI_CAPTCHA_TOKEN_MODE=True)
+    def test_every_serve_gets_a_fresh_token(self):
+        tokens = [
+            re.search(r'name="captcha_token" value="([^"]+)"', self.reload().content.decode()).group(1)
+            for _ in range(3)
+        ]
+
+        self.assertEqual(len(set(tokens)), 3)
+        for token in tokens:
+            verify_token(token, "47")
+        self.assertNotIn("used_captcha_models", self.session)
+
+    def test_unknown_band_falls_back_to_standard(self):
+        response = self.reload(band="impossible")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(self.pool.stats()["buffered"]["standard"], 0)
+
+    def test_empty_pool_renders_unavailable_block(self):
+        self.civic.delete()
+        captcha_pool.invalidate()
+
+        response = self.reload()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Captcha-Pool", response)
+        self.assertIn("Captcha unavailable", response.content.decode())
+
+    def test_slug_mode_avoids_seen_models(self):
+        JumbledCountyCaptcha.objects.create(question_text="BIRONI", correct_answer="nairobi")
+        self.session["used_captcha_models"] = ["civiccaptcha"]
+
+        # Fill the ring with one fragment of each model
+        with mock.patch("random.randrange", side_effect=itertools.cycle([0, 1])):
+            self.assertIn("BIRONI", self.reload().content.decode())
+        self.assertEqual(self.session["used_captcha_models"], ["civiccaptcha", "jumbledcountycaptcha"])
+
+        # Every model seen: serve anyway and start the list over
+        self.reload()
+        self.assertEqual(len(self.session["used_captcha_models"]), 1)
+
+
+class BulkImportTests(TestCase):
+    """
+    Captcha CSVs are diffed against the table and applied in bulk, with the
+    slug registry and tag links synced in the same transaction.
+    """
+
+    HEADER = "question_text,correct_answer,hint,explanation,difficulty,tags,active\n"
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "civic.csv"
+
+    def run_import(self, rows, **options):
+        self.path.write_text(self.HEADER + "".join(row + "\n" for row in rows), encoding="utf-8")
+        return import_captcha_file(CivicCaptcha, self.path, **options)
+
+    def test_create_skip_update(self):
+        rows = [
+            "How many counties?,47,,,1,devolution,true",
+            "Who elects the president?,voters,,,1,elections,true",
+            "How many counties?,47,,,1,devolution,true",
+        ]
+        report = self.run_import(rows)
+
+        self.assertEqual((len(report.created), len(report.updated), report.unchanged), (2, 0, 0))
+        self.assertEqual(report.duplicates, 1)
+        self.assertEqual(report.registry["created"], 2)
+        self.assertEqual(CaptchaSlugRegistry.slug_owner("how-many-counties")[0], CivicCaptcha)
+        self.assertEqual(
+            list(CivicCaptcha.objects.get(slug="how-many-counties").normalized_tags.values_list("name", flat=True)),
+            ["devolution"],
+        )
+
+        report = self.run_import(rows[:2])
+        self.assertEqual((len(report.created), len(report.updated), report.unchanged), (0, 0, 2))
+
+        report = self.run_import([rows[0], "Who elects the president?,citizens,,,2,elections,false"])
+        self.assertEqual(report.updated, {"who-elects-the-president": ["correct_answer", "difficulty", "active"]})
+        self.assertEqual(report.unchanged, 1)
+        self.assertFalse(CivicCaptcha.objects.get(slug="who-elects-the-president").active)
+
+    def test_slugs_owned_by_another_model_are_rejected(self):
+        JumbledCountyCaptcha.objects.create(question_text="How many counties?", correct_answer="47")
+
+        for dry_run in (True, False):
+            report = self.run_import(
+                ["How many counties?,47,,,1,,true", "Who elects the president?,voters,,,1,,true"],
+                dry_run=dry_run,
+            )
+            self.assertEqual(report.conflicts, ["how-many-counties"])
+            self.assertEqual(report.created, ["who-elects-the-president"])
+
+        self.assertFalse(CivicCaptcha.objects.filter(slug="how-many-counties").exists())
+        self.assertEqual(CaptchaSlugRegistry.slug_owner("how-many-counties")[0], JumbledCountyCaptcha)
+
+    def test_dry_run_writes_nothing(self):
+        report = self.run_import(["How many counties?,47,,,1,,true"], dry_run=True)
+
+        self.assertEqual(report.created, ["how-many-counties"])
+        self.assertFalse(CivicCaptcha.objects.exists())
+        self.assertFalse(CaptchaSlugRegistry.objects.exists())
+
+    def test_malformed_row_reports_its_line(self):
+        with self.assertRaisesMessage(ValueError, "line 2"):
+            self.run_import(["How many counties?,47,,,hard,,true"])
+
+
+class GeneratedLocationCaptchaTests(TestCase):
+    """
+    Generated location captchas carry their jumble seed in the slug, so a
+    submitted slug maps back to the same question and answer.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.county = County.objects.create(code="047", name="Nairobi")
+
+    def setUp(self):
+        self.index = build_pool_index(models=(), sources=(GeneratedCountyCaptcha,))
+
+    def test_seed_in_slug_round_trips(self):
+        template = self.index.choose([GeneratedCountyCaptcha])
+        challenge = GeneratedCountyCaptcha.materialize(template)
+
+        self.assertTrue(challenge.slug.startswith("gen-county-"))
+        self.assertNotIn("{jumbled}", challenge.question_text)
+
+        resolved = self.index.lookup(challenge.slug)
+        seed = challenge.slug.rsplit("-", 1)[1]
+        again = GeneratedCountyCaptcha.materialize(resolved, seed)
+
+        self.assertEqual(again.question_text, challenge.question_text)
+        self.assertEqual(again.correct_answer, "Nairobi")
+        self.assertNotEqual(GeneratedCountyCaptcha.materialize(resolved, "other").slug, challenge.slug)
+
+    def test_submitted_slug_is_checked_against_the_name(self):
+        challenge = GeneratedCountyCaptcha.materialize(self.index.choose([GeneratedCountyCaptcha]))
+
+        with mock.patch("apps.ceeni_captcha.forms.captcha_mixin.get_pool_index", return_value=self.index):
+            with self.assertNumQueries(0):
+                form = CaptchaFieldMixin(
+                    {"captcha_slug": challenge.slug, "captcha_response": " nairobi "},
+                    token_mode=False, model_whitelist=[GeneratedCountyCaptcha],
+                )
+                self.assertTrue(form.is_valid(), form.errors)
+
+    def test_base_class_is_abstract(self):
+        with self.assertRaises(TypeError):
+            GeneratedLocationCaptcha()
+
+    def test_rendered_challenge_does_not_reveal_the_pk(self):
+        # A pk unlikely to appear by chance in a hex id or a base64 token
+        county = County.objects.create(pk=73919, code="001", name="Mombasa")
+        index = build_pool_index(models=(), sources=(GeneratedCountyCaptcha,))
+        template = index.lookup(GeneratedCountyCaptcha.template_slug(county.pk))
+
+        for token_mode in (False, True):
+            with self.subTest(token_mode=token_mode), \
+                    mock.patch("apps.ceeni_captcha.forms.captcha_mixin.get_pool_index", return_value=index), \
+                    mock.patch.object(index, "choose", return_value=template):
+                form = CaptchaFieldMixin(token_mode=token_mode, model_whitelist=[GeneratedCountyCaptcha])
+                slug = form.fields["captcha_slug"].initial or ""
+                token = form.fields["captcha_token"].initial or ""
+
+                self.assertNotIn(str(county.pk), slug)
+                self.assertIsNone(form._current_captcha.pk)
+                if token_mode:
+                    payload = signing.loads(token, salt=TOKEN_SALT)
+                    self.assertIsNone(payload["i"])
+                    self.assertNotIn(str(county.pk), json.dumps(payload))
+                else:
+                    self.assertEqual(index.lookup(slug).pk, county.pk)
+
+
+@override_settings(CEENI_CAPTCHA_TELEMETRY=True)
+class TelemetryTests(TestCase):
+    """
+    Answer checks are counted in memory and flushed as batched F()
+    increments; a failed flush is logged, never raised.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.first = CivicCaptcha.objects.create(question_text="First?", correct_answer="1")
+        cls.second = CivicCaptcha.objects.create(question_text="Second?", correct_answer="2")
+        cls.third = CivicCaptcha.objects.create(question_text="Third?", correct_answer="3")
+
+    def setUp(self):
+        self.telemetry = CaptchaTelemetry()
+        # No background thread in tests: flushes are called explicitly
+        patcher = mock.patch.object(CaptchaTelemetry, "_ensure_flusher")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_record_aggregates_without_queries(self):
+        with self.assertNumQueries(0):
+            self.telemetry.record(CivicCaptcha, self.first.pk, True, elapsed_ms=1500)
+            self.telemetry.record(CivicCaptcha, self.first.pk, False)
+            self.telemetry.record(CivicCaptcha, self.second.pk, True)
+            self.telemetry.record(GeneratedCountyCaptcha, 1, True)
+
+        self.assertEqual(self.telemetry.pending(), 2)
+
+        with override_settings(CEENI_CAPTCHA_TELEMETRY=False):
+            self.telemetry.record(CivicCaptcha, self.third.pk, True)
+        self.assertEqual(self.telemetry.pending(), 2)
+
+    def test_flush_batches_identical_deltas(self):
+        self.telemetry.record(CivicCaptcha, self.first.pk, True, elapsed_ms=1500)
+        self.telemetry.record(CivicCaptcha, self.first.pk, False)
+        self.telemetry.record(CivicCaptcha, self.second.pk, False)
+        self.telemetry.record(CivicCaptcha, self.third.pk, False)
+
+        # One UPDATE for first, one shared by second and third (+ savepoint, release)
+        with self.assertNumQueries(4):
+            self.assertEqual(self.telemetry.flush(), 3)
+
+        counts = dict(
+            (pk, rest) for pk, *rest in CivicCaptcha.objects.values_list(
+                "pk", "attempt_count", "solve_count", "timed_solve_count", "solve_time_ms_total",
+            )
+        )
+        self.assertEqual(counts[self.first.pk], [2, 1, 1, 1500])
+        self.assertEqual(counts[self.third.pk], [1, 0, 0, 0])
+        self.assertEqual(self.telemetry.pending(), 0)
+        self.assertEqual(self.telemetry.flush(), 0)
+
+    def test_failed_flush_is_logged(self):
+        self.telemetry.record(CivicCaptcha, self.first.pk, True)
+
+        with mock.patch.object(CaptchaTelemetry, "flush", side_effect=RuntimeError("db down")), \
+                mock.patch("apps.ceeni_captcha.utils.telemetry.connection"):
+            with self.assertLogs("apps.ceeni_captcha.utils.telemetry", level="ERROR") as logs:
+                self.telemetry.flush_safely()
+
+        self.assertIn("db down", logs.output[0])
+
+    def test_calibration_dry_run_does_not_flush(self):
+        with mock.patch(
+            "apps.ceeni_captcha.management.commands.calibrate_captcha_difficulty.captcha_telemetry"
+        ) as telemetry:
+            call_command("calibrate_captcha_difficulty", dry_run=True, stdout=StringIO())
+            telemetry.flush.assert_not_called()
+
+            call_command("calibrate_captcha_difficulty", stdout=StringIO())
+            telemetry.flush.assert_called_once_with()
@@ -0,0 +1,198 @@
+# apps/ceeni_captcha/utils/bulk_import.py
+
+"""
+Bulk, transactional import engine for captcha CSV files.
+
+One file is imported in four steps:
+    1. Stream-parse the CSV into {slug: field values} (last row wins)
+    2. Load the existing rows of the target table in one query
+    3. Diff: new slugs are created, rows whose fields differ are updated;
+       new slugs another captcha model already owns are rejected
+    4. Apply bulk_create / bulk_update in batches, sync the slug registry and
+       tag links, and invalidate the captcha pool index — all inside one
+       transaction
+
+A dry run stops after step 3 and returns the same report without writing.
+Because bulk writes bypass `save()` and model signals, the engine performs
+the registry/tag sync and pool invalidation that those hooks normally do.
+"""
+
+import csv
+import time
+from typing import NamedTuple
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from apps.ceeni_captcha.models import CaptchaSlugRegistry, CaptchaTag
+from apps.ceeni_captcha.utils.pool_index import captcha_pool
+
+# CSV columns copied onto the model (question_text is also the slug source)
+IMPORTED_FIELDS = (
+    "question_text",
+    "correct_answer",
+    "hint",
+    "explanation",
+    "difficulty",
+    "tags",
+    "active",
+)
+
+
+class CaptchaImportReport(NamedTuple):
+    """Outcome of importing (or dry-running) one captcha CSV file."""
+    model: type
+    file_name: str
+    created: list        # Slugs of new rows
+    updated: dict        # {slug: [changed field names]}
+    unchanged: int
+    duplicates: int      # Rows repeating a slug already seen in the same file
+    conflicts: list      # New slugs already owned by another captcha model (not imported)
+    seconds: float
+    registry: dict       # CaptchaSlugRegistry.sync_model() counts ({} on dry run)
+    tag_links: dict      # CaptchaTag.sync_model() counts ({} on dry run)
+    dry_run: bool
+
+
+def parse_captcha_csv(file_path):
+    """
+    Streams a captcha CSV, yielding (line_number, slug, values) per row.
+    Raises ValueError with the line number on malformed rows.
+    """
+    with open(file_path, newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            try:
+                question_text = row['question_text']
+                values = {
+                    'question_text': question_text,
+                    'correct_answer': row['correct_answer'].strip(),
+                    'hint': row['hint'].strip(),
+                    'explanation': row['explanation'].strip(),
+                    'difficulty': int(row['difficulty']),
+                    'tags': row['tags'].strip(),
+                    'active': row['active'].strip().lower() == 'true',
+                }
+            except (KeyError, ValueError, AttributeError) as e:
+                raise ValueError(f"line {reader.line_num}: {e!r}")
+
+            yield reader.line_num, slugify(question_text[:80]), values
+
+
+def import_captcha_file(model, file_path, dry_run=False, batch_size=500):
+    """
+    Imports one captcha CSV into `model`. Returns a `CaptchaImportReport`.
+    """
+    start = time.perf_counter()
+
+    incoming, duplicates = {}, 0
+    for _, slug, values in parse_captcha_csv(file_path):
+        if slug in incoming:
+            duplicates += 1
+        incoming[slug] = values
+
+    # One query: every existing row of the table, keyed by slug
+    existing = {
+        obj.slug: obj
+        for obj in model.objects.order_by().only("pk", "slug", *IMPORTED_FIELDS)
+    }
+
+    # One query: new slugs another model owns would clash in the registry
+    conflicts = CaptchaSlugRegistry.claimed_slugs(model, [slug for slug in incoming if slug not in existing])
+
+    to_create, to_update, created, updated, unchanged = [], [], [], {}, 0
+    for slug, values in incoming.items():
+        obj = existing.get(slug)
+        if obj is None:
+            if slug in conflicts:
+                continue
+            to_create.append(model(slug=slug, **values))
+            created.append(slug)
+            continue
+
+        changed = [field for field, value in values.items() if getattr(obj, field) != value]
+        if not changed:
+            unchanged += 1
+            continue
+
+        for field in changed:
+            setattr(obj, field, values[field])
+        to_update.append(obj)
+        updated[slug] = changed
+
+    registry, tag_links = {}, {}
+    if not dry_run:
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=batch_size)
+            # auto_now is not applied by bulk_update, so touch it explicitly
+            if to_update:
+                now = timezone.now()
+                for obj in to_update:
+                    obj.updated_at = now
+                model.objects.bulk_update(
+                    to_update, [*IMPORTED_FIELDS, "updated_at"], batch_size=batch_size
+                )
+            registry = CaptchaSlugRegistry.sync_model(model)
+            tag_links = CaptchaTag.sync_model(model)
+            if to_create or to_update:
+                transaction.on_commit(captcha_pool.invalidate)
+
+    return CaptchaImportReport(
+        model=model,
+        file_name=file_path.name,
+        created=created,
+        updated=updated,
+        unchanged=unchanged,
+        duplicates=duplicates,
+        conflicts=sorted(conflicts),
+        seconds=time.perf_counter() - start,
+        registry=registry,
+        tag_links=tag_links,
+        dry_run=dry_run,
+    )
+
+
+def write_import_report(command, report, verbosity=1):
+    """
+    Prints a report through a management command's stdout and style.
+    Verbosity 2 lists every created and updated slug.
+    """
+    prefix = "[dry run] " if report.dry_run else ""
+    command.stdout.write(
+        command.style.SUCCESS(
+            f"{prefix}{report.file_name} → {report.model.__name__}: "
+            f"{len(report.created)} created, {len(report.updated)} updated, "
+            f"{report.unchanged} unchanged in {report.seconds * 1000:.0f} ms."
+        )
+    )
+
+    if report.duplicates:
+        command.stdout.write(
+            command.style.WARNING(f"  {report.duplicates} rows repeated an earlier slug (last row kept).")
+        )
+
+    if report.conflicts:
+        command.stdout.write(
+            command.style.WARNING(
+                f"  {len(report.conflicts)} rows skipped: slug already used by another captcha model "
+                f"({', '.join(report.conflicts)})."
+            )
+        )
+
+    if report.registry:
+        command.stdout.write(
+            f"  Slug registry: {report.registry['created']} registered, {report.registry['updated']} updated, "
+            f"{report.registry['removed']} removed, {report.registry['conflicts']} conflicts."
+        )
+
+    if report.tag_links:
+        command.stdout.write(
+            f"  Tags: {report.tag_links['linked']} linked, {report.tag_links['unlinked']} unlinked."
+        )
+
+    if verbosity > 1 or report.dry_run:
+        for slug in report.created:
+            command.stdout.write(f"  + {slug}")
+        for slug, fields in report.updated.items():
+            command.stdout.write(f"  ~ {slug} ({', '.join(fields)})")
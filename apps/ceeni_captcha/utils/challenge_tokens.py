@@ -0,0 +1,117 @@
+# apps/ceeni_captcha/utils/challenge_tokens.py
+
+"""
+Stateless, signed captcha challenge tokens.
+
+A token carries everything needed to check an answer later:
+    m — captcha model label (e.g. "ceeni_captcha.civiccaptcha")
+    i — captcha primary key
+    t — issue time (unix seconds)
+    n — random nonce, doubling as the replay-protection key
+    h — HMAC of the normalized correct answer, salted with the nonce
+
+Tokens are signed with SECRET_KEY, not encrypted: anyone holding one can
+decode and read the payload, but not change it. They expire after
+`CEENI_CAPTCHA_TOKEN_MAX_AGE` seconds. The answer hash is keyed by SECRET_KEY
+too, so it cannot be brute-forced offline from the token alone.
+
+Verification needs no database query and no session. Replay protection uses
+Django's cache (`cache.add` on the nonce, expiring with the token), which is
+one cache round trip per submission. Token mode therefore requires a cache
+shared by every worker (with a per-process cache a token could be replayed
+once against each worker) that is not the database cache (each `add` would be
+a database write). The `ceeni_captcha.E001`/`E002` system checks enforce this
+outside DEBUG.
+"""
+
+import time
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.utils.crypto import constant_time_compare, get_random_string, salted_hmac
+
+TOKEN_SALT = "ceeni_captcha.challenge_token"
+ANSWER_HASH_SALT = "ceeni_captcha.challenge_answer"
+SEEN_TOKEN_KEY = "ceeni:captcha:seen:{nonce}"
+
+
+def get_token_max_age():
+    return getattr(settings, "CEENI_CAPTCHA_TOKEN_MAX_AGE", 600)
+
+
+def normalize_answer(value):
+    """Same comparison rule as slug mode: case- and surrounding-whitespace-insensitive."""
+    return (value or "").strip().lower()
+
+
+def hash_answer(answer, nonce):
+    return salted_hmac(
+        ANSWER_HASH_SALT,
+        f"{nonce}:{normalize_answer(answer)}",
+        algorithm="sha256",
+    ).hexdigest()
+
+
+def issue_token(model, pk, correct_answer):
+    """
+    Returns a signed, URL-safe challenge token for one captcha.
+    """
+    nonce = get_random_string(22)
+    payload = {
+        "m": model._meta.label_lower,
+        "i": pk,
+        "t": int(time.time()),
+        "n": nonce,
+        "h": hash_answer(correct_answer, nonce),
+    }
+    return signing.dumps(payload, salt=TOKEN_SALT, compress=True)
+
+
+def read_token(token):
+    """
+    Returns the verified token payload, or raises ValidationError if the
+    token is tampered with or expired. Does not consume the token.
+    """
+    try:
+        return signing.loads(token, salt=TOKEN_SALT, max_age=get_token_max_age())
+    except signing.SignatureExpired:
+        raise ValidationError("This captcha has expired. Please try a different question.")
+    except signing.BadSignature:
+        raise ValidationError("This captcha is no longer valid. Please reload the page.")
+
+
+def consume_token(payload):
+    """
+    Marks a token payload as used; raises ValidationError if it already was.
+    """
+    # cache.add is atomic: only the first submission of a nonce succeeds
+    if not cache.add(SEEN_TOKEN_KEY.format(nonce=payload["n"]), 1, timeout=get_token_max_age()):
+        raise ValidationError("This captcha has already been used. Please try a different question.")
+
+
+def answer_matches(payload, response):
+    """Constant-time check of a response against the payload's answer hash."""
+    return constant_time_compare(hash_answer(response, payload["n"]), payload["h"])
+
+
+def verify_token(token, response, on_checked=None):
+    """
+    Checks a user's answer against a challenge token and consumes the token.
+
+    Every token can be submitted once: wrong answers burn it too, so a bot
+    cannot keep guessing against the same challenge. `on_checked(payload,
+    solved)` is called once the answer has been compared (e.g. for
+    telemetry), before a wrong answer raises. Returns the payload.
+    """
+    payload = read_token(token)
+    consume_token(payload)
+
+    solved = answer_matches(payload, response)
+    if on_checked is not None:
+        on_checked(payload, solved)
+    if not solved:
+        raise ValidationError("Incorrect captcha answer. Try again.")
+
+    return payload
@@ -0,0 +1,238 @@
+# apps/ceeni_captcha/utils/fragment_pool.py
+
+"""
+Pre-rendered captcha fieldsets for the HTMX reload endpoint.
+
+Rendering `_captcha_block.html` (form, nested icon includes, URL reversing) on
+every "Try a different question" click is the expensive part of a reload. This
+module keeps a bounded ring buffer of already-rendered fragments per difficulty
+band. A reload serves the next fragment in the ring plus, in token mode, a
+single string substitution that swaps the render-time token for a fresh one.
+
+Each fragment is served at most `max_serves` times before it is retired, and
+the ring is topped up lazily, in batches, whenever it holds fewer than
+`batch_size` fragments — so about one render in `max_serves` reloads.
+
+Why a ring rather than consume-once: a fragment served only once saves
+nothing per reload, it just moves the render into a batch. Benchmarks
+(`benchmark_captcha_suite`) put consume-once reloads at ~1.4 ms against
+~0.2-0.3 ms for the ring. Serving a fragment again is safe:
+    - token mode: every serve gets its own freshly issued, single-use token
+    - slug mode: a slug is a public question id that random selection
+      already repeats across users; the answer is still checked per submit
+Retiring after `max_serves` keeps the questions rotating.
+
+In slug mode, models the session has already seen can be passed as
+`exclude`: the first fragment in the ring from another model is served, as
+`CaptchaFieldMixin` does when it picks from the pool. If every buffered
+fragment is from an excluded model, the head of the ring is served anyway
+(the mixin resets its exclusions in the same situation).
+
+Fragments are tied to the pool index (and challenge mode) they were drawn
+from: when captchas are edited and the index is rebuilt, the pool moves to a
+new generation under a pool-level lock, and each band drops its stale
+fragments under its own lock before serving again.
+
+Metrics are kept per process — see `CaptchaFragmentPool.stats()`.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+from django.conf import settings
+from django.template.loader import render_to_string
+
+from apps.ceeni_captcha.forms.captcha_mixin import CaptchaFieldMixin
+from apps.ceeni_captcha.utils.challenge_tokens import issue_token
+from apps.ceeni_captcha.utils.pool_index import get_pool_index
+
+CAPTCHA_BLOCK_TEMPLATE = "common/forms/partials/_captcha_block.html"
+
+# Named difficulty bands served by the reload endpoint (inclusive ranges)
+CAPTCHA_DIFFICULTY_BANDS = {
+    "easy": (0, 1),
+    "standard": (0, 3),  # CaptchaFieldMixin's default range
+    "hard": (3, 5),
+}
+DEFAULT_DIFFICULTY_BAND = "standard"
+
+
+class CaptchaFragment(NamedTuple):
+    """One rendered fieldset plus what is needed to personalise it."""
+    choice: object      # CaptchaChoice the fragment was rendered for
+    html: str
+    token: str          # Render-time token to substitute ("" in slug mode)
+
+
+class CaptchaFragmentPool:
+    """
+    Bounded ring buffers of rendered captcha fragments, one per difficulty band.
+    """
+
+    def __init__(self, capacity=64, batch_size=16, max_serves=8, bands=CAPTCHA_DIFFICULTY_BANDS):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.max_serves = max_serves
+        self.bands = bands
+
+        # {band: deque([fragment, serves_left], ...)}
+        self._buffers = {band: deque(maxlen=capacity) for band in bands}
+        self._locks = {band: threading.Lock() for band in bands}
+
+        # Guards the three attributes below
+        self._lock = threading.Lock()
+        self._source = None  # Pool index the current generation is drawn from
+        self.token_mode = None  # Mode the current generation is rendered in
+        self._generation = 0
+        # Generation each band's buffer was rendered for
+        self._band_generations = {band: 0 for band in bands}
+
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.rendered = 0
+        self.refill_seconds = 0.0
+        self.last_refill_seconds = 0.0
+
+    # =============================
+    # Rendering
+    # =============================
+
+    def render_fragment(self, band, token_mode):
+        """
+        Renders one captcha fieldset for a band.
+        Returns None when the band has no eligible captchas.
+        """
+        form = CaptchaFieldMixin(
+            difficulty_range=self.bands[band],
+            token_mode=token_mode,
+        )
+        choice = getattr(form, "_current_captcha", None)
+        if choice is None:
+            return None
+
+        html = render_to_string(
+            CAPTCHA_BLOCK_TEMPLATE,
+            {"form": form, "captcha_model_label": choice.get_model_label()},
+        )
+        token = form.fields["captcha_token"].initial if token_mode else ""
+        return CaptchaFragment(choice, html, token or "")
+
+    def refill(self, band, token_mode):
+        """
+        Renders a batch of fragments into a band's ring.
+        Called with the band's lock held.
+        """
+        buffer = self._buffers[band]
+        start = time.perf_counter()
+        for _ in range(min(self.batch_size, self.capacity - len(buffer))):
+            fragment = self.render_fragment(band, token_mode)
+            if fragment is None:
+                break
+            buffer.append([fragment, self.max_serves])
+            self.rendered += 1
+
+        elapsed = time.perf_counter() - start
+        self.refills += 1
+        self.refill_seconds += elapsed
+        self.last_refill_seconds = elapsed
+
+    def clear(self):
+        for band, buffer in self._buffers.items():
+            with self._locks[band]:
+                buffer.clear()
+
+    def _current_generation(self, token_mode):
+        """
+        Starts a new generation when the pool index or the challenge mode
+        changed since the current one. Returns the current generation.
+        """
+        source = get_pool_index()
+        with self._lock:
+            if source is not self._source or token_mode != self.token_mode:
+                self._source = source
+                self.token_mode = token_mode
+                self._generation += 1
+            return self._generation
+
+    # =============================
+    # Serving
+    # =============================
+
+    def pop(self, band=DEFAULT_DIFFICULTY_BAND, token_mode=None, exclude=()):
+        """
+        Returns (html, choice, hit) for a ready-to-serve fragment, or None if
+        the band has no captchas at all. `hit` is False when the ring had to
+        be topped up first. Fragments of the models named in `exclude`
+        (model names) are skipped when the ring holds any other.
+        """
+        if band not in self.bands:
+            band = DEFAULT_DIFFICULTY_BAND
+        if token_mode is None:
+            token_mode = getattr(settings, "CEENI_CAPTCHA_TOKEN_MODE", False)
+
+        generation = self._current_generation(token_mode)
+
+        with self._locks[band]:
+            buffer = self._buffers[band]
+            # Captchas (or the challenge mode) changed since these fragments were rendered
+            if self._band_generations[band] < generation:
+                buffer.clear()
+                self._band_generations[band] = generation
+            hit = len(buffer) >= self.batch_size
+            if not hit:
+                self.refill(band, token_mode)
+            if not buffer:
+                self.misses += 1
+                return None
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+            if exclude:
+                # Bring the first fragment of a model not yet seen to the head
+                for position, (candidate, _) in enumerate(buffer):
+                    if candidate.choice.model._meta.model_name not in exclude:
+                        buffer.rotate(-position)
+                        break
+
+            # Serve the head of the ring and move on to the next fragment
+            entry = buffer[0]
+            buffer.rotate(-1)
+            entry[1] -= 1
+            if entry[1] <= 0:
+                buffer.pop()  # Retired: the served entry is now the tail
+            fragment = entry[0]
+
+        html = fragment.html
+        if fragment.token:
+            # Tokens are single-use, so every reload needs its own
+            choice = fragment.choice
+            fresh = issue_token(choice.model, choice.pk, choice.correct_answer)
+            html = html.replace(fragment.token, fresh)
+
+        return html, fragment.choice, hit
+
+    # =============================
+    # Metrics
+    # =============================
+
+    def stats(self):
+        served = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / served, 4) if served else 0.0,
+            "refills": self.refills,
+            "rendered": self.rendered,
+            "avg_refill_ms": round(self.refill_seconds / self.refills * 1000, 2) if self.refills else 0.0,
+            "last_refill_ms": round(self.last_refill_seconds * 1000, 2),
+            "buffered": {band: len(buffer) for band, buffer in self._buffers.items()},
+        }
+
+
+# Shared, process-level instance
+captcha_fragment_pool = CaptchaFragmentPool()
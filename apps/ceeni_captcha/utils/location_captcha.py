@@ -0,0 +1,193 @@
+# apps/ceeni_captcha/utils/location_captcha.py
+
+"""
+Generated jumbled-location captchas, derived from the County, Constituency
+and Ward tables instead of hand-imported CSV rows.
+
+Each source contributes one candidate per location to the captcha pool index
+(see `build_pool_index()`), so the location names are read once per process
+and every ward is a candidate. A candidate is only a template: the question
+carries a `{jumbled}` placeholder that `materialize()` fills with the name's
+letters shuffled by a seeded, deterministic RNG. The seed travels in the
+challenge slug (`gen-ward-<challenge id>-<seed>`), so the same slug always
+shows the same jumble and the answer is checked against the in-memory name —
+no rows are stored and no query is made per challenge.
+
+The challenge id is a keyed HMAC of the location, never its primary key: the
+location bundle, option fragments and autocomplete all publish pk → name, so
+a pk in the slug (or in a token, which is signed but readable) would give the
+answer away. Materialized challenges carry no pk at all.
+
+Sources duck-type the parts of a captcha model the mixin relies on
+(`_meta.model_name`, `_meta.label_lower`, `_meta.verbose_name`).
+"""
+
+import random
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from django.utils.crypto import get_random_string, salted_hmac
+
+from apps.user_profiles.models import County, Constituency, Ward
+
+# Placeholder in template question texts, replaced by the jumbled name
+JUMBLE_PLACEHOLDER = "{jumbled}"
+
+CHALLENGE_ID_SALT = "ceeni_captcha.generated_challenge"
+
+
+class SourceMeta(NamedTuple):
+    """The subset of a model's `_meta` used by captcha selection and tokens."""
+    model_name: str
+    label_lower: str
+    verbose_name: str
+
+
+def location_difficulty(name):
+    """
+    Difficulty from 0 to 5: longer names and extra words are harder to unscramble.
+    """
+    words = name.split()
+    letters = sum(len(word) for word in words)
+
+    if letters <= 4:
+        difficulty = 0
+    elif letters <= 6:
+        difficulty = 1
+    elif letters <= 8:
+        difficulty = 2
+    elif letters <= 11:
+        difficulty = 3
+    else:
+        difficulty = 4
+
+    return min(5, difficulty + len(words) - 1)
+
+
+def jumble_name(name, rng):
+    """
+    Shuffles the letters of each word (word order kept), capitalised like the
+    CSV captchas: "Sinoko" → "Sonkio". Words are never left unchanged unless
+    all their letters are identical.
+    """
+    jumbled = []
+    for word in name.split():
+        letters = list(word.lower())
+        rng.shuffle(letters)
+        if "".join(letters) == word.lower() and len(set(letters)) > 1:
+            letters = letters[1:] + letters[:1]
+        jumbled.append("".join(letters).capitalize())
+    return " ".join(jumbled)
+
+
+class GeneratedLocationCaptcha(ABC):
+    """
+    Abstract base class for generated location captcha sources.
+
+    Subclasses define `_meta`, `slug_prefix`, `tags` and `candidates()`.
+    Sources are used as classes, never instantiated.
+    """
+
+    generated = True
+    _meta = None
+    slug_prefix = None
+    tags = frozenset()
+
+    @classmethod
+    @abstractmethod
+    def candidates(cls):
+        """Yields (pk, correct_answer, question_template, hint) using a single query."""
+
+    @classmethod
+    def challenge_id(cls, pk):
+        """Opaque, stable id of one location (keyed by SECRET_KEY)."""
+        return salted_hmac(CHALLENGE_ID_SALT, f"{cls.slug_prefix}:{pk}", algorithm="sha256").hexdigest()[:16]
+
+    @classmethod
+    def template_slug(cls, pk):
+        return f"{cls.slug_prefix}-{cls.challenge_id(pk)}"
+
+    @classmethod
+    def template_slug_for(cls, slug):
+        """Strips the seed from a materialized slug, or returns None if it isn't ours."""
+        if not slug.startswith(cls.slug_prefix + "-"):
+            return None
+        return slug.rsplit("-", 1)[0]
+
+    @classmethod
+    def materialize(cls, choice, seed=None):
+        """
+        Turns a template choice into a concrete challenge.
+        The same (choice, seed) always produces the same question. The pk is
+        dropped, so neither the slug nor a token issued for it reveals it.
+        """
+        seed = seed or get_random_string(8).lower()
+        rng = random.Random(f"{choice.slug}:{seed}")
+        return choice._replace(
+            pk=None,
+            slug=f"{choice.slug}-{seed}",
+            question_text=choice.question_text.replace(
+                JUMBLE_PLACEHOLDER, jumble_name(choice.correct_answer, rng)
+            ),
+        )
+
+
+class GeneratedCountyCaptcha(GeneratedLocationCaptcha):
+    _meta = SourceMeta("generatedcountycaptcha", "ceeni_captcha.generatedcountycaptcha", "Kenyan County Names")
+    slug_prefix = "gen-county"
+    tags = frozenset({"geography", "kenya", "counties"})
+
+    @classmethod
+    def candidates(cls):
+        for pk, name, code in County.objects.order_by().values_list("pk", "name", "code"):
+            yield (
+                pk,
+                name,
+                f"Rearrange ({JUMBLE_PLACEHOLDER}) to reference a valid county in Kenya",
+                f"County Code {code}",
+            )
+
+
+class GeneratedConstituencyCaptcha(GeneratedLocationCaptcha):
+    _meta = SourceMeta("generatedconstituencycaptcha", "ceeni_captcha.generatedconstituencycaptcha", "Kenyan Constituency Names")
+    slug_prefix = "gen-constituency"
+    tags = frozenset({"geography", "kenya", "constituency"})
+
+    @classmethod
+    def candidates(cls):
+        rows = Constituency.objects.order_by().values_list("pk", "name", "county__name")
+        for pk, name, county in rows:
+            yield (
+                pk,
+                name,
+                f"Arrange ({JUMBLE_PLACEHOLDER}) to refer to a valid constituency in {county} County, Kenya",
+                f"A constituency starting with {name[:3].upper()} based in {county}",
+            )
+
+
+class GeneratedWardCaptcha(GeneratedLocationCaptcha):
+    _meta = SourceMeta("generatedwardcaptcha", "ceeni_captcha.generatedwardcaptcha", "Kenyan Ward Names")
+    slug_prefix = "gen-ward"
+    tags = frozenset({"geography", "kenya", "ward"})
+
+    @classmethod
+    def candidates(cls):
+        rows = Ward.objects.order_by().values_list(
+            "pk", "name", "constituency__name", "constituency__county__name"
+        )
+        for pk, name, constituency, county in rows:
+            yield (
+                pk,
+                name,
+                f"Rearrange ({JUMBLE_PLACEHOLDER}) to reference a valid ward in "
+                f"{constituency} Constituency - {county} County in Kenya",
+                f"The Ward starts with {name[:3].upper()}",
+            )
+
+
+# Every generated source that feeds the pool index
+GENERATED_CAPTCHA_SOURCES = (
+    GeneratedCountyCaptcha,
+    GeneratedConstituencyCaptcha,
+    GeneratedWardCaptcha,
+)
@@ -0,0 +1,264 @@
+# apps/ceeni_captcha/utils/pool_index.py
+
+"""
+Process-level index of the active captcha pool.
+
+Instead of loading every active captcha row on each signup render, the pool is
+read once per process into compact tuples grouped by (model, difficulty).
+Picking a question is then a random offset into those buckets — no queries and
+no model instantiation, whatever the size of the pool.
+
+Generated location captchas (`location_captcha.py`) are indexed alongside
+the stored rows as template choices, one per County/Constituency/Ward.
+
+The index is rebuilt lazily after any captcha or location row is saved or
+deleted (see `apps/ceeni_captcha/signals/pool_index_sync.py`).
+"""
+
+import random
+from bisect import bisect_right
+from collections import defaultdict
+from typing import NamedTuple
+
+from apps.common.utils.process_cache import ProcessCache
+from apps.ceeni_captcha.models import CaptchaSlugRegistry
+from apps.ceeni_captcha.utils.location_captcha import GENERATED_CAPTCHA_SOURCES, location_difficulty
+from apps.ceeni_captcha.models import (
+    CivicCaptcha,
+    JumbledLeaderCaptcha,
+    JumbledWardCaptcha,
+    JumbledConstituencyCaptcha,
+    JumbledCountyCaptcha,
+    PoliticalPartyLeaderCaptcha,
+)
+
+# Every stored captcha model that feeds the index
+INDEXED_CAPTCHA_MODELS = (
+    CivicCaptcha,
+    JumbledLeaderCaptcha,
+    JumbledWardCaptcha,
+    JumbledConstituencyCaptcha,
+    JumbledCountyCaptcha,
+    PoliticalPartyLeaderCaptcha,
+)
+
+
+class CaptchaChoice(NamedTuple):
+    """
+    Compact, read-only view of one captcha row — what a form needs to render it
+    and, in signed-token mode, to issue a token without touching the database.
+    """
+    model: type
+    pk: int
+    slug: str
+    question_text: str
+    hint: str
+    correct_answer: str
+    solve_rate: float = None  # Calibrated share of correct answers (None = no data yet)
+    tags: frozenset = frozenset()  # Normalized tag names
+
+    def get_model_label(self):
+        """Mirrors `CaptchaBase.get_model_label()` for templates."""
+        return self.model._meta.verbose_name.title()
+
+
+class CaptchaPoolIndex:
+    """
+    Immutable per-model, per-difficulty buckets of `CaptchaChoice` tuples.
+    """
+
+    def __init__(self, buckets):
+        # {(model_label, difficulty): tuple[CaptchaChoice, ...]}
+        self._buckets = buckets
+        self._difficulties = tuple(sorted({difficulty for _, difficulty in buckets}))
+        # Memoized (buckets, cumulative sizes) per (models, difficulty_range) request shape
+        self._selections = {}
+        # In-memory slug registry for the active pool
+        self._by_slug = {
+            choice.slug: choice
+            for bucket in buckets.values()
+            for choice in bucket
+        }
+
+    def __len__(self):
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def lookup(self, slug):
+        """
+        Returns the active `CaptchaChoice` for a slug, or None.
+        Materialized generated slugs resolve to their template choice.
+        """
+        choice = self._by_slug.get(slug)
+        if choice is None:
+            for source in GENERATED_CAPTCHA_SOURCES:
+                template_slug = source.template_slug_for(slug)
+                if template_slug:
+                    return self._by_slug.get(template_slug)
+        return choice
+
+    def bucket(self, model, difficulty):
+        return self._buckets.get((model._meta.label_lower, difficulty), ())
+
+    def eligible_buckets(self, models, difficulty_range):
+        low, high = difficulty_range
+        buckets = []
+        for model in models:
+            for difficulty in self._difficulties:
+                if low <= difficulty <= high:
+                    bucket = self.bucket(model, difficulty)
+                    if bucket:
+                        buckets.append(bucket)
+        return buckets
+
+    def _selection(self, models, difficulty_range, solve_rate_band=None, tags=None):
+        key = (
+            tuple(models),
+            tuple(difficulty_range),
+            solve_rate_band and tuple(solve_rate_band),
+            tags and frozenset(tags),
+        )
+        selection = self._selections.get(key)
+        if selection is None:
+            buckets = self.eligible_buckets(models, difficulty_range)
+            if solve_rate_band or tags:
+                buckets = [
+                    bucket for bucket in (
+                        tuple(
+                            choice for choice in bucket
+                            if self._matches(choice, solve_rate_band, key[3])
+                        )
+                        for bucket in buckets
+                    )
+                    if bucket
+                ]
+            offsets, total = [], 0
+            for bucket in buckets:
+                total += len(bucket)
+                offsets.append(total)
+            selection = self._selections[key] = (buckets, offsets)
+        return selection
+
+    @staticmethod
+    def _matches(choice, solve_rate_band, tags):
+        if solve_rate_band and choice.solve_rate is not None:
+            # Uncalibrated captchas stay eligible so they can gather data
+            low, high = solve_rate_band
+            if not low <= choice.solve_rate <= high:
+                return False
+        if tags and tags.isdisjoint(choice.tags):
+            return False
+        return True
+
+    def choose(self, models, difficulty_range=(0, 3), rng=random, solve_rate_band=None, tags=None):
+        """
+        Picks one captcha uniformly across all eligible rows.
+
+        `solve_rate_band` (low, high) restricts the pick to captchas whose
+        calibrated solve rate falls in the band; `tags` to captchas carrying
+        at least one of the given tag names. Filtered buckets are built once
+        per request shape, so the cost still depends on the number of
+        buckets (models × difficulty levels), never on the number of rows.
+        Returns None if nothing is eligible.
+        """
+        buckets, offsets = self._selection(models, difficulty_range, solve_rate_band, tags)
+        if not offsets:
+            return None
+
+        offset = rng.randrange(offsets[-1])
+        position = bisect_right(offsets, offset)
+        start = offsets[position - 1] if position else 0
+        return buckets[position][offset - start]
+
+
+def build_tag_map(model):
+    """
+    Returns {pk: frozenset(tag names)} for one captcha model,
+    read from its indexed tag through table in one query.
+    """
+    field = model._meta.get_field("normalized_tags")
+    through = field.remote_field.through
+    links = through.objects.values_list(
+        f"{field.m2m_field_name()}_id", f"{field.m2m_reverse_field_name()}__name"
+    )
+
+    tags = defaultdict(set)
+    for pk, name in links.iterator():
+        tags[pk].add(name)
+    return {pk: frozenset(names) for pk, names in tags.items()}
+
+
+def build_pool_index(models=INDEXED_CAPTCHA_MODELS, sources=GENERATED_CAPTCHA_SOURCES):
+    """
+    Reads the active pool (two queries per model — rows and tags — and one
+    per generated source) into a `CaptchaPoolIndex`.
+
+    Slugs must be unique across models for `lookup()`. Rows that repeat
+    another model's slug (possible in tables filled before the registry)
+    cost one more query: only the registered owner is kept.
+    """
+    buckets = defaultdict(list)
+
+    for model in models:
+        tags = build_tag_map(model)
+        rows = (
+            model.objects.filter(active=True)
+            .order_by()
+            .values_list(
+                "pk", "slug", "question_text", "hint", "correct_answer",
+                "difficulty", "calibrated_difficulty", "solve_rate",
+            )
+        )
+        for pk, slug, question_text, hint, correct_answer, difficulty, calibrated, solve_rate in rows.iterator():
+            # Empirical difficulty wins once calibration has run
+            if calibrated is not None:
+                difficulty = calibrated
+            buckets[(model._meta.label_lower, difficulty)].append(
+                CaptchaChoice(
+                    model, pk, slug, question_text, hint, correct_answer,
+                    solve_rate, tags.get(pk, frozenset()),
+                )
+            )
+
+    for source in sources:
+        for pk, correct_answer, question_template, hint in source.candidates():
+            buckets[(source._meta.label_lower, location_difficulty(correct_answer))].append(
+                CaptchaChoice(
+                    source, pk, source.template_slug(pk), question_template, hint, correct_answer,
+                    tags=source.tags,
+                )
+            )
+
+    return CaptchaPoolIndex(drop_slug_clashes(buckets))
+
+
+def drop_slug_clashes(buckets):
+    """
+    Returns the buckets as tuples, keeping only the registry owner of a slug
+    shared by several models (one query, only if there are clashes).
+    """
+    models_by_slug = defaultdict(set)
+    for bucket in buckets.values():
+        for choice in bucket:
+            models_by_slug[choice.slug].add(choice.model)
+    clashes = {slug for slug, models in models_by_slug.items() if len(models) > 1}
+
+    if clashes:
+        # A clashing slug nobody registered is ambiguous: none of its rows is kept
+        owners = CaptchaSlugRegistry.slug_owners(clashes)
+        buckets = {
+            key: [
+                choice for choice in bucket
+                if choice.slug not in clashes or owners.get(choice.slug) == (choice.model, choice.pk)
+            ]
+            for key, bucket in buckets.items()
+        }
+    return {key: tuple(bucket) for key, bucket in buckets.items() if bucket}
+
+
+# Shared, process-level instance
+captcha_pool = ProcessCache("captcha_pool_index", build_pool_index)
+
+
+def get_pool_index():
+    """Returns this process's current captcha pool index."""
+    return captcha_pool.get()
@@ -0,0 +1,136 @@
+# apps/ceeni_captcha/utils/telemetry.py
+
+"""
+Buffered captcha attempt telemetry.
+
+Answer checks happen on the signup hot path, so they must not write to the
+database. `record()` only bumps in-memory counters; a daemon thread flushes
+them every `CEENI_CAPTCHA_TELEMETRY_FLUSH_SECONDS` as `F()` increments, one
+UPDATE per group of captchas with identical deltas, in a single transaction.
+
+Counters still buffered when a process exits are lost — acceptable for
+statistics that only feed `calibrate_captcha_difficulty`. So are the
+counters of a failed flush, which is logged with its traceback.
+
+Generated captchas (`location_captcha.py`) have no rows and are not tracked.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+class CaptchaTelemetry:
+    """
+    Per-process attempt/solve counters keyed by (model, pk).
+    """
+
+    def __init__(self, flush_seconds=None):
+        self._flush_seconds = flush_seconds
+        self._lock = threading.Lock()
+        # {(model, pk): [attempts, solves, timed_solves, solve_ms]}
+        self._pending = defaultdict(lambda: [0, 0, 0, 0])
+        self._flusher = None
+
+    @property
+    def enabled(self):
+        return getattr(settings, "CEENI_CAPTCHA_TELEMETRY", True)
+
+    @property
+    def flush_seconds(self):
+        if self._flush_seconds is not None:
+            return self._flush_seconds
+        return getattr(settings, "CEENI_CAPTCHA_TELEMETRY_FLUSH_SECONDS", 60)
+
+    def record(self, model, pk, solved, elapsed_ms=None):
+        """
+        Buffers one answer check. Never touches the database.
+        """
+        if not self.enabled or getattr(model, "generated", False):
+            return
+
+        with self._lock:
+            counters = self._pending[(model, pk)]
+            counters[0] += 1
+            if solved:
+                counters[1] += 1
+                if elapsed_ms is not None:
+                    counters[2] += 1
+                    counters[3] += max(0, int(elapsed_ms))
+
+        self._ensure_flusher()
+
+    def pending(self):
+        """Number of captchas with unflushed counters."""
+        return len(self._pending)
+
+    def flush(self):
+        """
+        Writes buffered counters as batched F() increments.
+        Returns the number of captchas updated.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(lambda: [0, 0, 0, 0])
+
+        if not pending:
+            return 0
+
+        # Captchas with identical deltas share one UPDATE
+        groups = defaultdict(list)
+        for (model, pk), deltas in pending.items():
+            groups[(model, tuple(deltas))].append(pk)
+
+        with transaction.atomic():
+            for (model, (attempts, solves, timed_solves, solve_ms)), pks in groups.items():
+                model.objects.filter(pk__in=pks).update(
+                    attempt_count=F("attempt_count") + attempts,
+                    solve_count=F("solve_count") + solves,
+                    timed_solve_count=F("timed_solve_count") + timed_solves,
+                    solve_time_ms_total=F("solve_time_ms_total") + solve_ms,
+                )
+
+        return len(pending)
+
+    # =============================
+    # Background flushing
+    # =============================
+
+    def _ensure_flusher(self):
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._run, name="captcha-telemetry", daemon=True
+                )
+                self._flusher.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_seconds)
+            self.flush_safely()
+
+    def flush_safely(self):
+        """
+        Flushes from the background thread. Telemetry must never take a
+        worker down: counters of a failed flush are logged and dropped
+        rather than retried forever.
+        """
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Captcha telemetry flush failed; buffered counters were dropped.")
+        finally:
+            # This thread owns its connection; don't hold it between flushes
+            connection.close()
+
+
+# Shared, process-level instance
+captcha_telemetry = CaptchaTelemetry()
@@ -1,26 +1,54 @@
 # apps/ceeni_captcha/views/htmx/captcha_reload.py
 
+from django.conf import settings
+from django.http import HttpResponse
 from django.shortcuts import render
 from apps.ceeni_captcha.forms.captcha_mixin import CaptchaFieldMixin
+from apps.ceeni_captcha.utils.fragment_pool import captcha_fragment_pool, DEFAULT_DIFFICULTY_BAND
 
 
 def reload_captcha_partial_view(request):
     """
     HTMX view to reload a new captcha partial block.
-    
-    This regenerates a new question from the pool of active captcha models,
-    respecting difficulty range and session state. Only the fieldset is returned,
-    not the entire form.
+
+    Serves a pre-rendered fieldset from the fragment pool (optionally for a
+    `?band=easy|standard|hard` difficulty band), so a reload is a buffer pop
+    rather than a form build and template render. Only the fieldset is
+    returned, not the entire form. The `X-Captcha-Pool` header reports
+    whether the fragment came straight from the buffer ("hit") or needed a
+    refill ("miss").
     """
-    form = CaptchaFieldMixin(request=request)
+    band = request.GET.get("band", DEFAULT_DIFFICULTY_BAND)
+    token_mode = getattr(settings, "CEENI_CAPTCHA_TOKEN_MODE", False)
+
+    # Slug mode avoids the captcha models this session has already seen
+    session = getattr(request, "session", None) if not token_mode else None
+    used_labels = session.get("used_captcha_models", []) if session is not None else []
+
+    served = captcha_fragment_pool.pop(band, token_mode=token_mode, exclude=used_labels)
+
+    if served is None:
+        # No captchas available: render the "unavailable" block directly
+        form = CaptchaFieldMixin(request=request)
+        return render(
+            request,
+            "common/forms/partials/_captcha_block.html",
+            {
+                "form": form,
+                "captcha_model_label": getattr(form, "_current_captcha", None).get_model_label() if hasattr(form, "_current_captcha") else None
+            }
+        )
 
-    return render(
-        request,
-        "common/forms/partials/_captcha_block.html",
-        {
-            "form": form,
-            "captcha_model_label": getattr(form, "_current_captcha", None).get_model_label() if hasattr(form, "_current_captcha") else None
-        }
-    )
+    html, choice, hit = served
 
+    # Keep session-based repetition tracking in slug mode
+    if session is not None:
+        model_name = choice.model._meta.model_name
+        if model_name in used_labels:
+            # Every buffered fragment was from a seen model: start over
+            used_labels = []
+        session["used_captcha_models"] = used_labels + [model_name]
 
+    response = HttpResponse(html)
+    response["X-Captcha-Pool"] = "hit" if hit else "miss"
+    return response
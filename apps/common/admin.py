@@ -1,18 +1,25 @@
 # Register your models here.
 
 from django.contrib import admin
-from .models import BlockedNickname
+from .models import BlockedNickname, ReferenceDataChecksum
 
 
 @admin.register(BlockedNickname)
 class BlockedNicknameAdmin(admin.ModelAdmin):
-    list_display = ("word", "added_by", "modified_by", "added_at", "updated_at")
+    list_display = ("word", "active", "added_by", "modified_by", "added_at", "updated_at")
     search_fields = ("word",)
     readonly_fields = ("added_at", "updated_at", "added_by", "modified_by")
-    list_filter = ("added_by", "modified_by")
+    list_filter = ("active", "added_by", "modified_by")
 
     def save_model(self, request, obj, form, change):
         if not obj.pk:
             obj.added_by = request.user  # only set on creation
         obj.modified_by = request.user  # always update
         super().save_model(request, obj, form, change)
+
+
+@admin.register(ReferenceDataChecksum)
+class ReferenceDataChecksumAdmin(admin.ModelAdmin):
+    list_display = ("name", "sha256", "rows", "synced_at")
+    search_fields = ("name",)
+    readonly_fields = ("name", "sha256", "rows", "synced_at")
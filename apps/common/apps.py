@@ -11,3 +11,7 @@ class CommonConfig(AppConfig):
 
     # Optional: Give a human-readable name for the admin interface
     verbose_name = "Shared Core Logic"
+
+    def ready(self):
+        # Rebuild the in-memory nickname blocklist when blocked words change
+        import apps.common.signals.blocklist_sync
@@ -1,16 +1,28 @@
-# apps/common/context_processors/user_data.py
-def global_user_data(request): 
+# apps/common/context_processors/ceeni_user_data.py
+
+from django.utils.functional import SimpleLazyObject
+
+from apps.user_profiles.utils.request_profile import get_request_profile
+
+
+def global_user_data(request):
     """
     Adds user and profile info to all templates if the user is authenticated.
+
+    Every value is a lazy proxy, resolved only when a template reads it: pages
+    that never use them (anonymous landing pages, HTMX partials) cost no
+    queries. The profile is loaded once per request via `get_request_profile()`
+    and shared with the views. Each value is None for anonymous visitors.
     """
-    if not request.user.is_authenticated:
-        return {}
+    def user():
+        return request.user if request.user.is_authenticated else None
 
-    # Get the related user profile if it exists
-    profile = getattr(request.user, "userprofile", None)
+    def photo():
+        profile = get_request_profile(request)
+        return profile.profile_image if profile else None
 
     return {
-        "ceeni_user": request.user,                             # Logged-in User object
-        "ceeni_profile": profile,                                # Related profile (if any)
-        "ceeni_photo": getattr(profile, "profile_image", None),  # Profile image (optional)
+        "ceeni_user": SimpleLazyObject(user),                                    # Logged-in User object
+        "ceeni_profile": SimpleLazyObject(lambda: get_request_profile(request)),  # Related profile (if any)
+        "ceeni_photo": SimpleLazyObject(photo),                                  # Profile image (optional)
     }
@@ -0,0 +1,94 @@
+"""
+FILE: apps/common/management/commands/base_import_reference.py
+
+PURPOSE:
+    Abstract base management command for importing a reference-data CSV
+    (lookup tables such as genders or education levels). Checksums,
+    parsing, diffing and the bulk, single-transaction write are handled by
+    `apps/common/utils/reference_sync.py`.
+
+OPTIONS:
+    --dry-run       Print the change report without writing anything
+    --force         Import even if the file is unchanged since the last import
+    --batch-size    Rows per bulk statement (default 500)
+
+USAGE:
+    Subclasses declare:
+        - model: Lookup model to sync (e.g., Gender)
+        - file_name: CSV file name under data/csv/
+        - key_field: Model field identifying a row (default "code")
+        - columns: {model field: CSV column} copied onto each row
+        - position_field: Field set to the 1-based CSV row number, or None
+        - required: CSV columns that must be non-empty (rows missing one are skipped)
+
+EXAMPLE SUBCLASSES:
+    - apps/user_profiles/management/commands/import_genders.py
+    - apps/user_profiles/management/commands/import_civic_interest_areas.py
+
+    To import every reference file at once, use `seed_all`.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.utils.reference_sync import sync_reference_file, write_sync_report
+
+
+class BaseImportReferenceCommand(BaseCommand):
+    help = "Imports a reference-data CSV file into its lookup model."
+
+    model = None
+    file_name = None
+    key_field = "code"
+    columns = {"label": "label"}
+    position_field = "position"
+    required = ("code", "label")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report what would change without writing to the database.",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Import even if the file is unchanged since the last import.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="Rows per bulk_create / bulk_update statement.",
+        )
+
+    def get_file_path(self):
+        return settings.CSV_DATA_DIR / self.file_name
+
+    def sync(self, dry_run=False, force=False, batch_size=500):
+        """Runs the import and returns its `ReferenceSyncReport`."""
+        if not self.model:
+            raise CommandError("The 'model' attribute must be set in the subclass.")
+        if not self.file_name:
+            raise CommandError("The 'file_name' attribute must be set in the subclass.")
+
+        try:
+            return sync_reference_file(
+                self.model,
+                self.get_file_path(),
+                key_field=self.key_field,
+                columns=self.columns,
+                position_field=self.position_field,
+                required=self.required,
+                dry_run=dry_run,
+                force=force,
+                batch_size=batch_size,
+            )
+        except FileNotFoundError:
+            raise CommandError(f"❌ File not found: {self.get_file_path()}")
+        except UnicodeDecodeError as e:
+            raise CommandError(f"❌ {self.file_name} is not valid UTF-8: {e}")
+
+    def handle(self, *args, **options):
+        report = self.sync(
+            dry_run=options["dry_run"],
+            force=options["force"],
+            batch_size=options["batch_size"],
+        )
+        write_sync_report(self, report, verbosity=options["verbosity"])
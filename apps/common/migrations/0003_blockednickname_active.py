@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0002_blockednickname_modified_by_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockednickname',
+            name='active',
+            field=models.BooleanField(default=True, help_text='Only active words are enforced (sync can deactivate words removed from the CSV)'),
+        ),
+    ]
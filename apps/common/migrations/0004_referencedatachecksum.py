@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('common', '0003_blockednickname_active'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReferenceDataChecksum',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text="Import name (e.g. 'genders.csv → user_profiles.gender')", max_length=100, unique=True)),
+                ('sha256', models.CharField(help_text='SHA-256 of the file contents and the import definition', max_length=64)),
+                ('rows', models.PositiveIntegerField(default=0, help_text='Rows in the target table right after the import')),
+                ('synced_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Reference Data Checksum',
+                'verbose_name_plural': 'Reference Data Checksums',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -1 +1,2 @@
 from .blocked import BlockedNickname
+from .reference_checksum import ReferenceDataChecksum
@@ -15,6 +15,11 @@ class BlockedNickname(models.Model):
         help_text="Blocked word or nickname (e.g. slurs, political or ethnic insults)"
     )
 
+    active = models.BooleanField(
+        default=True,
+        help_text="Only active words are enforced (sync can deactivate words removed from the CSV)"
+    )
+
     added_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -0,0 +1,35 @@
+from django.db import models
+
+
+class ReferenceDataChecksum(models.Model):
+    """
+    Checksum of the last successfully imported version of a reference-data
+    CSV (see `apps/common/utils/reference_sync.py`). Lets importers skip
+    files that have not changed since.
+    """
+
+    name = models.CharField(
+        max_length=100,
+        unique=True,
+        help_text="Import name (e.g. 'genders.csv → user_profiles.gender')"
+    )
+
+    sha256 = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the file contents and the import definition"
+    )
+
+    rows = models.PositiveIntegerField(
+        default=0,
+        help_text="Rows in the target table right after the import"
+    )
+
+    synced_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Reference Data Checksum"
+        verbose_name_plural = "Reference Data Checksums"
+        ordering = ["name"]
+
+    def __str__(self):
+        return f"{self.name} ({self.sha256[:12]})"
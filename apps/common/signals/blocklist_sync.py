@@ -0,0 +1,43 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Rebuild the in-memory nickname blocklist when BlockedNickname changes
+# ------------------------------------------------------------------------------
+
+import threading
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from apps.common.models import BlockedNickname
+from apps.common.utils.profanity import profanity_matcher
+
+
+_state = threading.local()
+
+
+@contextmanager
+def bulk_blocklist_changes():
+    """
+    Mutes the per-row handler below on this thread and schedules a single
+    invalidation for the surrounding transaction instead. Use around bulk
+    writes (e.g. `import_blocked_nicknames`), inside `transaction.atomic()`.
+    """
+    _state.muted = True
+    try:
+        yield
+    finally:
+        _state.muted = False
+    transaction.on_commit(profanity_matcher.invalidate)
+
+
+def invalidate_profanity_matcher(sender, **kwargs):
+    """
+    Marks every process's blocklist matcher stale once the change commits.
+    """
+    if getattr(_state, "muted", False):
+        return
+    transaction.on_commit(profanity_matcher.invalidate)
+
+
+post_save.connect(invalidate_profanity_matcher, sender=BlockedNickname)
+post_delete.connect(invalidate_profanity_matcher, sender=BlockedNickname)
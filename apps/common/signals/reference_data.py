@@ -0,0 +1,9 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Reference data changed through a bulk import
+# ------------------------------------------------------------------------------
+
+from django.dispatch import Signal
+
+# Sent once a bulk reference import (which bypasses post_save / post_delete)
+# has committed changes to a lookup table. `sender` is the model.
+reference_data_synced = Signal()
@@ -1,3 +1,166 @@
-from django.test import TestCase
+import tempfile
+from io import StringIO
+from pathlib import Path
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from apps.common.models import BlockedNickname
+from apps.common.utils.profanity import BlockedTermMatcher, get_profanity_matcher, profanity_matcher
+from apps.common.validators.identity import validate_nickname
+
+
+class BlockedTermMatcherTests(SimpleTestCase):
+    """
+    Blocked terms are found through case, leetspeak, separators and repeated
+    letters; four-letter terms also match at the start or end of a word,
+    shorter ones only as whole words, and allowed names always pass.
+    """
+
+    def setUp(self):
+        self.matcher = BlockedTermMatcher(["Cunt", "dick", "ass", "boob", "fuck", "shit", "shithead"])
+
+    def test_exact_matches(self):
+        self.assertEqual(self.matcher.find("dick"), "dick")
+        self.assertEqual(self.matcher.find("Big DICK"), "dick")
+        self.assertEqual(self.matcher.find("shithead99"), "shithead")
+
+    def test_leet_and_repeated_letters(self):
+        self.assertEqual(self.matcher.find("sh1th3@d"), "shithead")
+        self.assertEqual(self.matcher.find("@ss"), "ass")
+        self.assertEqual(self.matcher.find("fuuuuck"), "fuck")
+
+    def test_spaced_out_matches(self):
+        self.assertEqual(self.matcher.find("d i c k"), "dick")
+        self.assertEqual(self.matcher.find("f.u_c-k"), "fuck")
+        self.assertEqual(self.matcher.find("s h i t h e a d"), "shithead")
+
+    def test_embedded_short_terms_do_not_block_names(self):
+        for name in ("Scunthorpe", "Dickson", "Hassan", "Cassandra", "Bob Dickens"):
+            with self.subTest(name=name):
+                self.assertIsNone(self.matcher.find(name))
+
+    def test_four_letter_terms_match_at_word_boundaries(self):
+        self.assertEqual(self.matcher.find("fuckface"), "fuck")
+        self.assertEqual(self.matcher.find("FuckFace"), "fuck")
+        self.assertEqual(self.matcher.find("sh1thead"), "shithead")
+        self.assertEqual(self.matcher.find("sh1tbag"), "shit")
+        self.assertEqual(self.matcher.find("Big mysh1t"), "shit")
+        self.assertEqual(self.matcher.find("cuuuntface"), "cunt")
+
+    def test_three_letter_terms_do_not_match_as_affixes(self):
+        for name in ("Class", "Assefa", "Bass"):
+            with self.subTest(name=name):
+                self.assertIsNone(self.matcher.find(name))
+
+    def test_allowed_words_skip_affix_and_substring_checks(self):
+        for name in ("Dickson", "Dickens", "Shitanda", "Amina Shitanda"):
+            with self.subTest(name=name):
+                self.assertIsNone(self.matcher.find(name))
+
+        matcher = BlockedTermMatcher(["dago", "nazi", "dickson"], allowed=["Dagoretti"])
+        self.assertIsNone(matcher.find("Dagoretti"))
+        self.assertEqual(matcher.find("Nazir"), "nazi")
+        # An allowed word that is itself a term is still blocked
+        self.assertEqual(matcher.find("Dickson"), "dickson")
+
+    def test_short_collapsed_terms_are_skipped(self):
+        # "boob" and "ass" collapse to "bob" and "as", which must not be terms
+        self.assertNotIn("bob", self.matcher.terms)
+        self.assertNotIn("as", self.matcher.terms)
+        self.assertIsNone(self.matcher.find("Bob"))
+        self.assertIsNone(self.matcher.find("A S"))
+        # The exact term itself is always kept
+        self.assertIn("boob", self.matcher.terms)
+
+
+class ProfanityMatcherSyncTests(TestCase):
+    """
+    The process-level matcher is rebuilt once blocklist changes commit, and
+    nickname validation reads it without queries.
+    """
+
+    def setUp(self):
+        profanity_matcher.invalidate()
+        self.addCleanup(profanity_matcher.invalidate)
+
+    def test_matcher_is_rebuilt_after_blocklist_changes(self):
+        self.assertIsNone(get_profanity_matcher().find("wanker"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            word = BlockedNickname.objects.create(word="wanker")
+        self.assertEqual(get_profanity_matcher().find("W4nk3r"), "wanker")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            word.active = False
+            word.save()
+        self.assertIsNone(get_profanity_matcher().find("wanker"))
+
+    def test_validate_nickname_uses_the_cached_matcher(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            BlockedNickname.objects.create(word="wanker")
+        get_profanity_matcher()
+
+        with self.assertNumQueries(0):
+            with self.assertRaises(ValidationError):
+                validate_nickname("w-4-n-k3r")
+            validate_nickname("Hassan")
+
+
+class ImportBlockedNicknamesTests(TestCase):
+    """
+    `import_blocked_nicknames` adds new words, reactivates returning ones and
+    prunes missing ones, matching stored words case-insensitively.
+    """
+
+    def setUp(self):
+        self.addCleanup(profanity_matcher.invalidate)
+
+    def run_import(self, *words, prune="none"):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "blocked_nicknames.csv"
+            path.write_text("word\n" + "\n".join(words) + "\n", encoding="utf-8")
+            out = StringIO()
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command("import_blocked_nicknames", file=path, prune=prune, stdout=out)
+        return out.getvalue()
+
+    def states(self):
+        return dict(BlockedNickname.objects.values_list("word", "active"))
+
+    def test_adds_new_words(self):
+        output = self.run_import("Wanker", " tosser ", "")
+
+        self.assertEqual(self.states(), {"wanker": True, "tosser": True})
+        self.assertIn("Created: 2", output)
+        self.assertEqual(get_profanity_matcher().find("t0ss3r"), "tosser")
+
+    def test_deactivates_and_reactivates(self):
+        BlockedNickname.objects.bulk_create(
+            [BlockedNickname(word="wanker"), BlockedNickname(word="tosser")]
+        )
+
+        output = self.run_import("wanker", prune="deactivate")
+        self.assertEqual(self.states(), {"wanker": True, "tosser": False})
+        self.assertIn("Deactivated: 1", output)
+        self.assertIsNone(get_profanity_matcher().find("tosser"))
+
+        output = self.run_import("wanker", "tosser")
+        self.assertEqual(self.states(), {"wanker": True, "tosser": True})
+        self.assertIn("Reactivated: 1", output)
+        self.assertIn("Unchanged: 1", output)
+
+    def test_mixed_case_stored_words_match_the_csv(self):
+        BlockedNickname.objects.bulk_create([
+            BlockedNickname(word="Wanker"),
+            BlockedNickname(word="ToSSer", active=False),
+        ])
+
+        output = self.run_import("wanker", "tosser", prune="delete")
+
+        # Neither re-created nor deleted; the inactive one is reactivated
+        self.assertEqual(self.states(), {"Wanker": True, "ToSSer": True})
+        self.assertIn("Created: 0", output)
+        self.assertIn("Reactivated: 1", output)
+        self.assertIn("Deleted: 0", output)
@@ -0,0 +1,117 @@
+# ────────────────────────────────────────────────────────────────
+# FILE: apps/common/utils/process_cache.py
+# PURPOSE: Process-level snapshots of rarely-changing data with
+#          cross-worker invalidation through Django's cache.
+# ────────────────────────────────────────────────────────────────
+
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+
+# Cache backends whose contents are not visible to other worker processes
+LOCAL_CACHE_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def cache_is_shared():
+    """True when the default cache is visible to every worker process."""
+    backend = settings.CACHES.get(DEFAULT_CACHE_ALIAS, {}).get("BACKEND", "")
+    return backend not in LOCAL_CACHE_BACKENDS
+
+
+class ProcessCache:
+    """
+    Holds a lazily-built, in-memory snapshot produced by `builder()`.
+
+    Each worker process builds its own snapshot on first use. A version
+    token kept in Django's cache lets one worker tell every other worker to
+    rebuild: `invalidate()` replaces the token, and `get()` re-checks it at
+    most once every `recheck_seconds`.
+
+    That only reaches other workers when the default cache is shared between
+    them (e.g. the database cache configured in prod.py). With a per-process
+    cache (LocMemCache, the default in base.py) `invalidate()` only rebuilds
+    the calling process, so every snapshot also expires after
+    CEENI_PROCESS_CACHE_LOCAL_MAX_AGE seconds to bound how stale the other
+    workers can get.
+
+    With `max_age` (seconds), a snapshot is also rebuilt once it is that old,
+    for derived data (e.g. counts) that nothing invalidates explicitly.
+    """
+
+    _EMPTY = object()
+
+    def __init__(self, name, builder, recheck_seconds=5, max_age=None):
+        self.name = name
+        self.builder = builder
+        self.recheck_seconds = recheck_seconds
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._value = self._EMPTY
+        self._version = None
+        self._checked_at = 0.0
+        self._built_at = 0.0
+
+    @property
+    def version_key(self):
+        return f"ceeni:process_cache:{self.name}:version"
+
+    @property
+    def version(self):
+        """Version of the snapshot currently held by this process (None if not built)."""
+        return self._version
+
+    @property
+    def effective_max_age(self):
+        """
+        `max_age`, capped by CEENI_PROCESS_CACHE_LOCAL_MAX_AGE when the
+        version counter cannot reach other workers.
+        """
+        if cache_is_shared():
+            return self.max_age
+        local_max_age = getattr(settings, "CEENI_PROCESS_CACHE_LOCAL_MAX_AGE", None)
+        if local_max_age is None:
+            return self.max_age
+        return local_max_age if self.max_age is None else min(self.max_age, local_max_age)
+
+    def get(self):
+        """
+        Returns the current snapshot, building it if missing or stale.
+        """
+        now = time.monotonic()
+        if self._value is not self._EMPTY and now - self._checked_at < self.recheck_seconds:
+            return self._value
+
+        shared_version = cache.get(self.version_key, 0)
+
+        with self._lock:
+            max_age = self.effective_max_age
+            expired = max_age is not None and now - self._built_at >= max_age
+            if self._value is self._EMPTY or self._version != shared_version or expired:
+                self._value = self.builder()
+                self._version = shared_version
+                self._built_at = now
+            self._checked_at = now
+            return self._value
+
+    def invalidate(self):
+        """
+        Drops this process's snapshot and replaces the shared version so
+        every other worker rebuilds on its next version check.
+
+        The new version is a fresh unique token rather than an incremented
+        counter: `cache.incr()` re-sets the key with the default timeout on
+        most backends, and a counter restarted after expiry or eviction can
+        land on a version a stale worker still holds.
+        """
+        cache.set(self.version_key, uuid.uuid4().hex, None)
+
+        with self._lock:
+            self._value = self._EMPTY
+            self._version = None
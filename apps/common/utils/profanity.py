@@ -0,0 +1,172 @@
+# ────────────────────────────────────────────────────────────────
+# FILE: apps/common/utils/profanity.py
+# PURPOSE: In-memory blocklist matcher for nicknames, built once
+#          per process from BlockedNickname and rebuilt on change.
+# ────────────────────────────────────────────────────────────────
+
+import re
+import unicodedata
+
+from apps.common.models import BlockedNickname
+from apps.common.utils.process_cache import ProcessCache
+
+# Common character substitutions used to dodge filters ("sh1t", "@ss")
+LEET_MAP = str.maketrans({
+    "0": "o",
+    "1": "i",
+    "!": "i",
+    "|": "l",
+    "3": "e",
+    "4": "a",
+    "@": "a",
+    "5": "s",
+    "$": "s",
+    "7": "t",
+    "8": "b",
+    "9": "g",
+})
+
+# Separators ignored when comparing ("b-i_t c h" → "bitch")
+SEPARATORS = re.compile(r"[\s_\-.]+")
+
+# Repeated letters ("fuuuck" → "fuck")
+REPEATS = re.compile(r"(.)\1+")
+
+# Terms this long match anywhere in the value ("xxwankerxx")
+SUBSTRING_MIN_LENGTH = 5
+
+# Shorter terms from this length match at the start or end of a word
+# ("fuckface", "sh1thead", "mysh1t"); anything shorter only matches whole
+# words or the whole nickname, so that e.g. "god" does not block "Godfrey"
+# and "hun" does not block "Hunter"
+AFFIX_MIN_LENGTH = 4
+
+# Known innocent words that start or end with, or contain, a blocked term
+# (Scunthorpe-style false positives). They are still blocked when they are a
+# term themselves; extend the list when a real name is rejected.
+ALLOWED_WORDS = frozenset({
+    "dickson", "dickens", "dickinson", "dickey",
+    "cockburn", "cockpit", "cocktail", "cockroach", "cockerel", "hancock", "peacock", "woodcock",
+    "dagoretti", "nazir", "nazira", "jockey", "nomad", "nomads", "nomadic",
+    "product", "producer", "prodigy", "tartan", "shaggy", "taffy", "feckless",
+    "mongare", "mongeri", "mongoose", "shitanda", "gashumba", "scunthorpe", "penistone",
+})
+
+# Collapsed variants shorter than this are dropped: collapsing "boob" to
+# "bob" or "ass" to "as" would otherwise block ordinary names and words
+COLLAPSED_MIN_LENGTH = 4
+
+
+def fold(value):
+    """
+    Lower-cases, strips diacritics ("é" → "e") and undoes leetspeak.
+    """
+    decomposed = unicodedata.normalize("NFKD", value.lower())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return stripped.translate(LEET_MAP)
+
+
+def compact(value):
+    """Folded value with every separator removed."""
+    return SEPARATORS.sub("", fold(value))
+
+
+def collapse(value):
+    return REPEATS.sub(r"\1", value)
+
+
+class BlockedTermMatcher:
+    """
+    Matches text against a blocklist held as frozensets of compacted terms.
+
+    A value is blocked when, after folding:
+    - any of its words, or the whole value without separators, is a term,
+    - one of its words starts or ends with a term of AFFIX_MIN_LENGTH to
+      SUBSTRING_MIN_LENGTH - 1 characters, or
+    - it contains a term of at least SUBSTRING_MIN_LENGTH characters.
+    Words in `allowed` (and a value that is one) skip the last two checks.
+
+    Each check is also repeated with repeated letters collapsed; a term's
+    collapsed variant is only kept from COLLAPSED_MIN_LENGTH characters up.
+    The cost depends only on the length of the value, never on the size of
+    the list.
+    """
+
+    def __init__(self, terms, allowed=ALLOWED_WORDS):
+        terms = [compact(term) for term in terms]
+        self.terms = frozenset(
+            [term for term in terms if term]
+            + [
+                collapsed
+                for collapsed in map(collapse, terms)
+                if len(collapsed) >= COLLAPSED_MIN_LENGTH
+            ]
+        )
+        self.substring_terms = frozenset(
+            term for term in self.terms if len(term) >= SUBSTRING_MIN_LENGTH
+        )
+        self.lengths = sorted({len(term) for term in self.substring_terms})
+        self.affix_terms = frozenset(
+            term for term in self.terms if AFFIX_MIN_LENGTH <= len(term) < SUBSTRING_MIN_LENGTH
+        )
+        self.affix_lengths = sorted({len(term) for term in self.affix_terms})
+        self.allowed = frozenset(compact(word) for word in allowed)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def find(self, value):
+        """Returns the first blocked term found in `value`, or None."""
+        folded = fold(value or "")
+        whole = SEPARATORS.sub("", folded)
+        words = [word for word in SEPARATORS.split(folded) if word]
+
+        # The value as typed first, so the reported term is stable
+        for candidate in dict.fromkeys((whole, collapse(whole))):
+            if candidate in self.terms:
+                return candidate
+            for word in words:
+                for variant in dict.fromkeys((word, collapse(word))):
+                    if variant in self.terms:
+                        return variant
+            if candidate in self.allowed or (len(words) == 1 and words[0] in self.allowed):
+                continue
+            for length in self.lengths:
+                if length > len(candidate):
+                    break
+                for start in range(len(candidate) - length + 1):
+                    fragment = candidate[start:start + length]
+                    if fragment in self.substring_terms:
+                        return fragment
+
+        # Short terms last, so a longer term in the same word is reported
+        for word in words:
+            if word in self.allowed:
+                continue
+            for variant in dict.fromkeys((word, collapse(word))):
+                for length in self.affix_lengths:
+                    if length >= len(variant):
+                        break
+                    for fragment in (variant[:length], variant[-length:]):
+                        if fragment in self.affix_terms:
+                            return fragment
+        return None
+
+    def contains(self, value):
+        return self.find(value) is not None
+
+
+def build_profanity_matcher():
+    """Reads every active blocked word (one query) into a `BlockedTermMatcher`."""
+    return BlockedTermMatcher(
+        BlockedNickname.objects.filter(active=True).values_list("word", flat=True)
+    )
+
+
+# Shared, process-level instance
+profanity_matcher = ProcessCache("blocked_nickname_matcher", build_profanity_matcher)
+
+
+def get_profanity_matcher():
+    """Returns this process's current blocklist matcher."""
+    return profanity_matcher.get()
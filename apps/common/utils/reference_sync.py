@@ -0,0 +1,237 @@
+# apps/common/utils/reference_sync.py
+
+"""
+Generic, checksum-aware sync of reference-data CSVs into lookup tables
+(genders, age ranges, education levels, ...).
+
+An import is declared, not coded: the model, the CSV file, the key field
+and the mapped fields (see `BaseImportReferenceCommand`). One file is then
+synced in five steps:
+    1. Hash the file together with the import definition; if the stored
+       `ReferenceDataChecksum` matches (and the table still has the rows it
+       had then), stop: the file is skipped without being parsed
+    2. Parse the CSV into {key: field values} (last row wins)
+    3. Load the existing rows of the table in one query
+    4. Diff: new keys are created, rows whose fields differ are updated
+    5. Apply bulk_create / bulk_update in batches and store the new
+       checksum, inside one transaction
+
+A dry run stops after step 4 and returns the same report without writing.
+Rows missing from the CSV are left alone (profiles point to them).
+
+Bulk writes bypass the model signals, so when rows were created or updated
+`reference_data_synced` is sent (sender: the model) once the transaction
+commits, for process-level caches of the table to drop their snapshot.
+"""
+
+import csv
+import hashlib
+import io
+import time
+from typing import NamedTuple
+
+from django.db import transaction
+
+from apps.common.models import ReferenceDataChecksum
+from apps.common.signals.reference_data import reference_data_synced
+
+
+class ReferenceSyncReport(NamedTuple):
+    """Outcome of syncing (or dry-running) one reference CSV file."""
+    name: str
+    model: type
+    file_name: str
+    checksum: str
+    skipped: bool        # Checksum unchanged: nothing parsed or written
+    created: list        # Keys of new rows
+    updated: dict        # {key: [changed field names]}
+    unchanged: int
+    invalid: int         # Rows missing a required column
+    duplicates: int      # Rows repeating a key already seen in the same file
+    seconds: float
+    dry_run: bool
+
+    @property
+    def status(self):
+        if self.skipped:
+            return "skipped"
+        return "changed" if self.created or self.updated else "unchanged"
+
+    def as_dict(self):
+        """JSON-serializable summary, for machine-readable reports."""
+        return {
+            "name": self.name,
+            "model": self.model._meta.label_lower,
+            "file": self.file_name,
+            "status": self.status,
+            "checksum": self.checksum,
+            "created": len(self.created),
+            "updated": len(self.updated),
+            "unchanged": self.unchanged,
+            "invalid": self.invalid,
+            "duplicates": self.duplicates,
+            "seconds": round(self.seconds, 4),
+            "dry_run": self.dry_run,
+        }
+
+
+def sync_name(model, file_path):
+    """Checksum key of one import: file name and target table."""
+    return f"{file_path.name} → {model._meta.label_lower}"
+
+
+def compute_checksum(content, definition):
+    """SHA-256 of the raw file bytes plus the import definition."""
+    digest = hashlib.sha256(content)
+    digest.update(repr(definition).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def checksum_is_current(name, checksum, row_count):
+    """
+    True when `name` was last imported from identical input and the table
+    still holds the rows it had then (so a wiped table is re-seeded).
+    """
+    return ReferenceDataChecksum.objects.filter(name=name, sha256=checksum, rows=row_count).exists()
+
+
+def record_checksum(name, checksum, row_count):
+    ReferenceDataChecksum.objects.update_or_create(
+        name=name, defaults={"sha256": checksum, "rows": row_count},
+    )
+
+
+def parse_reference_csv(content, key_column, columns, position_field=None, required=()):
+    """
+    Parses decoded CSV text into ({key: field values}, invalid, duplicates).
+    `columns` maps model fields to CSV columns; values are stripped strings.
+    With `position_field`, each row also gets its 1-based row number.
+    """
+    rows, invalid, duplicates = {}, 0, 0
+    reader = csv.DictReader(io.StringIO(content))
+    for position, row in enumerate(reader, start=1):
+        values = {field: (row.get(column) or "").strip() for field, column in columns.items()}
+        key = (row.get(key_column) or "").strip()
+        if not key or any(not (row.get(column) or "").strip() for column in required):
+            invalid += 1
+            continue
+        if position_field:
+            values[position_field] = position
+        if key in rows:
+            duplicates += 1
+        rows[key] = values
+    return rows, invalid, duplicates
+
+
+def sync_reference_file(
+    model,
+    file_path,
+    key_field,
+    columns,
+    key_column=None,
+    position_field=None,
+    required=(),
+    dry_run=False,
+    force=False,
+    batch_size=500,
+):
+    """
+    Syncs one reference CSV into `model`. Returns a `ReferenceSyncReport`.
+
+    `columns` maps model field names to CSV column names; the key is read
+    from `key_column` (default: `key_field`). Raises FileNotFoundError if
+    the file is missing.
+    """
+    start = time.perf_counter()
+    key_column = key_column or key_field
+    name = sync_name(model, file_path)
+
+    content = file_path.read_bytes()
+    definition = (model._meta.label_lower, key_field, key_column, sorted(columns.items()), position_field, required)
+    checksum = compute_checksum(content, definition)
+
+    def report(**kwargs):
+        values = dict(
+            name=name, model=model, file_name=file_path.name, checksum=checksum, skipped=False,
+            created=[], updated={}, unchanged=0, invalid=0, duplicates=0, dry_run=dry_run,
+        )
+        values.update(kwargs)
+        return ReferenceSyncReport(seconds=time.perf_counter() - start, **values)
+
+    if not force and checksum_is_current(name, checksum, model.objects.count()):
+        return report(skipped=True)
+
+    incoming, invalid, duplicates = parse_reference_csv(
+        content.decode("utf-8-sig"), key_column, columns, position_field, required,
+    )
+    fields = [*columns, *([position_field] if position_field else [])]
+
+    # One query: every existing row of the table, keyed by its key field
+    existing = {
+        getattr(obj, key_field): obj
+        for obj in model.objects.order_by().only("pk", key_field, *fields)
+    }
+
+    to_create, to_update, created, updated, unchanged = [], [], [], {}, 0
+    for key, values in incoming.items():
+        obj = existing.get(key)
+        if obj is None:
+            to_create.append(model(**{key_field: key}, **values))
+            created.append(key)
+            continue
+
+        changed = [field for field, value in values.items() if getattr(obj, field) != value]
+        if not changed:
+            unchanged += 1
+            continue
+
+        for field in changed:
+            setattr(obj, field, values[field])
+        to_update.append(obj)
+        updated[key] = changed
+
+    if not dry_run:
+        with transaction.atomic():
+            model.objects.bulk_create(to_create, batch_size=batch_size)
+            model.objects.bulk_update(to_update, fields, batch_size=batch_size)
+            record_checksum(name, checksum, len(existing) + len(to_create))
+            if to_create or to_update:
+                transaction.on_commit(lambda: reference_data_synced.send(sender=model))
+
+    return report(
+        created=created, updated=updated, unchanged=unchanged, invalid=invalid, duplicates=duplicates,
+    )
+
+
+def write_sync_report(command, report, verbosity=1):
+    """
+    Prints a report through a management command's stdout and style.
+    Verbosity 2 lists every created and updated key.
+    """
+    prefix = "[dry run] " if report.dry_run else ""
+    if report.skipped:
+        command.stdout.write(f"{prefix}{report.name}: unchanged since last import, skipped.")
+        return
+
+    command.stdout.write(
+        command.style.SUCCESS(
+            f"{prefix}{report.file_name} → {report.model.__name__}: "
+            f"{len(report.created)} created, {len(report.updated)} updated, "
+            f"{report.unchanged} unchanged in {report.seconds * 1000:.0f} ms."
+        )
+    )
+
+    if report.invalid:
+        command.stdout.write(
+            command.style.WARNING(f"  ⚠️ {report.invalid} rows skipped for missing required values.")
+        )
+    if report.duplicates:
+        command.stdout.write(
+            command.style.WARNING(f"  {report.duplicates} rows repeated an earlier key (last row kept).")
+        )
+
+    if verbosity > 1 or report.dry_run:
+        for key in report.created:
+            command.stdout.write(f"  + {key}")
+        for key, fields in report.updated.items():
+            command.stdout.write(f"  ~ {key} ({', '.join(fields)})")
@@ -1,7 +1,7 @@
 import phonenumbers
 import re
 from django.core.exceptions import ValidationError
-from apps.common.models import BlockedNickname  # Model-based profanity filtering
+from apps.common.utils.profanity import get_profanity_matcher  # In-memory blocklist matcher
 
 def validate_phone_e164(value):
     """
@@ -22,15 +22,10 @@ def validate_phone_e164(value):
 def contains_profanity(value):
     """
     Checks if the input value contains any blocked word (case-insensitive).
-    Normalizes spacing and punctuation before checking.
+    Catches separators, leetspeak, diacritics and longer terms embedded as
+    substrings; runs in memory with no queries (see utils/profanity.py).
     """
-    nickname = value.lower().strip().replace("_", " ").replace("-", " ")
-    words = nickname.split()
-
-    for word in words:
-        if BlockedNickname.objects.filter(word__iexact=word).exists():
-            return True
-    return False
+    return get_profanity_matcher().contains(value)
 
 
 def validate_nickname(value):
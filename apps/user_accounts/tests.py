@@ -1,3 +1,94 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.sessions.backends.db import SessionStore
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from apps.ceeni_captcha.models import CivicCaptcha
+from apps.ceeni_captcha.utils.pool_index import CaptchaPoolIndex, captcha_pool
+
+from .forms.auth_registration import RegistrationForm
+
+
+class RegistrationCaptchaTests(TestCase):
+    """
+    The captcha challenge is only picked when a form is going to be rendered:
+    valid submissions validate the challenge they carry and nothing more.
+    """
+
+    def setUp(self):
+        self.captcha = CivicCaptcha.objects.create(
+            question_text="How many counties does Kenya have?",
+            correct_answer="47",
+        )
+        captcha_pool.invalidate()
+        captcha_pool.get()  # warm the pool index, as a running worker would
+
+    def make_request(self, data=None):
+        factory = RequestFactory()
+        request = factory.post("/accounts/register/", data) if data else factory.get("/accounts/register/")
+        request.session = SessionStore()
+        return request
+
+    def signup_data(self, **overrides):
+        data = {
+            "phone_number": "+254712345678",
+            "nickname": "Baraka",
+            "password": "a-long-civic-passphrase",
+            "password_confirm": "a-long-civic-passphrase",
+            "captcha_slug": self.captcha.slug,
+            "captcha_response": "47",
+        }
+        data.update(overrides)
+        return data
+
+    def test_unbound_form_selects_a_challenge(self):
+        request = self.make_request()
+        form = RegistrationForm(request=request)
+
+        self.assertEqual(form.fields["captcha_slug"].initial, self.captcha.slug)
+        self.assertEqual(request.session["used_captcha_models"], ["civiccaptcha"])
+
+    def test_valid_post_skips_captcha_selection(self):
+        request = self.make_request(self.signup_data())
+
+        with mock.patch.object(CaptchaPoolIndex, "choose") as choose:
+            with CaptureQueriesContext(connection) as queries:
+                form = RegistrationForm(request.POST, request=request)
+                self.assertTrue(form.is_valid(), form.errors)
+
+        choose.assert_not_called()
+        self.assertNotIn("used_captcha_models", request.session)
+
+        # Only the answer lookup touches a captcha table
+        captcha_queries = [q["sql"] for q in queries.captured_queries if "ceeni_captcha_" in q["sql"]]
+        self.assertEqual(len(captcha_queries), 1, captcha_queries)
+
+    def test_failed_post_gets_a_fresh_challenge(self):
+        request = self.make_request(self.signup_data(captcha_response="42"))
+        form = RegistrationForm(request.POST, request=request)
+
+        self.assertFalse(form.is_valid())
+        self.assertEqual(request.session["used_captcha_models"], ["civiccaptcha"])
+
+        # Re-rendered form carries the new challenge and an empty answer box
+        self.assertEqual(form["captcha_slug"].value(), self.captcha.slug)
+        self.assertEqual(form["captcha_response"].value(), "")
+        self.assertEqual(form.fields["captcha_response"].label, self.captcha.question_text)
+
+    def test_token_mode_checks_the_token_once(self):
+        form = RegistrationForm(request=self.make_request(), token_mode=True)
+        token = form.fields["captcha_token"].initial
+        data = self.signup_data(captcha_slug="", captcha_token=token)
+
+        with CaptureQueriesContext(connection) as queries:
+            form = RegistrationForm(data, request=self.make_request(data), token_mode=True)
+            self.assertTrue(form.is_valid(), form.errors)
+        self.assertFalse([q["sql"] for q in queries.captured_queries if "ceeni_captcha_" in q["sql"]])
+
+        # A replayed token is refused and replaced by a fresh one
+        form = RegistrationForm(data, request=self.make_request(data), token_mode=True)
+        self.assertFalse(form.is_valid())
+        self.assertIn("already been used", str(form.errors))
+        self.assertNotEqual(form["captcha_token"].value(), token)
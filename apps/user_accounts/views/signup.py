@@ -48,7 +48,7 @@ def register(request):
             try:
                 profile = user.userprofile
                 profile.registration_ip = ip
-                profile.save()
+                profile.save(update_fields=["registration_ip"])
             except user.userprofile.RelatedObjectDoesNotExist:
                 pass
 
@@ -17,6 +17,7 @@ from .models import (
     UserProfile,
 )
 from apps.user_profiles.forms.profile_admin import UserProfileAdminForm
+from apps.user_profiles.utils.location_search import CONSTITUENCIES, WARDS, search_locations
 
 
 # -------------------------------------------------------------------------
@@ -92,23 +93,43 @@ class CountyAdmin(admin.ModelAdmin):
     list_per_page = 25
 
 
+class LocationSearchMixin:
+    """
+    Answers changelist and autocomplete searches from the in-memory location
+    index instead of `icontains` scans (search_fields stays declared, as
+    autocomplete_fields on other admins require it).
+    """
+    location_search_kind = None
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search_term.strip():
+            return queryset, False
+        return search_locations(queryset, self.location_search_kind, search_term, include_context=True), False
+
+
 @admin.register(Constituency)
-class ConstituencyAdmin(admin.ModelAdmin):
+class ConstituencyAdmin(LocationSearchMixin, admin.ModelAdmin):
     list_display = ("name", "county")
     list_display_links = ("name",)
-    search_fields = ("name", "county__name", "county__code")
+    list_select_related = ("county",)
+    search_fields = ("name", "display_path", "county__code")
+    location_search_kind = CONSTITUENCIES
     list_filter = ("county",)
-    ordering = ("county__code", "name")
+    ordering = ("county_code", "name")
+    readonly_fields = ("county_code", "display_path")
     list_per_page = 25
 
 
 @admin.register(Ward)
-class WardAdmin(admin.ModelAdmin):
-    list_display = ("name", "constituency", "get_county", "latitude", "longitude")
+class WardAdmin(LocationSearchMixin, admin.ModelAdmin):
+    list_display = ("name", "constituency_name", "get_county", "latitude", "longitude")
     list_display_links = ("name",)
-    search_fields = ("name", "constituency__name", "constituency__county__name")
+    list_select_related = ("constituency__county",)
+    search_fields = ("name", "display_path")
+    location_search_kind = WARDS
     list_filter = ("constituency__county", "constituency")
-    ordering = ("constituency__county__code", "constituency__name", "name")
+    ordering = ("county_code", "constituency_name", "name")
+    readonly_fields = ("county_code", "constituency_name", "display_path")
     list_per_page = 25
 
     def get_county(self, obj):
@@ -132,6 +153,7 @@ class UserProfileAdmin(admin.ModelAdmin):
         "user",
         "profile_image_thumb",
         "completion_bar",
+        "next_wizard_screen",
         "age_range",
         "gender",
         "education_level",
@@ -149,6 +171,7 @@ class UserProfileAdmin(admin.ModelAdmin):
     )
     search_fields = ("user__username", "user__email", "whatsapp_opt_in_number")
     list_filter = (
+        "next_wizard_screen",
         "gender",
         "education_level",
         "residency_type",
@@ -159,6 +182,7 @@ class UserProfileAdmin(admin.ModelAdmin):
     readonly_fields = (
         "profile_image_thumb",
         "completion_percentage",
+        "next_wizard_screen",
         "registered_at",
         "registration_ip",
         "country_from_phone_code",
@@ -219,7 +243,7 @@ class UserProfileAdmin(admin.ModelAdmin):
         }),
         ("Completion", {
             "classes": ("collapse",),
-            "fields": ("completion_percentage",),
+            "fields": ("completion_percentage", "next_wizard_screen"),
         }),
     )
 
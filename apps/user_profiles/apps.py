@@ -15,3 +15,9 @@ class UserProfilesConfig(AppConfig):
     def ready(self):
         # Import signal handlers when app is ready — critical for profile auto-creation
         import apps.user_profiles.signals.auto_user_profile_creator
+        # Keeps interest count, completion and next wizard screen in step with civic interests
+        import apps.user_profiles.signals.civic_interest_sync
+        # Rebuilds the in-memory location hierarchy after location edits
+        import apps.user_profiles.signals.location_hierarchy_sync
+        # Rebuilds the cached wizard choices after reference-table edits and imports
+        import apps.user_profiles.signals.reference_choices_sync
@@ -2,3 +2,14 @@
 
 # Total number of steps in the onboarding wizard
 TOTAL_WIZARD_STEPS = 7
+
+# Wizard screens as stored in UserProfile.next_wizard_screen (URL name, label)
+WIZARD_SCREEN_CHOICES = [
+    ("user_profiles:screen_1", "1 · Basic info"),
+    ("user_profiles:screen_2", "2 · Location"),
+    ("user_profiles:screen_3", "3 · Origin & residency"),
+    ("user_profiles:screen_4", "4 · Civic interests"),
+    ("user_profiles:screen_5", "5 · Communication"),
+    ("user_profiles:screen_6", "6 · Referral source"),
+    ("user_profiles:screen_7", "7 · Confirmation"),
+]
@@ -0,0 +1,122 @@
+# ──────────────────────────────────────────────────────────────────────────
+# FILE: apps/user_profiles/forms/reference_fields.py
+# PURPOSE: Choice fields for the reference tables, backed by the
+#          process-level snapshots in utils/reference_choices.py.
+#          They render and validate without a single query.
+# ──────────────────────────────────────────────────────────────────────────
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator
+
+from apps.user_profiles.utils.reference_choices import get_choice_snapshot, reference_choices
+
+
+class CachedChoiceIterator(ModelChoiceIterator):
+    """Yields a cached field's choices from its snapshot instead of its queryset."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.field.snapshot.objects:
+            yield self.choice(obj)
+
+    def __len__(self):
+        return len(self.field.snapshot) + (1 if self.field.empty_label is not None else 0)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.snapshot)
+
+
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """
+    ModelChoiceField over a whole reference table, read from its snapshot.
+    - `queryset` only names the model; it is never evaluated.
+    - A posted id is checked against the snapshot and cleaned to a copy of
+      the cached row.
+    """
+
+    iterator = CachedChoiceIterator
+
+    @property
+    def snapshot(self):
+        return get_choice_snapshot(self.queryset.model)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        self.validate_no_null_characters(value)
+        if isinstance(value, self.queryset.model):
+            value = value.pk
+        obj = self.snapshot.get(value)
+        if obj is None:
+            raise ValidationError(
+                self.error_messages["invalid_choice"],
+                code="invalid_choice",
+                params={"value": value},
+            )
+        return obj
+
+
+class CachedModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """
+    ModelMultipleChoiceField over a whole reference table, read from its
+    snapshot. Cleans to a list of copies of the cached rows (snapshot order)
+    rather than a queryset.
+    """
+
+    iterator = CachedChoiceIterator
+
+    @property
+    def snapshot(self):
+        return get_choice_snapshot(self.queryset.model)
+
+    def clean(self, value):
+        value = self.prepare_value(value)
+        if self.required and not value:
+            raise ValidationError(self.error_messages["required"], code="required")
+        elif not self.required and not value:
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError(self.error_messages["invalid_list"], code="invalid_list")
+
+        snapshot = self.snapshot
+        for key in value:
+            self.validate_no_null_characters(key)
+            if key not in snapshot:
+                raise ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": key},
+                )
+        self.run_validators(value)
+        return snapshot.select(value)
+
+
+def reference_formfield(db_field, **kwargs):
+    """
+    ModelForm `formfield_callback`: relations to a cached reference table
+    get a cached choice field, every other field its default form field.
+    """
+    if db_field.is_relation and db_field.related_model in reference_choices:
+        kwargs.setdefault(
+            "form_class",
+            CachedModelMultipleChoiceField if db_field.many_to_many else CachedModelChoiceField,
+        )
+    return db_field.formfield(**kwargs)
+
+
+class ReferenceChoicesFormMixin:
+    """
+    For ModelForms using `reference_formfield`. Cached fields have already
+    validated their value against the snapshot, so model validation skips
+    them (ForeignKey.validate() would query for each id again).
+    """
+
+    def _get_validation_exclusions(self):
+        exclude = super()._get_validation_exclusions()
+        exclude.update(
+            name for name, field in self.fields.items()
+            if isinstance(field, (CachedModelChoiceField, CachedModelMultipleChoiceField))
+        )
+        return exclude
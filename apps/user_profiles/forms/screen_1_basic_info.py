@@ -5,10 +5,11 @@
 # ──────────────────────────────────────────────────────────────────────────
 
 from django import forms
+from apps.user_profiles.forms.reference_fields import ReferenceChoicesFormMixin, reference_formfield
 from apps.user_profiles.models import UserProfile
 
 
-class Screen1BasicInfoForm(forms.ModelForm):
+class Screen1BasicInfoForm(ReferenceChoicesFormMixin, forms.ModelForm):
     """
     Step 1: Basic Info Form
     - Captures age range, gender, and education level.
@@ -17,6 +18,7 @@ class Screen1BasicInfoForm(forms.ModelForm):
 
     class Meta:
         model = UserProfile
+        formfield_callback = reference_formfield  # cached reference choices
         fields = ['age_range', 'gender', 'education_level']
 
         widgets = {
@@ -1,19 +1,30 @@
 # apps/user_profiles/forms/screen_2_location.py
 
 from django import forms
+from django.conf import settings
 from django.urls import reverse_lazy
+from apps.user_profiles.forms.reference_fields import ReferenceChoicesFormMixin, reference_formfield
 from apps.user_profiles.models import UserProfile
+from apps.user_profiles.utils.location_bundle import get_location_bundle_url
 
 
-class Screen2LocationForm(forms.ModelForm):
+class Screen2LocationForm(ReferenceChoicesFormMixin, forms.ModelForm):
     """
     Step 2: Location Info Form
     HTMX attributes are entirely on the form’s widgets so the template
     just loops over form fields and gets dynamic loading “for free.”
+
+    Client-side mode (`client_filter=True`, default from
+    CEENI_LOCATION_CLIENT_FILTER): when a location bundle has been built
+    (`build_location_bundle`), `location_bundle_url` is set and the county
+    select carries it as `data-location-bundle`. location_filter.js then
+    fills the dropdowns from that one cached download; the HTMX endpoints
+    stay in place as the fallback.
     """
 
     class Meta:
         model = UserProfile
+        formfield_callback = reference_formfield  # cached reference choices
         fields = ['county', 'constituency', 'ward']
         widgets = {
             'county': forms.Select(attrs={
@@ -59,8 +70,16 @@ class Screen2LocationForm(forms.ModelForm):
             'ward': 'Filtered by constituency selection.',
         }
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, client_filter=None, **kwargs):
         super().__init__(*args, **kwargs)
+        if client_filter is None:
+            client_filter = getattr(settings, "CEENI_LOCATION_CLIENT_FILTER", False)
+
+        # None until a bundle exists, so the HTMX path is used on its own
+        self.location_bundle_url = get_location_bundle_url() if client_filter else None
+        if self.location_bundle_url:
+            self.fields['county'].widget.attrs['data-location-bundle'] = self.location_bundle_url
+
         # All fields required
         for field in self.fields.values():
             field.required = True
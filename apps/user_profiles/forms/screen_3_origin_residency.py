@@ -2,6 +2,7 @@
 
 from django import forms
 from django_countries.widgets import CountrySelectWidget
+from apps.user_profiles.forms.reference_fields import ReferenceChoicesFormMixin, reference_formfield
 from apps.user_profiles.models import UserProfile
 
 # Shared Tailwind Select styling
@@ -11,7 +12,7 @@ BASE_SELECT_CLS = (
     "focus:outline-none focus:ring-2 focus:ring-green-600"
 )
 
-class Screen3OriginResidencyForm(forms.ModelForm):
+class Screen3OriginResidencyForm(ReferenceChoicesFormMixin, forms.ModelForm):
     """
     Step 3: Origin & Residency Form
     - Captures ancestral county, current country, and residency type.
@@ -21,6 +22,7 @@ class Screen3OriginResidencyForm(forms.ModelForm):
 
     class Meta:
         model = UserProfile
+        formfield_callback = reference_formfield  # cached reference choices
         fields = [
             'county_of_origin',
             'current_country_of_residence',
@@ -1,8 +1,9 @@
 from django import forms
+from apps.user_profiles.forms.reference_fields import ReferenceChoicesFormMixin, reference_formfield
 from apps.user_profiles.models import UserProfile
 
 
-class Screen4CivicInterestsForm(forms.ModelForm):
+class Screen4CivicInterestsForm(ReferenceChoicesFormMixin, forms.ModelForm):
     """
     Step 4: Civic Interests & Participation
     - Captures user civic interests and engagement familiarity.
@@ -32,6 +33,7 @@ class Screen4CivicInterestsForm(forms.ModelForm):
 
     class Meta:
         model = UserProfile
+        formfield_callback = reference_formfield  # cached reference choices
         fields = ['civic_interest_areas', 'has_voted_before', 'knows_voting_process']
 
         widgets = {
@@ -56,6 +58,6 @@ class Screen4CivicInterestsForm(forms.ModelForm):
 
     def clean_civic_interest_areas(self):
         interests = self.cleaned_data.get('civic_interest_areas')
-        if interests and interests.count() > 5:
+        if interests and len(interests) > 5:
             raise forms.ValidationError("You can select up to 5 civic interests.")
         return interests
@@ -1,6 +1,7 @@
 # apps/user_profiles/forms/screen_6_referral_source.py
 
 from django import forms
+from apps.user_profiles.forms.reference_fields import ReferenceChoicesFormMixin, reference_formfield
 from apps.user_profiles.models import UserProfile
 
 # Shared Tailwind Select styling
@@ -10,7 +11,7 @@ BASE_SELECT_CLS = (
     "focus:outline-none focus:ring-2 focus:ring-green-600"
 )
 
-class Screen6ReferralSourceForm(forms.ModelForm):
+class Screen6ReferralSourceForm(ReferenceChoicesFormMixin, forms.ModelForm):
     """
     Step 6: Referral Source
     - Captures how the user heard about CEENI.
@@ -18,6 +19,7 @@ class Screen6ReferralSourceForm(forms.ModelForm):
 
     class Meta:
         model = UserProfile
+        formfield_callback = reference_formfield  # cached reference choices
         fields = ['referral_source']
         widgets = {
             'referral_source': forms.Select(attrs={'class': BASE_SELECT_CLS}),
@@ -0,0 +1,102 @@
+"""
+FILE: apps/user_profiles/management/commands/benchmark_ward_locator.py
+
+PURPOSE:
+    Micro-benchmark for the "detect my ward" lookup. Random points inside
+    Kenya's bounding box are resolved to their nearest wards by:
+        - locator: `WardLocator.nearest()` over the in-memory grid buckets
+                   (what the nearest_wards endpoint uses)
+        - scan:    a naive ORM scan, i.e. reading every ward with coordinates
+                   and sorting them all by haversine distance, per query
+
+    Both must return the same wards; the command fails otherwise.
+    Needs the locations imported (import_kenyan_locations).
+
+USAGE:
+    python manage.py benchmark_ward_locator
+    python manage.py benchmark_ward_locator --iterations 5000 --limit 5 --cell-degrees 0.1
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.user_profiles.models import Ward
+from apps.user_profiles.utils.location_hierarchy import build_location_hierarchy
+from apps.user_profiles.utils.ward_locator import WardLocator, haversine_km
+
+# (min_lat, max_lat, min_lng, max_lng), roughly Kenya
+KENYA_BOUNDS = (-4.7, 5.0, 33.9, 41.9)
+
+
+def orm_scan(latitude, longitude, limit):
+    """Nearest ward ids the naive way: every row, every distance, full sort."""
+    rows = Ward.objects.filter(latitude__isnull=False, longitude__isnull=False).values_list(
+        "pk", "latitude", "longitude",
+    )
+    ranked = sorted(rows, key=lambda row: haversine_km(latitude, longitude, row[1], row[2]))
+    return [row[0] for row in ranked[:limit]]
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the in-memory nearest-ward locator against a naive ORM scan."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=2_000,
+            help="Locator lookups to time.",
+        )
+        parser.add_argument(
+            "--limit", type=int, default=3,
+            help="Wards returned per lookup.",
+        )
+        parser.add_argument(
+            "--cell-degrees", type=float, default=0.25,
+            help="Grid cell size of the locator, in degrees.",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42,
+            help="Random seed for the query points.",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        limit = options["limit"]
+        rng = random.Random(options["seed"])
+        min_lat, max_lat, min_lng, max_lng = KENYA_BOUNDS
+        points = [
+            (rng.uniform(min_lat, max_lat), rng.uniform(min_lng, max_lng))
+            for _ in range(iterations)
+        ]
+
+        start = time.perf_counter()
+        locator = WardLocator(build_location_hierarchy(), cell_degrees=options["cell_degrees"])
+        build_ms = (time.perf_counter() - start) * 1000
+        if not len(locator):
+            raise CommandError("No wards with coordinates. Run import_kenyan_locations first.")
+
+        # Locator
+        start = time.perf_counter()
+        for latitude, longitude in points:
+            locator.nearest(latitude, longitude, limit=limit)
+        locator_us = (time.perf_counter() - start) / iterations * 1_000_000
+
+        # Naive ORM scan (fewer rounds — it is slow), checked against the locator
+        scan_rounds = max(1, iterations // 20)
+        start = time.perf_counter()
+        expected = [orm_scan(latitude, longitude, limit) for latitude, longitude in points[:scan_rounds]]
+        scan_us = (time.perf_counter() - start) / scan_rounds * 1_000_000
+
+        for (latitude, longitude), ids in zip(points, expected):
+            found = [ward.ward_id for ward in locator.nearest(latitude, longitude, limit=limit)]
+            if found != ids:
+                raise CommandError(f"Mismatch at ({latitude:.5f}, {longitude:.5f}): {found} != {ids}")
+
+        self.stdout.write(f"{len(locator)} wards, {len(locator.cells)} grid cells, built in {build_ms:.1f} ms")
+        self.stdout.write(f"{'method':>10} {'µs/op':>12}")
+        self.stdout.write(f"{'locator':>10} {locator_us:>12.2f}")
+        self.stdout.write(f"{'orm scan':>10} {scan_us:>12.2f}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Benchmark completed ({scan_us / locator_us:.0f}× faster, {scan_rounds} results cross-checked)."
+        ))
@@ -0,0 +1,63 @@
+"""
+FILE: apps/user_profiles/management/commands/build_location_bundle.py
+
+PURPOSE:
+    Compiles the County → Constituency → Ward hierarchy into one compact,
+    content-hashed JSON asset for client-side filtering of the location
+    dropdowns (Screen2LocationForm), plus a manifest naming the current file:
+
+        build/static/user_profiles/locations/locations.<hash>.json
+        build/static/user_profiles/locations/manifest.json
+
+    build/static is CEENI_STATIC_BUILD_DIR, a STATICFILES_DIRS entry outside
+    the source tree, so collectstatic picks the bundle up. import_kenyan_locations
+    (and so seed_all) rebuilds it after every import; run this command to
+    change options such as --coordinates. Older bundles beyond --keep are
+    pruned. Until a bundle exists, the form keeps using the HTMX endpoints.
+
+USAGE:
+    python manage.py build_location_bundle
+    python manage.py build_location_bundle --coordinates --keep 1
+    python manage.py build_location_bundle --output-dir /tmp/locations
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.user_profiles.utils.location_bundle import write_location_bundle
+from apps.user_profiles.utils.location_hierarchy import build_location_hierarchy
+
+
+class Command(BaseCommand):
+    help = "Builds the hashed static JSON bundle of counties, constituencies and wards."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            help="Directory to write to (default: build/static/user_profiles/locations).",
+        )
+        parser.add_argument(
+            "--coordinates", action="store_true",
+            help="Include ward latitude/longitude in the bundle.",
+        )
+        parser.add_argument(
+            "--keep", type=int, default=3,
+            help="Number of bundles (including the new one) to keep on disk.",
+        )
+
+    def handle(self, *args, **options):
+        hierarchy = build_location_hierarchy()
+        if not hierarchy.county_ids:
+            raise CommandError("No counties found. Run import_kenyan_locations first.")
+
+        manifest = write_location_bundle(
+            hierarchy,
+            output_dir=options["output_dir"],
+            coordinates=options["coordinates"],
+            keep=options["keep"],
+        )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Location bundle written: {manifest['bundle']} ({manifest['bytes']:,} bytes; "
+            f"{manifest['counties']} counties, {manifest['constituencies']} constituencies, "
+            f"{manifest['wards']} wards)."
+        ))
@@ -1,49 +1,16 @@
-import csv
-from django.core.management.base import BaseCommand
-from apps.user_profiles.models import AgeRange
-from config.settings.base import CSV_DATA_DIR
+# ------------------------------------------------------------------------------
+# CEENI Command: Import Age Ranges from CSV (code, label)
+# Declarative sync (see apps/common/utils/reference_sync.py): rows are keyed
+# by code, positioned by CSV row order, created or updated in bulk, and the
+# file is skipped when unchanged since the last import.
+# ------------------------------------------------------------------------------
 
-class Command(BaseCommand):
-    help = "Imports age ranges from CSV (code, label), assigns position by row order"
-
-    def handle(self, *args, **kwargs):
-        filepath = CSV_DATA_DIR / "age_ranges.csv"
-        created_count = 0
-        skipped_count = 0
+from apps.common.management.commands.base_import_reference import BaseImportReferenceCommand
+from apps.user_profiles.models.demographics import AgeRange
 
-        with open(filepath, newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for idx, row in enumerate(reader):
-                code = row["code"].strip()
-                label = row["label"].strip()
-                position = idx + 1
 
-                age_range, created = AgeRange.objects.get_or_create(
-                    code=code,
-                    defaults={
-                        "label": label,
-                        "position": position
-                    }
-                )
-
-                if created:
-                    self.stdout.write(self.style.SUCCESS(f"[CREATED] {label} ({code})"))
-                    created_count += 1
-                else:
-                    # Update label and position if they differ
-                    updated = False
-                    if age_range.label != label:
-                        age_range.label = label
-                        updated = True
-                    if age_range.position != position:
-                        age_range.position = position
-                        updated = True
-                    if updated:
-                        age_range.save()
-                        self.stdout.write(self.style.WARNING(f"[UPDATED] {label} ({code})"))
-                    else:
-                        self.stdout.write(f"[SKIPPED] {label} ({code})")
-                    skipped_count += 1
+class Command(BaseImportReferenceCommand):
+    help = "Imports age ranges from CSV (code, label), assigns position by row order"
 
-        self.stdout.write(f"\n✅ Created: {created_count}")
-        self.stdout.write(f"⚠️ Skipped/Updated: {skipped_count}")
+    model = AgeRange
+    file_name = "age_ranges.csv"
@@ -1,64 +1,16 @@
 # ------------------------------------------------------------------------------
-# Import Education Levels from CSV with code, label fields and row-order position.
-# Updates label or position if already exists.
+# CEENI Command: Import Education Levels from CSV (code, label)
+# Declarative sync (see apps/common/utils/reference_sync.py): rows are keyed
+# by code, positioned by CSV row order, created or updated in bulk, and the
+# file is skipped when unchanged since the last import.
 # ------------------------------------------------------------------------------
 
-import csv
-from django.core.management.base import BaseCommand
-from django.conf import settings
+from apps.common.management.commands.base_import_reference import BaseImportReferenceCommand
 from apps.user_profiles.models.education import EducationLevel
 
-CSV_PATH = settings.CSV_DATA_DIR / "education_levels.csv"
 
-class Command(BaseCommand):
+class Command(BaseImportReferenceCommand):
     help = "Import education levels from data/csv/education_levels.csv"
 
-    def handle(self, *args, **options):
-        if not CSV_PATH.exists():
-            self.stderr.write(self.style.ERROR(f"❌ File not found: {CSV_PATH}"))
-            return
-
-        created, skipped = 0, 0
-
-        with open(CSV_PATH, newline='', encoding='utf-8-sig') as file:
-            reader = csv.DictReader(file)
-
-            for idx, row in enumerate(reader, start=1):
-                code = row.get("code", "").strip()
-                label = row.get("label", "").strip()
-
-                if not code or not label:
-                    self.stderr.write(self.style.WARNING("⚠️ Skipping row with missing code or label"))
-                    continue
-
-                level, created_flag = EducationLevel.objects.get_or_create(
-                    code=code,
-                    defaults={
-                        "label": label,
-                        "position": idx
-                    }
-                )
-
-                if not created_flag:
-                    updated = False
-
-                    if level.label != label:
-                        level.label = label
-                        updated = True
-
-                    if level.position != idx:
-                        level.position = idx
-                        updated = True
-
-                    if updated:
-                        level.save()
-                        self.stdout.write(self.style.WARNING(f"[UPDATED] {label} ({code})"))
-                    else:
-                        skipped += 1
-                        self.stdout.write(f"[SKIPPED] {label} ({code}) already exists")
-                else:
-                    created += 1
-                    self.stdout.write(self.style.SUCCESS(f"[CREATED] {label} ({code})"))
-
-        self.stdout.write(self.style.SUCCESS(f"\n✅ Created: {created}"))
-        self.stdout.write(self.style.WARNING(f"⚠️ Skipped (existing or updated): {skipped}"))
+    model = EducationLevel
+    file_name = "education_levels.csv"
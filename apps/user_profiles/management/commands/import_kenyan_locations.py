@@ -1,13 +1,89 @@
 # ------------------------------------------------------------------------------
 # CEENI Command: Import County → Constituency → Ward hierarchy from CSV
 # ------------------------------------------------------------------------------
+#
+# Bulk loader. Both CSVs are parsed once and deduplicated in memory, then the
+# database is brought in line level by level (counties, constituencies,
+# wards), inside ONE transaction:
+#
+#     - one read per level to resolve existing ids
+#     - bulk_create(ignore_conflicts=True) for missing rows, then one re-read
+#       to pick up their ids
+#     - bulk_update for renamed, moved, recoded or re-positioned rows
+#
+# Rows are matched by name within their parent. Unmatched pairs are then
+# recognised as:
+#     renamed  county: same code; constituency: same county and same ward
+#              names; ward: same constituency and same coordinates
+#     moved    constituency: same name, unique, under another county;
+#              ward: same name, unique, under another constituency of the
+#              same county
+# Rows missing from the CSV are reported, never deleted (profiles point to
+# them).
+#
+# The in-memory location hierarchy and the captcha pool (which generates
+# location captchas) are invalidated once the transaction commits, and
+# `reference_data_synced` is sent for County (cached county choices).
+#
+# The checksum of both CSVs is stored (ReferenceDataChecksum); while the files
+# and the ward table are unchanged, later runs skip the import (--force to
+# re-run anyway).
+#
+# After an import, the static location bundle (utils/location_bundle.py) is
+# rebuilt under CEENI_STATIC_BUILD_DIR so the client-side filter matches the
+# database; a skipped import only builds it if none exists (--skip-bundle to
+# leave it alone).
+#
+# USAGE:
+#     python manage.py import_kenyan_locations
+#     python manage.py import_kenyan_locations --dry-run -v 2
+#     python manage.py import_kenyan_locations --force
+#     python manage.py import_kenyan_locations --skip-bundle
+# ------------------------------------------------------------------------------
 
 import csv
-from collections import defaultdict
-from django.core.management.base import BaseCommand
+import math
+from collections import Counter, defaultdict
+from pathlib import Path
+
 from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
 
+from apps.ceeni_captcha.utils.pool_index import captcha_pool
+from apps.common.signals.reference_data import reference_data_synced
+from apps.common.utils.reference_sync import checksum_is_current, compute_checksum, record_checksum
 from apps.user_profiles.models.locations import County, Constituency, Ward
+from apps.user_profiles.utils.location_bundle import read_location_manifest, rebuild_location_bundle
+from apps.user_profiles.utils.location_hierarchy import build_location_hierarchy, location_hierarchy
+from apps.user_profiles.utils.location_paths import rebuild_location_paths
+
+BATCH_SIZE = 1000
+
+# ReferenceDataChecksum name; bump the version when the matching rules change
+CHECKSUM_NAME = "kenyan_locations → user_profiles.ward"
+CHECKSUM_DEFINITION = ("import_kenyan_locations", 1)
+
+# Diff categories, in report order
+CHANGE_KINDS = ("added", "renamed", "moved", "recoded", "coordinates", "unchanged", "missing")
+
+
+def parse_coordinate(value):
+    value = (value or "").strip()
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def same_coordinate(a, b):
+    if a is None or b is None:
+        return a is b
+    return math.isclose(a, b, abs_tol=1e-9)
+
+
+class DryRunRollback(Exception):
+    """Raised to roll the import back after reporting (--dry-run)."""
 
 
 class Command(BaseCommand):
@@ -15,83 +91,343 @@ class Command(BaseCommand):
 
     help = "Import counties, constituencies, and wards from structured CSV data"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--counties-file",
+            default=settings.CSV_DATA_DIR / "counties.csv",
+            help="CSV of county codes and names.",
+        )
+        parser.add_argument(
+            "--locations-file",
+            default=settings.CSV_DATA_DIR / "kenya_county_constituency_ward_latitude_longitude.csv",
+            help="CSV of County, Constituency, Ward, Latitude, Longitude rows.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Compute and report the diff, then roll everything back.",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Import even if the CSVs are unchanged since the last import.",
+        )
+        parser.add_argument(
+            "--skip-bundle", action="store_true",
+            help="Don't rebuild the static location bundle afterwards.",
+        )
+
     def handle(self, *args, **options):
-        counties_path = settings.CSV_DATA_DIR / "counties.csv"
-        locations_path = settings.CSV_DATA_DIR / "kenya_county_constituency_ward_latitude_longitude.csv"
+        self.verbosity = options["verbosity"]
+        self.diff = {level: Counter() for level in ("counties", "constituencies", "wards")}
+        self.skipped = False
 
-        if not counties_path.exists() or not locations_path.exists():
+        try:
+            checksum = compute_checksum(
+                Path(options["counties_file"]).read_bytes() + Path(options["locations_file"]).read_bytes(),
+                CHECKSUM_DEFINITION,
+            )
+        except FileNotFoundError:
             self.stderr.write(self.style.ERROR("❌ One or more CSV files not found."))
             return
+        if not options["force"] and checksum_is_current(CHECKSUM_NAME, checksum, Ward.objects.count()):
+            self.skipped = True
+            self.stdout.write(f"{CHECKSUM_NAME}: unchanged since last import, skipped.")
+            if not options["skip_bundle"]:
+                self.update_bundle(rebuild=False)
+            return
 
         # ----------------------------------------------------------------------
-        # Step 1: Load County Code Lookup from counties.csv
+        # Step 1: Parse both CSVs once
         # ----------------------------------------------------------------------
-        county_lookup = {}
-
-        with open(counties_path, newline='', encoding="utf-8-sig") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                name = row.get("name", "").strip()
-                code = row.get("code", "").strip().zfill(3)
-                if name and code:
-                    county_lookup[name] = code
-
-        # Validate lookup
-        if not county_lookup:
-            self.stderr.write(self.style.ERROR("❌ No valid counties found in counties.csv"))
+        parsed = self.parse_csvs(options["counties_file"], options["locations_file"])
+        if parsed is None:
             return
+        county_codes, locations, skipped = parsed
 
         # ----------------------------------------------------------------------
-        # Step 2: Import Main Hierarchy from long CSV
+        # Step 2: Sync each level in one transaction
         # ----------------------------------------------------------------------
-        created = defaultdict(int)
-        skipped = 0
-
-        with open(locations_path, newline='', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                county_name = row["County"].strip()
-                constituency_name = row["Constituency"].strip()
-                ward_name = row["Ward"].strip()
-                lat = row.get("Latitude", "").strip()
-                lng = row.get("Longitude", "").strip()
-
-                if not all([county_name, constituency_name, ward_name]):
-                    self.stderr.write(self.style.WARNING("⚠️ Skipping row with missing data"))
-                    skipped += 1
-                    continue
-
-                # Get code from lookup, fallback to "000"
-                county_code = county_lookup.get(county_name, "000")
-
-                county, _ = County.objects.get_or_create(
-                    name=county_name,
-                    defaults={"code": county_code}
+        try:
+            with transaction.atomic():
+                existing_wards = list(
+                    Ward.objects.order_by().values_list("pk", "name", "constituency_id", "latitude", "longitude")
                 )
+                counties = self.sync_counties(county_codes, locations)
+                constituencies = self.sync_constituencies(counties, locations, existing_wards)
+                self.sync_wards(counties, constituencies, locations, existing_wards)
 
-                constituency, _ = Constituency.objects.get_or_create(
-                    name=constituency_name,
-                    county=county
-                )
-
-                ward, created_flag = Ward.objects.get_or_create(
-                    name=ward_name,
-                    constituency=constituency,
-                    defaults={
-                        "latitude": float(lat) if lat else None,
-                        "longitude": float(lng) if lng else None
-                    }
-                )
+                # Renamed / moved parents: rewrite the stored display paths
+                rebuild_location_paths(batch_size=BATCH_SIZE)
 
-                if created_flag:
-                    created["ward"] += 1
-                    self.stdout.write(self.style.SUCCESS(f"[CREATED] {ward.name} → {constituency.name}, {county.name}"))
-                else:
-                    skipped += 1
+                if options["dry_run"]:
+                    raise DryRunRollback
+                record_checksum(CHECKSUM_NAME, checksum, Ward.objects.count())
+                # Bulk writes skip the model signals: drop every process's
+                # location hierarchy, captcha pool and county choices once committed
+                transaction.on_commit(location_hierarchy.invalidate)
+                transaction.on_commit(captcha_pool.invalidate)
+                transaction.on_commit(lambda: reference_data_synced.send(sender=County))
+        except DryRunRollback:
+            pass
 
         # ----------------------------------------------------------------------
         # Summary Output
         # ----------------------------------------------------------------------
-        self.stdout.write(self.style.SUCCESS(f"\n✅ Wards Created: {created['ward']}"))
-        self.stdout.write(self.style.WARNING(f"⚠️ Skipped (existing or missing): {skipped}"))
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(f"\n✅ {prefix}Location import completed"))
+        self.stdout.write(f"{'':16}" + "".join(f"{kind:>13}" for kind in CHANGE_KINDS))
+        for level, counts in self.diff.items():
+            self.stdout.write(f"{level:16}" + "".join(f"{counts[kind]:>13}" for kind in CHANGE_KINDS))
+        if skipped:
+            self.stdout.write(self.style.WARNING(f"⚠️ Skipped rows with missing data: {skipped}"))
+
+        if not options["dry_run"] and not options["skip_bundle"]:
+            self.update_bundle(rebuild=True)
+
+    # --------------------------------------------------------------------------
+    # Static bundle
+    # --------------------------------------------------------------------------
+
+    def update_bundle(self, rebuild):
+        """
+        Rewrites the static location bundle from the committed hierarchy
+        (with `rebuild` False, only if there is none yet). A failed write is
+        reported but does not fail the import.
+        """
+        if not rebuild and read_location_manifest() is not None:
+            return
+        try:
+            manifest = rebuild_location_bundle(build_location_hierarchy())
+        except OSError as e:
+            self.stderr.write(self.style.WARNING(f"⚠️ Location bundle not written: {e}"))
+            return
+        if manifest:
+            self.stdout.write(f"Location bundle written: {manifest['bundle']}")
+
+    # --------------------------------------------------------------------------
+    # Parsing
+    # --------------------------------------------------------------------------
+
+    def parse_csvs(self, counties_path, locations_path):
+        """
+        Returns (county_codes, locations, skipped):
+            county_codes  {county name: 3-digit code}
+            locations     {county: {constituency: {ward: (lat, lng)}}}, first row wins
+        """
+        try:
+            with open(counties_path, newline="", encoding="utf-8-sig") as f:
+                county_codes = {}
+                for row in csv.DictReader(f):
+                    name = row.get("name", "").strip()
+                    code = row.get("code", "").strip().zfill(3)
+                    if name and code:
+                        county_codes[name] = code
+
+            locations = defaultdict(lambda: defaultdict(dict))
+            skipped = 0
+            with open(locations_path, newline="", encoding="utf-8-sig") as f:
+                for row in csv.DictReader(f):
+                    county_name = row["County"].strip()
+                    constituency_name = row["Constituency"].strip()
+                    ward_name = row["Ward"].strip()
+                    if not all([county_name, constituency_name, ward_name]):
+                        skipped += 1
+                        continue
+                    locations[county_name][constituency_name].setdefault(
+                        ward_name,
+                        (parse_coordinate(row.get("Latitude")), parse_coordinate(row.get("Longitude"))),
+                    )
+        except FileNotFoundError:
+            self.stderr.write(self.style.ERROR("❌ One or more CSV files not found."))
+            return None
+
+        if not county_codes:
+            self.stderr.write(self.style.ERROR("❌ No valid counties found in counties.csv"))
+            return None
+
+        return county_codes, locations, skipped
+
+    def report(self, level, kind, label):
+        self.diff[level][kind] += 1
+        if self.verbosity > 1 and kind not in ("unchanged", "missing"):
+            self.stdout.write(f"[{kind.upper()}] {label}")
+
+    # --------------------------------------------------------------------------
+    # Counties
+    # --------------------------------------------------------------------------
+
+    def sync_counties(self, county_codes, locations):
+        """Returns {county name: County} (id, code, name loaded) for every CSV county."""
+        by_name = {county.name: county for county in County.objects.order_by()}
+        by_code = {county.code: county for county in by_name.values()}
+        matched = set()
+        to_create, to_update = [], []
+
+        for name in locations:
+            # Counties missing from counties.csv fall back to "000", as before
+            code = county_codes.get(name, "000")
+            county = by_name.get(name)
+            if county is None and code != "000" and code in by_code and by_code[code].name not in locations:
+                county = by_code[code]
+                self.report("counties", "renamed", f"{county.name} → {name}")
+                county.name = name
+                to_update.append(county)
+            elif county is None:
+                to_create.append(County(name=name, code=code))
+                self.report("counties", "added", name)
+                continue
+            elif code != "000" and county.code != code:
+                self.report("counties", "recoded", f"{name}: {county.code} → {code}")
+                county.code = code
+                to_update.append(county)
+            else:
+                self.report("counties", "unchanged", name)
+            matched.add(county.pk)
+
+        self.diff["counties"]["missing"] = len(by_name) - len(matched)
+
+        County.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=BATCH_SIZE)
+        County.objects.bulk_update(to_update, ["name", "code"], batch_size=BATCH_SIZE)
+        return {county.name: county for county in County.objects.order_by().filter(name__in=list(locations))}
+
+    # --------------------------------------------------------------------------
+    # Constituencies
+    # --------------------------------------------------------------------------
+
+    def sync_constituencies(self, counties, locations, existing_wards):
+        """Returns {(county name, constituency name): Constituency} for every CSV constituency."""
+        existing = list(Constituency.objects.order_by().only("pk", "name", "county_id"))
+        by_key = {(c.county_id, c.name): c for c in existing}
+        ward_names = defaultdict(set)
+        for _, name, constituency_id, _, _ in existing_wards:
+            ward_names[constituency_id].add(name)
+
+        wanted = {
+            (counties[county_name].pk, constituency_name): (county_name, constituency_name)
+            for county_name, constituencies in locations.items()
+            for constituency_name in constituencies
+        }
+        unmatched_db = [c for c in existing if (c.county_id, c.name) not in wanted]
+        unmatched_by_name = defaultdict(list)
+        for constituency in unmatched_db:
+            unmatched_by_name[constituency.name].append(constituency)
+
+        to_create, to_update = [], []
+        claimed = set()
+
+        for key, (county_name, name) in wanted.items():
+            county = counties[county_name]
+            if key in by_key:
+                self.report("constituencies", "unchanged", name)
+                continue
+
+            csv_wards = set(locations[county_name][name])
+            candidates = unmatched_by_name.get(name, [])
+            renamed = [
+                c for c in unmatched_db
+                if c.county_id == county.pk and c.pk not in claimed and ward_names[c.pk] == csv_wards
+            ]
+            if len(candidates) == 1 and candidates[0].pk not in claimed:
+                constituency = candidates[0]
+                self.report("constituencies", "moved", f"{name} → {county_name}")
+                constituency.county_id = county.pk
+            elif len(renamed) == 1:
+                constituency = renamed[0]
+                self.report("constituencies", "renamed", f"{constituency.name} → {name} ({county_name})")
+                constituency.name = name
+            else:
+                to_create.append(Constituency(
+                    name=name,
+                    county=county,
+                    county_code=county.code,
+                    display_path=Constituency.build_display_path(name, county.name),
+                ))
+                self.report("constituencies", "added", f"{name}, {county_name}")
+                continue
+            claimed.add(constituency.pk)
+            to_update.append(constituency)
+
+        self.diff["constituencies"]["missing"] = len(unmatched_db) - len(claimed)
+
+        Constituency.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=BATCH_SIZE)
+        Constituency.objects.bulk_update(to_update, ["name", "county"], batch_size=BATCH_SIZE)
+
+        county_names = {county.pk: name for name, county in counties.items()}
+        return {
+            (county_names[c.county_id], c.name): c
+            for c in Constituency.objects.order_by().filter(county_id__in=list(county_names)).only(
+                "pk", "name", "county_id",
+            )
+        }
+
+    # --------------------------------------------------------------------------
+    # Wards
+    # --------------------------------------------------------------------------
+
+    def sync_wards(self, counties, constituencies, locations, existing_wards):
+        by_key = {(row[2], row[1]): row for row in existing_wards}
+        constituency_county = {c.pk: county_name for (county_name, _), c in constituencies.items()}
+
+        wanted = {}
+        for county_name, constituency_map in locations.items():
+            for constituency_name, wards in constituency_map.items():
+                constituency = constituencies[(county_name, constituency_name)]
+                for ward_name, coordinates in wards.items():
+                    wanted[(constituency.pk, ward_name)] = (county_name, constituency, coordinates)
+
+        unmatched_db = [row for row in existing_wards if (row[2], row[1]) not in wanted]
+        by_county_and_name = defaultdict(list)
+        by_constituency_and_position = defaultdict(list)
+        for row in unmatched_db:
+            by_county_and_name[(constituency_county.get(row[2]), row[1])].append(row)
+            by_constituency_and_position[(row[2], row[3], row[4])].append(row)
+
+        to_create, to_update = [], []
+        claimed = set()
+
+        for (constituency_id, name), (county_name, constituency, (latitude, longitude)) in wanted.items():
+            row = by_key.get((constituency_id, name))
+            ward = None
+            if row is not None:
+                if same_coordinate(row[3], latitude) and same_coordinate(row[4], longitude):
+                    self.report("wards", "unchanged", name)
+                    continue
+                ward = Ward(pk=row[0], name=name, constituency_id=constituency_id)
+                self.report("wards", "coordinates", f"{name}, {constituency.name}")
+            else:
+                moved = [r for r in by_county_and_name.get((county_name, name), []) if r[0] not in claimed]
+                renamed = [
+                    r for r in by_constituency_and_position.get((constituency_id, latitude, longitude), [])
+                    if r[0] not in claimed and latitude is not None
+                ]
+                if len(moved) == 1:
+                    ward = Ward(pk=moved[0][0], name=name, constituency_id=constituency_id)
+                    self.report("wards", "moved", f"{name} → {constituency.name}, {county_name}")
+                elif len(renamed) == 1:
+                    ward = Ward(pk=renamed[0][0], name=name, constituency_id=constituency_id)
+                    self.report("wards", "renamed", f"{renamed[0][1]} → {name} ({constituency.name})")
+                if ward is not None:
+                    claimed.add(ward.pk)
+
+            if ward is None:
+                county = counties[county_name]
+                to_create.append(Ward(
+                    name=name,
+                    constituency_id=constituency_id,
+                    latitude=latitude,
+                    longitude=longitude,
+                    county_code=county.code,
+                    constituency_name=constituency.name,
+                    display_path=Ward.build_display_path(name, constituency.name, county.name),
+                ))
+                self.report("wards", "added", f"{name} → {constituency.name}, {county_name}")
+                continue
+
+            ward.latitude, ward.longitude = latitude, longitude
+            to_update.append(ward)
+
+        self.diff["wards"]["missing"] = len(unmatched_db) - len(claimed)
+
+        Ward.objects.bulk_create(to_create, ignore_conflicts=True, batch_size=BATCH_SIZE)
+        Ward.objects.bulk_update(
+            to_update, ["name", "constituency", "latitude", "longitude"], batch_size=BATCH_SIZE,
+        )
@@ -0,0 +1,79 @@
+"""
+FILE: apps/user_profiles/management/commands/recompute_profile_completion.py
+
+PURPOSE:
+    Recomputes the stored progress snapshots of every user profile:
+        civic_interest_count    recounted from the interest links
+        completion_percentage   UserProfile.calculate_completion()
+        next_wizard_screen      UserProfile.get_next_incomplete_screen()
+
+    Run it after changing UserProfile.COMPLETION_FIELDS or SCREEN_FIELD_MAP,
+    to repair counts after raw SQL edits, or once on databases that applied
+    migration 0008 before it backfilled next_wizard_screen. Profiles are walked in
+    primary-key batches, each read with one query (interests counted by
+    annotation) and written with bulk_update in its own transaction.
+
+USAGE:
+    python manage.py recompute_profile_completion
+    python manage.py recompute_profile_completion --batch-size 5000 --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+
+from apps.user_profiles.models import UserProfile
+
+PROGRESS_SNAPSHOT_FIELDS = ["civic_interest_count", "completion_percentage", "next_wizard_screen"]
+
+
+class Command(BaseCommand):
+    help = "Recomputes interest counts, completion percentages and next wizard screens."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Profiles read and written per batch.",
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report changes without writing them.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        last_pk = 0
+        scanned = 0
+        changed_total = 0
+
+        while True:
+            batch = list(
+                UserProfile.objects
+                .filter(pk__gt=last_pk)
+                .annotate(interest_total=Count("civic_interest_areas"))
+                .order_by("pk")[:batch_size]
+            )
+            if not batch:
+                break
+
+            changed = []
+            for profile in batch:
+                recounted = profile.interest_total != profile.civic_interest_count
+                profile.civic_interest_count = profile.interest_total
+                if profile.refresh_progress() or recounted:
+                    changed.append(profile)
+
+            if changed and not options["dry_run"]:
+                with transaction.atomic():
+                    UserProfile.objects.bulk_update(changed, PROGRESS_SNAPSHOT_FIELDS)
+
+            last_pk = batch[-1].pk
+            scanned += len(batch)
+            changed_total += len(changed)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Up to profile #{last_pk}: {len(changed)} updated.")
+
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}Recompute completed: {changed_total} of {scanned} profiles updated."
+        ))
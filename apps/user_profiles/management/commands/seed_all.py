@@ -1,39 +1,198 @@
-from django.core.management.base import BaseCommand
+"""
+FILE: apps/user_profiles/management/commands/seed_all.py
+
+PURPOSE:
+    Seeds all reference models for the CEENI platform in one run:
+        - the lookup tables, each through its declarative importer
+          (BaseImportReferenceCommand, apps/common/utils/reference_sync.py)
+        - the Kenyan location hierarchy (import_kenyan_locations), which also
+          rebuilds the static location bundle
+
+    The importers touch disjoint tables, so they run concurrently on a small
+    thread pool, each thread with its own database connection and its own
+    transaction. Every file's checksum is stored, so files unchanged since
+    the last seed are skipped without being parsed. On SQLite, which allows
+    a single writer, the default is sequential.
+
+    --report writes a machine-readable JSON summary (per-importer status,
+    counts, checksum and timing), e.g. for CI.
+
+USAGE:
+    python manage.py seed_all
+    python manage.py seed_all --report seed_report.json
+    python manage.py seed_all --force --workers 1
+    python manage.py seed_all --dry-run -v 2
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from importlib import import_module
+from io import StringIO
+
 from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from apps.common.utils.reference_sync import write_sync_report
+from apps.user_profiles.management.commands import import_kenyan_locations
+
+# Declarative reference importers; each supplies `model`, `file_name`, ...
+REFERENCE_IMPORT_COMMANDS = (
+    # 1. DEMOGRAPHIC REFERENCE DATA
+    "import_genders",               # Gender options (e.g. Male, Female, Other)
+    "import_age_ranges",            # Predefined age brackets
+    "import_education_levels",      # Levels of education
+    "import_residency_types",       # Types like urban, rural, etc.
+    "import_referral_sources",      # How users heard about the platform
+    # 2. CIVIC INTEREST AREAS
+    "import_civic_interest_areas",  # Focus areas (e.g. healthcare, environment)
+    # **** ADD NEW REFERENCE IMPORTERS ABOVE ****
+)
+
+LOCATIONS_TASK = "import_kenyan_locations"  # 3. KENYAN LOCATION HIERARCHY
 
 
 class Command(BaseCommand):
-    help = "Seeds all reference models for CEENI platform in the correct order."
+    help = "Seeds all reference models for CEENI platform, concurrently and skipping unchanged files."
 
-    def handle(self, *args, **kwargs):
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report what would change without writing to the database.",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Import every file, even those unchanged since the last seed.",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="Importers run in parallel (default: all at once; 1 on SQLite).",
+        )
+        parser.add_argument(
+            "--report",
+            help="Write a JSON report to this path ('-' for stdout).",
+        )
+
+    def handle(self, *args, **options):
         self.stdout.write(self.style.NOTICE("Starting to seed all reference data..."))
 
-        try:
-            # ------------------------------
-            # 1. DEMOGRAPHIC REFERENCE DATA
-            # ------------------------------
-            call_command("import_genders")              # Import gender options (e.g. Male, Female, Other)
-            call_command("import_age_ranges")           # Import predefined age brackets
-            call_command("import_education_levels")     # Import levels of education
-            call_command("import_residency_types")      # Import types like urban, rural, etc.
-            call_command("import_referral_sources")     # Import how users heard about the platform
-
-            # ------------------------------
-            # 2. CIVIC INTEREST AREAS
-            # ------------------------------
-            call_command("import_civic_interest_areas") # Import focus areas (e.g. healthcare, environment)
-
-            # ------------------------------
-            # 3. KENYAN LOCATION HIERARCHY
-            # ------------------------------
-            call_command("import_kenyan_locations")             # Seed all 47 counties, Seed constituencies linked to counties, Seed wards linked to constituencies
-
-            # ------------------------------
-            # **** ADD NEW IMPORT COMMANDS BELOW ****
-            # ------------------------------
-            # For example: call_command("import_languages")
-
-            self.stdout.write(self.style.SUCCESS("✅ All seed data imported successfully."))
-
-        except Exception as e:
-            self.stderr.write(self.style.ERROR(f"❌ Failed to seed: {str(e)}"))
+        tasks = [
+            *(
+                (name, import_module(f"apps.user_profiles.management.commands.{name}").Command())
+                for name in REFERENCE_IMPORT_COMMANDS
+            ),
+            (LOCATIONS_TASK, import_kenyan_locations.Command()),
+        ]
+        workers = options["workers"]
+        if workers is None:
+            workers = 1 if connection.vendor == "sqlite" else len(tasks)
+        elif workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING(
+                "⚠️ SQLite allows one writer at a time; parallel importers may fail with 'database is locked'."
+            ))
+
+        def run(name, command):
+            start = time.perf_counter()
+            if name == LOCATIONS_TASK:
+                output = StringIO()
+                call_command(
+                    command, dry_run=options["dry_run"], force=options["force"],
+                    stdout=output, verbosity=options["verbosity"],
+                )
+                return self.locations_result(command, output.getvalue(), time.perf_counter() - start)
+            return command.sync(dry_run=options["dry_run"], force=options["force"])
+
+        def run_in_worker(name, command):
+            try:
+                return run(name, command)
+            finally:
+                # Worker threads open their own connections; don't leak them
+                connection.close()
+
+        started_at = timezone.now()
+        start = time.perf_counter()
+        results, failures = [], []
+
+        def collect(name, result):
+            try:
+                outcome = result()
+            except Exception as e:
+                failures.append({"name": name, "error": str(e)})
+                self.stderr.write(self.style.ERROR(f"❌ Failed to seed {name}: {e}"))
+                return
+            if isinstance(outcome, dict):
+                self.stdout.write(outcome.pop("output").rstrip())
+                results.append(outcome)
+            else:
+                write_sync_report(self, outcome, verbosity=options["verbosity"])
+                results.append(outcome.as_dict())
+
+        if workers <= 1:
+            # Sequential, on this thread's connection
+            for name, command in tasks:
+                collect(name, lambda: run(name, command))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(run_in_worker, name, command): name
+                    for name, command in tasks
+                }
+                for future in as_completed(futures):
+                    collect(futures[future], future.result)
+
+        elapsed = time.perf_counter() - start
+        skipped = sum(1 for result in results if result["status"] == "skipped")
+
+        if options["report"]:
+            self.write_report(options["report"], {
+                "ok": not failures,
+                "started_at": started_at.isoformat(),
+                "seconds": round(elapsed, 4),
+                "workers": workers,
+                "database": connection.vendor,
+                "dry_run": options["dry_run"],
+                "force": options["force"],
+                "imports": sorted(results, key=lambda result: result["name"]),
+                "failures": failures,
+            })
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} of {len(tasks)} importers failed "
+                f"(others were committed): {', '.join(f['name'] for f in failures)}"
+            )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ All seed data imported successfully: {len(tasks)} importers "
+            f"({skipped} unchanged and skipped) in {elapsed * 1000:.0f} ms."
+        ))
+
+    @staticmethod
+    def locations_result(command, output, seconds):
+        """Report entry for the location importer, shaped like ReferenceSyncReport.as_dict()."""
+        diff = {level: dict(counts) for level, counts in command.diff.items()}
+        changed = any(
+            counts.get(kind)
+            for counts in diff.values()
+            for kind in ("added", "renamed", "moved", "recoded", "coordinates")
+        )
+        return {
+            "name": import_kenyan_locations.CHECKSUM_NAME,
+            "model": "user_profiles.ward",
+            "file": "counties.csv + kenya_county_constituency_ward_latitude_longitude.csv",
+            "status": "skipped" if command.skipped else ("changed" if changed else "unchanged"),
+            "diff": diff,
+            "seconds": round(seconds, 4),
+            "output": output,
+        }
+
+    def write_report(self, path, report):
+        payload = json.dumps(report, indent=2, ensure_ascii=False)
+        if path == "-":
+            self.stdout.write(payload)
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+        self.stdout.write(f"Report written to {path}")
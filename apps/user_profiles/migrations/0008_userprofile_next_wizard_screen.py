@@ -0,0 +1,69 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:10
+
+from django.db import migrations, models
+
+# UserProfile.SCREEN_FIELD_MAP as of this migration
+SCREEN_FIELD_MAP = [
+    ('user_profiles:screen_1', ['age_range', 'gender', 'education_level']),
+    ('user_profiles:screen_2', ['county', 'constituency', 'ward']),
+    ('user_profiles:screen_3', ['county_of_origin', 'current_country_of_residence', 'residency_type']),
+    ('user_profiles:screen_4', ['civic_interest_areas', 'has_voted_before', 'knows_voting_process']),
+    ('user_profiles:screen_5', ['wants_bill_notifications', 'whatsapp_opt_in_number']),
+    ('user_profiles:screen_6', ['referral_source']),
+]
+
+
+def backfill_next_wizard_screen(apps, schema_editor):
+    """
+    Stores the next incomplete screen of existing profiles, walking the map
+    as UserProfile.get_next_incomplete_screen() does (one read for the
+    profiles, one for the interest links, bulk updates).
+    """
+    UserProfile = apps.get_model('user_profiles', 'UserProfile')
+    through = UserProfile.civic_interest_areas.through
+
+    with_interests = set(through.objects.values_list('userprofile_id', flat=True).distinct())
+    fields = [field for _, names in SCREEN_FIELD_MAP for field in names if field != 'civic_interest_areas']
+    attnames = {field: UserProfile._meta.get_field(field).attname for field in fields}
+
+    def is_missing(profile, field):
+        if field == 'civic_interest_areas':
+            return profile.pk not in with_interests
+        if field == 'whatsapp_opt_in_number':
+            # Only required when the user opted in
+            return profile.wants_bill_notifications is True and not profile.whatsapp_opt_in_number
+        value = getattr(profile, attnames[field])
+        return value is None or value == ''
+
+    def next_screen(profile):
+        for screen_name, names in SCREEN_FIELD_MAP:
+            if any(is_missing(profile, field) for field in names):
+                return screen_name
+        return 'user_profiles:screen_7'
+
+    changed = []
+    for profile in UserProfile.objects.only('pk', 'next_wizard_screen', *fields).iterator(chunk_size=1000):
+        screen = next_screen(profile)
+        if screen != profile.next_wizard_screen:
+            profile.next_wizard_screen = screen
+            changed.append(profile)
+        if len(changed) >= 1000:
+            UserProfile.objects.bulk_update(changed, ['next_wizard_screen'])
+            changed = []
+    UserProfile.objects.bulk_update(changed, ['next_wizard_screen'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profiles', '0007_userprofile_last_wizard_login_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='next_wizard_screen',
+            field=models.CharField(choices=[('user_profiles:screen_1', '1 · Basic info'), ('user_profiles:screen_2', '2 · Location'), ('user_profiles:screen_3', '3 · Origin & residency'), ('user_profiles:screen_4', '4 · Civic interests'), ('user_profiles:screen_5', '5 · Communication'), ('user_profiles:screen_6', '6 · Referral source'), ('user_profiles:screen_7', '7 · Confirmation')], db_index=True, default='user_profiles:screen_1', editable=False, help_text='Snapshot of the next incomplete wizard screen (URL name).', max_length=32),
+        ),
+        migrations.RunPython(backfill_next_wizard_screen, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:11
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_civic_interest_count(apps, schema_editor):
+    """
+    Counts each profile's existing civic interests in a single UPDATE.
+    """
+    UserProfile = apps.get_model('user_profiles', 'UserProfile')
+    through = UserProfile.civic_interest_areas.through
+
+    counts = (
+        through.objects
+        .filter(userprofile_id=OuterRef('pk'))
+        .order_by()
+        .values('userprofile_id')
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    UserProfile.objects.update(
+        civic_interest_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profiles', '0008_userprofile_next_wizard_screen'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='userprofile',
+            name='civic_interest_count',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, help_text='Snapshot of how many civic interest areas are selected.'),
+        ),
+        migrations.RunPython(backfill_civic_interest_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.4 on 2026-10-18 11:17
+
+from django.db import migrations, models
+
+
+def backfill_location_paths(apps, schema_editor):
+    """
+    Fills the denormalized sort keys and display paths of existing rows
+    (three reads, bulk updates).
+    """
+    County = apps.get_model('user_profiles', 'County')
+    Constituency = apps.get_model('user_profiles', 'Constituency')
+    Ward = apps.get_model('user_profiles', 'Ward')
+
+    counties = {pk: (code, name) for pk, code, name in County.objects.values_list('pk', 'code', 'name')}
+
+    constituencies = list(Constituency.objects.all())
+    parents = {}
+    for constituency in constituencies:
+        code, county_name = counties[constituency.county_id]
+        constituency.county_code = code
+        constituency.display_path = f"{constituency.name} — {county_name}"
+        parents[constituency.pk] = (code, constituency.name, county_name)
+    Constituency.objects.bulk_update(constituencies, ['county_code', 'display_path'], batch_size=1000)
+
+    wards = list(Ward.objects.all())
+    for ward in wards:
+        code, constituency_name, county_name = parents[ward.constituency_id]
+        ward.county_code = code
+        ward.constituency_name = constituency_name
+        ward.display_path = f"{ward.name} — {constituency_name}, {county_name}"
+    Ward.objects.bulk_update(wards, ['county_code', 'constituency_name', 'display_path'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user_profiles', '0009_userprofile_civic_interest_count'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='constituency',
+            options={'ordering': ['county_code', 'name'], 'verbose_name': 'Constituency', 'verbose_name_plural': 'Constituencies'},
+        ),
+        migrations.AlterModelOptions(
+            name='ward',
+            options={'ordering': ['county_code', 'constituency_name', 'name'], 'verbose_name': 'Ward', 'verbose_name_plural': 'Wards'},
+        ),
+        migrations.AddField(
+            model_name='constituency',
+            name='county_code',
+            field=models.CharField(default='', editable=False, help_text="Copy of the county's code (sort key)", max_length=3),
+        ),
+        migrations.AddField(
+            model_name='constituency',
+            name='display_path',
+            field=models.CharField(db_index=True, default='', editable=False, help_text="Stored label, e.g. 'Westlands — Nairobi'", max_length=160),
+        ),
+        migrations.AddField(
+            model_name='ward',
+            name='constituency_name',
+            field=models.CharField(default='', editable=False, help_text="Copy of the constituency's name (sort key)", max_length=64),
+        ),
+        migrations.AddField(
+            model_name='ward',
+            name='county_code',
+            field=models.CharField(default='', editable=False, help_text="Copy of the county's code (sort key)", max_length=3),
+        ),
+        migrations.AddField(
+            model_name='ward',
+            name='display_path',
+            field=models.CharField(db_index=True, default='', editable=False, help_text="Stored label, e.g. 'Parklands — Westlands, Nairobi'", max_length=200),
+        ),
+        migrations.AddIndex(
+            model_name='constituency',
+            index=models.Index(fields=['county_code', 'name'], name='constituency_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ward',
+            index=models.Index(fields=['county_code', 'constituency_name', 'name'], name='ward_sort_idx'),
+        ),
+        migrations.RunPython(backfill_location_paths, migrations.RunPython.noop),
+    ]
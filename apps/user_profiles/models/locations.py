@@ -1,4 +1,9 @@
 from django.db import models
+from django.db.models import F, Value
+from django.db.models.functions import Concat
+
+# Separator used in every stored display path: "Parklands — Westlands, Nairobi"
+PATH_SEPARATOR = " — "
 
 
 # ------------------------------------------------------------------------------
@@ -34,6 +39,28 @@ class County(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding:
+            self.refresh_descendant_paths()
+
+    def refresh_descendant_paths(self):
+        """
+        Rewrites the stored code/path columns of this county's constituencies
+        and wards (two UPDATEs, no rows loaded).
+        """
+        Constituency.objects.filter(county=self).update(
+            county_code=self.code,
+            display_path=Concat(F("name"), Value(f"{PATH_SEPARATOR}{self.name}")),
+        )
+        Ward.objects.filter(constituency__county=self).update(
+            county_code=self.code,
+            display_path=Concat(
+                F("name"), Value(PATH_SEPARATOR), F("constituency_name"), Value(f", {self.name}"),
+            ),
+        )
+
 
 # ------------------------------------------------------------------------------
 # Constituency Model
@@ -46,6 +73,8 @@ class Constituency(models.Model):
     Fields:
     - name: Constituency name (e.g., 'Lang’ata')
     - county: ForeignKey to the parent County
+    - county_code: Copy of county.code, the first sort key
+    - display_path: Stored "Name — County", used by __str__
     """
 
     name = models.CharField(
@@ -59,14 +88,60 @@ class Constituency(models.Model):
         related_name="constituencies"
     )
 
+    # Denormalized from the county so listing and ordering need no join
+    county_code = models.CharField(
+        max_length=3,
+        editable=False,
+        default="",
+        help_text="Copy of the county's code (sort key)"
+    )
+
+    display_path = models.CharField(
+        max_length=160,
+        editable=False,
+        default="",
+        db_index=True,
+        help_text="Stored label, e.g. 'Westlands — Nairobi'"
+    )
+
     class Meta:
         unique_together = ("name", "county")
-        ordering = ["county__code", "name"]
+        ordering = ["county_code", "name"]
+        indexes = [
+            models.Index(fields=["county_code", "name"], name="constituency_sort_idx"),
+        ]
         verbose_name = "Constituency"
         verbose_name_plural = "Constituencies"
 
     def __str__(self):
-        return f"{self.name} — {self.county.name}"
+        return self.display_path or self.name
+
+    @staticmethod
+    def build_display_path(name, county_name):
+        return f"{name}{PATH_SEPARATOR}{county_name}"
+
+    def refresh_location_path(self):
+        """Recomputes county_code and display_path from the parent county."""
+        self.county_code = self.county.code
+        self.display_path = self.build_display_path(self.name, self.county.name)
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        self.refresh_location_path()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "county_code", "display_path"}
+        super().save(*args, **kwargs)
+        if not adding:
+            self.refresh_descendant_paths()
+
+    def refresh_descendant_paths(self):
+        """Rewrites the stored sort/path columns of this constituency's wards (one UPDATE)."""
+        Ward.objects.filter(constituency=self).update(
+            county_code=self.county_code,
+            constituency_name=self.name,
+            display_path=Concat(F("name"), Value(f"{PATH_SEPARATOR}{self.name}, {self.county.name}")),
+        )
 
 
 # ------------------------------------------------------------------------------
@@ -81,6 +156,8 @@ class Ward(models.Model):
     - name: Ward name (e.g., 'South B')
     - constituency: ForeignKey to parent Constituency
     - latitude, longitude: Optional location data for mapping
+    - county_code, constituency_name: Copies of the parents' sort keys
+    - display_path: Stored "Name — Constituency, County", used by __str__
     """
 
     name = models.CharField(
@@ -104,11 +181,56 @@ class Ward(models.Model):
         help_text="Longitude coordinate for the ward (if known)"
     )
 
+    # Denormalized from the constituency and county so listing and ordering
+    # need no join
+    county_code = models.CharField(
+        max_length=3,
+        editable=False,
+        default="",
+        help_text="Copy of the county's code (sort key)"
+    )
+
+    constituency_name = models.CharField(
+        max_length=64,
+        editable=False,
+        default="",
+        help_text="Copy of the constituency's name (sort key)"
+    )
+
+    display_path = models.CharField(
+        max_length=200,
+        editable=False,
+        default="",
+        db_index=True,
+        help_text="Stored label, e.g. 'Parklands — Westlands, Nairobi'"
+    )
+
     class Meta:
         unique_together = ("name", "constituency")
-        ordering = ["constituency__county__code", "constituency__name", "name"]
+        ordering = ["county_code", "constituency_name", "name"]
+        indexes = [
+            models.Index(fields=["county_code", "constituency_name", "name"], name="ward_sort_idx"),
+        ]
         verbose_name = "Ward"
         verbose_name_plural = "Wards"
 
     def __str__(self):
-        return f"{self.name} — {self.constituency.name}, {self.constituency.county.name}"
+        return self.display_path or self.name
+
+    @staticmethod
+    def build_display_path(name, constituency_name, county_name):
+        return f"{name}{PATH_SEPARATOR}{constituency_name}, {county_name}"
+
+    def refresh_location_path(self):
+        """Recomputes the stored sort keys and display_path from the parents."""
+        constituency = self.constituency
+        self.county_code = constituency.county.code
+        self.constituency_name = constituency.name
+        self.display_path = self.build_display_path(self.name, constituency.name, constituency.county.name)
+
+    def save(self, *args, **kwargs):
+        self.refresh_location_path()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "county_code", "constituency_name", "display_path"}
+        super().save(*args, **kwargs)
@@ -6,6 +6,7 @@ from django_countries.fields import CountryField
 from django.core.exceptions import ValidationError
 
 from apps.common.validators.identity import validate_phone_e164
+from apps.user_profiles.constants import WIZARD_SCREEN_CHOICES
 from apps.user_profiles.models import (
     AgeRange,
     Gender,
@@ -59,6 +60,27 @@ class UserProfile(models.Model):
         help_text="Snapshot of profile completion (0–100)."
     )
 
+    # --------------------------------------------------------------------------
+    # Cached next wizard screen (denormalized from SCREEN_FIELD_MAP)
+    # --------------------------------------------------------------------------
+    next_wizard_screen = models.CharField(
+        max_length=32,
+        choices=WIZARD_SCREEN_CHOICES,
+        default="user_profiles:screen_1",
+        editable=False,
+        db_index=True,
+        help_text="Snapshot of the next incomplete wizard screen (URL name)."
+    )
+
+    # --------------------------------------------------------------------------
+    # Cached number of civic interests (kept by the m2m_changed handler)
+    # --------------------------------------------------------------------------
+    civic_interest_count = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        help_text="Snapshot of how many civic interest areas are selected."
+    )
+
     # --------------------------------------------------------------------------
     # Demographic fields
     # --------------------------------------------------------------------------
@@ -178,9 +200,10 @@ class UserProfile(models.Model):
         """
         Validates hierarchical consistency between county → constituency → ward.
         """
-        if self.constituency and self.county and self.constituency.county != self.county:
+        # Compare ids so the check never lazy-loads the parent rows
+        if self.constituency_id and self.county_id and self.constituency.county_id != self.county_id:
             raise ValidationError("Selected constituency does not belong to the selected county.")
-        if self.ward and self.constituency and self.ward.constituency != self.constituency:
+        if self.ward_id and self.constituency_id and self.ward.constituency_id != self.constituency_id:
             raise ValidationError("Selected ward does not belong to the selected constituency.")
 
     def __str__(self):
@@ -192,47 +215,115 @@ class UserProfile(models.Model):
     # Profile Completion Utilities
     # =============================
 
+    # Scalar fields counted by calculate_completion() (plus civic interests)
+    COMPLETION_FIELDS: tuple[str, ...] = (
+        'age_range', 'gender', 'education_level',
+        'residency_type', 'referral_source',
+        'county', 'constituency', 'ward',
+        'county_of_origin', 'current_country_of_residence',
+        'has_voted_before', 'knows_voting_process',
+        'wants_bill_notifications', 'profile_image',
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._progress_snapshot = instance._progress_values()
+        return instance
+
+    def _progress_values(self) -> dict:
+        """
+        Raw stored values (ids for foreign keys) of every field that feeds
+        completion_percentage or next_wizard_screen. Deferred fields are skipped.
+        """
+        values = {}
+        for name in self.PROGRESS_FIELDS:
+            attname = self._meta.get_field(name).attname
+            if attname in self.__dict__:
+                value = self.__dict__[attname]
+                values[name] = getattr(value, "name", value)  # FieldFile → stored path
+        return values
+
+    def _progress_fields_changed(self) -> bool:
+        """True for unsaved profiles or when a counted field differs from the loaded value."""
+        snapshot = getattr(self, "_progress_snapshot", None)
+        if self._state.adding or snapshot is None:
+            return True
+        return self._progress_values() != snapshot
+
+    def is_field_filled(self, field: str) -> bool:
+        """
+        Treat None and '' (but NOT False) as missing, without loading related
+        rows. civic_interest_areas is answered from civic_interest_count.
+        """
+        if field == 'civic_interest_areas':
+            return self.civic_interest_count > 0
+        value = getattr(self, self._meta.get_field(field).attname, None)
+        return value is not None and value != ''
+
     def calculate_completion(self) -> int:
         """
         Calculates percentage of completed profile fields.
         - Treats BooleanFields like has_voted_before and wants_bill_notifications
         as complete even when False (i.e., valid 'No' answer).
-        - Only counts ManyToMany fields if profile instance exists (has PK).
+        - Counts civic_interest_areas (M2M) from the denormalized
+        civic_interest_count, so no query is made.
         """
-        scalar_fields = [
-            'age_range', 'gender', 'education_level',
-            'residency_type', 'referral_source',
-            'county', 'constituency', 'ward',
-            'county_of_origin', 'current_country_of_residence',
-            'has_voted_before', 'knows_voting_process',
-            'wants_bill_notifications', 'profile_image',
-        ]
-
-        filled = 0
-        for field in scalar_fields:
-            value = getattr(self, field, None)
-
-            # Treat False as a valid (filled) value — do NOT count only truthy
-            if value is not None and value != '':
-                filled += 1
-
-        # Count civic_interest_areas (M2M) only if profile has been saved
-        if self.pk and self.civic_interest_areas.exists():
+        filled = sum(1 for field in self.COMPLETION_FIELDS if self.is_field_filled(field))
+
+        if self.civic_interest_count:
             filled += 1
 
-        total = len(scalar_fields) + 1  # +1 for the M2M field
+        total = len(self.COMPLETION_FIELDS) + 1  # +1 for the M2M field
         return int((filled / total) * 100)
 
-
-    def save(self, *args, **kwargs):
+    def refresh_progress(self) -> list[str]:
         """
-        Override save to recalculate and persist completion_percentage.
+        Recomputes completion_percentage and next_wizard_screen in memory.
+        Returns the names of the fields whose value changed.
         """
+        changed = []
         new_pct = self.calculate_completion()
         if new_pct != self.completion_percentage:
             self.completion_percentage = new_pct
+            changed.append("completion_percentage")
+
+        new_screen = self.get_next_incomplete_screen()
+        if new_screen != self.next_wizard_screen:
+            self.next_wizard_screen = new_screen
+            changed.append("next_wizard_screen")
+        return changed
+
+    def save(self, *args, **kwargs):
+        """
+        Override save to keep completion_percentage and next_wizard_screen
+        current. They are only recomputed when a counted field is being saved:
+        listed in update_fields, or changed since the profile was loaded.
+        Civic interest changes are handled by the m2m_changed handler in
+        signals/civic_interest_sync.py.
+        """
+        update_fields = kwargs.get("update_fields")
+
+        if update_fields is not None:
+            if self.PROGRESS_FIELDS.intersection(update_fields):
+                kwargs["update_fields"] = {*update_fields, "completion_percentage", "next_wizard_screen"}
+                self.refresh_progress()
+        elif self._progress_fields_changed():
+            self.refresh_progress()
+
         super().save(*args, **kwargs)
-        
+
+        # A partial save only stored `update_fields`: other counted fields
+        # changed in memory are still unsaved and must keep their old values
+        snapshot = getattr(self, "_progress_snapshot", None)
+        current = self._progress_values()
+        if update_fields is None or snapshot is None:
+            self._progress_snapshot = current
+        else:
+            for name in self.PROGRESS_FIELDS.intersection(update_fields):
+                if name in current:
+                    snapshot[name] = current[name]
+
     # =============================
     # Completion Status Utility
     # =============================
@@ -261,6 +352,14 @@ class UserProfile(models.Model):
         # screen_7 is assumed final confirmation
     ]
 
+    # Scalar fields whose changes require recomputing the progress snapshots
+    PROGRESS_FIELDS: frozenset[str] = frozenset(COMPLETION_FIELDS) | frozenset(
+        field
+        for _, fields in SCREEN_FIELD_MAP
+        for field in fields
+        if field != 'civic_interest_areas'
+    )
+
 
     # =============================
     # Next Step Resolution Utility
@@ -269,25 +368,28 @@ class UserProfile(models.Model):
         """
         Determines the next screen based on missing profile fields.
         Handles special logic like optional WhatsApp number.
+
+        Routing should read the stored `next_wizard_screen` instead; this walk
+        is what keeps it up to date (on save and when interests change).
         """
         for screen_name, fields in self.SCREEN_FIELD_MAP:
             for field in fields:
-                value = getattr(self, field, None)
-
-                # Special case: civic_interest_areas (M2M)
-                if hasattr(value, 'exists') and not value.exists():
-                    return screen_name
+                # Special case: civic_interest_areas (M2M), via the denormalized count
+                if field == 'civic_interest_areas':
+                    if not self.civic_interest_count:
+                        return screen_name
+                    continue
 
                 # Special case: whatsapp number is only required if user opted in
                 if field == 'whatsapp_opt_in_number':
                     wants = getattr(self, 'wants_bill_notifications', None)
-                    if wants is True and not value:
+                    if wants is True and not self.whatsapp_opt_in_number:
                         return screen_name
                     # If wants is False or None, empty number is fine
                     continue
 
-                # Normal fields: treat None, '', [], but NOT False, as missing
-                if value in [None, '', []]:
+                # Normal fields: treat None and '', but NOT False, as missing
+                if not self.is_field_filled(field):
                     return screen_name
 
         return 'user_profiles:screen_7'
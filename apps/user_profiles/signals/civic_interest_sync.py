@@ -0,0 +1,59 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Keep UserProfile's interest-derived snapshots in step with its
+#          civic interests (civic_interest_count, completion, next screen)
+# ------------------------------------------------------------------------------
+
+from django.db.models.signals import m2m_changed
+
+from ..models.profile import UserProfile
+
+CivicInterestLink = UserProfile.civic_interest_areas.through
+
+
+def refresh_interest_progress(profile):
+    """
+    Recounts one profile's interests and stores the count, completion
+    percentage and next wizard screen with a single UPDATE (only when
+    something changed), without running the rest of save().
+    """
+    count = CivicInterestLink.objects.filter(userprofile_id=profile.pk).count()
+    changed = []
+    if count != profile.civic_interest_count:
+        profile.civic_interest_count = count
+        changed = ["civic_interest_count", *profile.refresh_progress()]
+
+    if changed:
+        UserProfile.objects.filter(pk=profile.pk).update(
+            **{field: getattr(profile, field) for field in changed}
+        )
+
+
+def sync_civic_interest_progress(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Interests only reach the table after UserProfile.save() (form save_m2m,
+    admin), so the snapshots stored by save() are refreshed once they change.
+    """
+    if action == "pre_clear" and reverse:
+        # Remember who loses the interest; pk_set is empty on post_clear
+        instance._cleared_profile_ids = list(
+            instance.userprofile_set.values_list("pk", flat=True)
+        )
+        return
+
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if not reverse:
+        refresh_interest_progress(instance)
+        return
+
+    if action == "post_clear":
+        profile_ids = getattr(instance, "_cleared_profile_ids", [])
+    else:
+        profile_ids = pk_set or []
+
+    for profile in UserProfile.objects.filter(pk__in=profile_ids):
+        refresh_interest_progress(profile)
+
+
+m2m_changed.connect(sync_civic_interest_progress, sender=CivicInterestLink)
@@ -0,0 +1,22 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Rebuild the in-memory location hierarchy when locations change
+# ------------------------------------------------------------------------------
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from ..models.locations import County, Constituency, Ward
+from ..utils.location_hierarchy import location_hierarchy
+
+
+def invalidate_location_hierarchy(sender, **kwargs):
+    """
+    Marks every process's location hierarchy (and its pre-rendered option
+    fragments) stale once the change commits, e.g. after an admin edit.
+    """
+    transaction.on_commit(location_hierarchy.invalidate)
+
+
+for location_model in (County, Constituency, Ward):
+    post_save.connect(invalidate_location_hierarchy, sender=location_model)
+    post_delete.connect(invalidate_location_hierarchy, sender=location_model)
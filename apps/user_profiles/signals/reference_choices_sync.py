@@ -0,0 +1,31 @@
+# ------------------------------------------------------------------------------
+# SIGNALS: Rebuild the cached reference choices when a reference table changes
+# ------------------------------------------------------------------------------
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+
+from apps.common.signals.reference_data import reference_data_synced
+
+from ..utils.reference_choices import REFERENCE_CHOICE_MODELS, invalidate_reference_choices
+
+
+def invalidate_choice_snapshot(sender, **kwargs):
+    """
+    Marks every process's choice snapshot of `sender` stale once the change
+    commits, e.g. after an admin edit.
+    """
+    transaction.on_commit(lambda: invalidate_reference_choices(sender))
+
+
+def on_reference_data_synced(sender, **kwargs):
+    """Bulk importers send this after committing, so invalidate right away."""
+    if sender in REFERENCE_CHOICE_MODELS:
+        invalidate_reference_choices(sender)
+
+
+for reference_model in REFERENCE_CHOICE_MODELS:
+    post_save.connect(invalidate_choice_snapshot, sender=reference_model)
+    post_delete.connect(invalidate_choice_snapshot, sender=reference_model)
+
+reference_data_synced.connect(on_reference_data_synced)
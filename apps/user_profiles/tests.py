@@ -1,3 +1,867 @@
-from django.test import TestCase
+import importlib
+import json
+import random
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.storage.fallback import FallbackStorage
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.management import call_command
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from apps.user_profiles.models import (
+    AgeRange,
+    CivicInterestArea,
+    Constituency,
+    County,
+    EducationLevel,
+    Gender,
+    ResidencyType,
+    UserProfile,
+    Ward,
+)
+from apps.user_profiles.forms.reference_fields import CachedModelChoiceField, CachedModelMultipleChoiceField
+from apps.user_profiles.forms.screen_1_basic_info import Screen1BasicInfoForm
+from apps.user_profiles.forms.screen_4_civic_interests import Screen4CivicInterestsForm
+from apps.user_profiles.utils.location_bundle import (
+    get_location_bundle_url,
+    read_location_manifest,
+    serialize_hierarchy,
+    write_location_bundle,
+)
+from apps.user_profiles.utils.location_hierarchy import LocationHierarchy, location_hierarchy
+from apps.user_profiles.utils.location_paths import rebuild_location_paths
+from apps.user_profiles.utils.location_search import PrefixIndex, normalize_search_text, search_locations
+from apps.user_profiles.utils.reference_choices import (
+    REFERENCE_CHOICE_MODELS,
+    get_choice_snapshot,
+    invalidate_reference_choices,
+    reference_choices,
+)
+from apps.user_profiles.utils.ward_locator import WardLocator, haversine_km
+from apps.user_profiles.utils.progress import (
+    PROGRESS_TABLE,
+    SCREEN_FIELD_WEIGHTS,
+    WIZARD_FORMS,
+    compute_weighted_completion,
+)
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, get_request_profile
+from apps.user_profiles.views.autocomplete import WardAutocomplete
+from apps.user_profiles.views.htmx_autocomplete import htmx_load_constituencies, htmx_load_wards
+from apps.user_profiles.views.screen_1_basic_info_view import screen_1_basic_info
+from apps.user_profiles.views.screen_3_origin_and_residency import screen_3_origin_and_residency
+from apps.user_profiles.views.screen_4_civic_interests import screen_4_civic_interests
+from apps.user_profiles.views.screen_7_confirmation_and_save_view import screen_7_confirmation_and_save
+
+User = get_user_model()
+
+
+class WizardQueryBudgetTests(TestCase):
+    """
+    Wizard screens load the profile once per request (foreign keys joined,
+    interests prefetched) and resolve the next incomplete screen once, so each
+    request stays within a fixed query budget. Reference choices come from
+    the process snapshots, warmed in setUp.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.age_range = AgeRange.objects.create(code="age_25_34", label="25–34", position=1)
+        cls.gender = Gender.objects.create(code="female", label="Female")
+        cls.education = EducationLevel.objects.create(code="degree", label="Degree", position=1)
+        cls.residency = ResidencyType.objects.create(code="urban", label="Urban", position=1)
+        cls.county = County.objects.create(code="047", name="Nairobi")
+        cls.constituency = Constituency.objects.create(name="Westlands", county=cls.county)
+        cls.ward = Ward.objects.create(name="Parklands", constituency=cls.constituency)
+        cls.interests = [
+            CivicInterestArea.objects.create(code=code, label=code.title())
+            for code in ("health", "youth", "elections")
+        ]
+
+        cls.user = User.objects.create_user(
+            phone_number="+254712345678", nickname="Wanjiru", password="a-long-civic-passphrase"
+        )
+
+    def setUp(self):
+        self.user.refresh_from_db()
+        self.profile = self.user.userprofile
+        # Snapshots built by other test classes hold their (rolled back) rows
+        invalidate_reference_choices()
+        for model in REFERENCE_CHOICE_MODELS:
+            get_choice_snapshot(model)
+
+    def make_request(self, data=None, path="/profile/register/"):
+        factory = RequestFactory()
+        request = factory.post(path, data) if data is not None else factory.get(path)
+        request.user = User.objects.get(pk=self.user.pk)
+        request.session = SessionStore()
+        request._messages = FallbackStorage(request)
+        return request
+
+    def complete_screens(self, *screens):
+        fields = {
+            1: {"age_range": self.age_range, "gender": self.gender, "education_level": self.education},
+            2: {"county": self.county, "constituency": self.constituency, "ward": self.ward},
+            3: {"county_of_origin": self.county, "current_country_of_residence": "KE",
+                "residency_type": self.residency},
+        }
+        for screen in screens:
+            for name, value in fields[screen].items():
+                setattr(self.profile, name, value)
+        self.profile.save()
+
+    def test_request_profile_is_loaded_once(self):
+        request = self.make_request()
+
+        with self.assertNumQueries(1):
+            profile = get_request_profile(request)
+            self.assertIs(get_request_profile(request), profile)
+            self.assertIs(request.user.userprofile, profile)
+
+    def test_anonymous_request_costs_no_queries(self):
+        request = RequestFactory().get("/")
+        request.user = AnonymousUser()
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_request_profile(request))
+
+    def test_next_screen_is_memoized(self):
+        request = self.make_request()
+
+        # profile only: the screen is a stored column
+        with self.assertNumQueries(1):
+            self.assertEqual(get_next_wizard_screen(request), "user_profiles:screen_1")
+        with self.assertNumQueries(0):
+            self.assertEqual(get_next_wizard_screen(request), "user_profiles:screen_1")
+
+    def test_redirect_guard_budget(self):
+        self.complete_screens(1, 2)
+
+        request = self.make_request()
+
+        # profile + interests prefetch
+        with self.assertNumQueries(2):
+            response = screen_1_basic_info(request)
+
+        self.assertEqual(response.status_code, 302)
+
+    def test_screen_1_get_budget(self):
+        request = self.make_request()
+
+        # profile + interests prefetch; the choice lists are cached
+        with self.assertNumQueries(2):
+            response = screen_1_basic_info(request)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_screen_1_post_budget(self):
+        data = {
+            "age_range": self.age_range.pk,
+            "gender": self.gender.pk,
+            "education_level": self.education.pk,
+        }
+
+        request = self.make_request(data)
+
+        # profile + interests prefetch + update; ids are checked against the snapshots
+        with self.assertNumQueries(3):
+            response = screen_1_basic_info(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.gender, self.gender)
+
+    def test_screen_3_get_budget(self):
+        self.complete_screens(1, 2)
+
+        request = self.make_request()
+
+        # profile + interests prefetch; county and residency choices are cached
+        with self.assertNumQueries(2):
+            response = screen_3_origin_and_residency(request)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_screen_4_post_budget(self):
+        self.complete_screens(1, 2, 3)
+        data = {
+            "civic_interest_areas": [interest.pk for interest in self.interests[:2]],
+            "has_voted_before": "True",
+            "knows_voting_process": "False",
+        }
+
+        request = self.make_request(data)
+
+        # profile + interests prefetch + update
+        # + current links, missing links and insert (set())
+        # + next wizard screen refresh (interests check, update)
+        with self.assertNumQueries(8):
+            response = screen_4_civic_interests(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.profile.civic_interest_areas.count(), 2)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.next_wizard_screen, "user_profiles:screen_5")
+
+    def test_screen_7_get_budget(self):
+        self.complete_screens(1, 2, 3)
+
+        request = self.make_request()
+
+        # Guard redirects to screen 4 (interests missing) from the prefetch cache
+        with self.assertNumQueries(2):
+            response = screen_7_confirmation_and_save(request)
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, "/profile/register/civic-interests/")
+
+
+class ProgressTableTests(SimpleTestCase):
+    """
+    The precomputed progress table must match what the wizard forms define.
+    """
+
+    def test_weights_match_form_fields(self):
+        self.assertEqual(
+            SCREEN_FIELD_WEIGHTS,
+            tuple(len(form_class().fields) for form_class in WIZARD_FORMS),
+        )
+
+    def test_table_matches_form_definitions(self):
+        field_counts = [len(form_class().fields) for form_class in WIZARD_FORMS]
+        total = sum(field_counts)
+
+        self.assertIsInstance(PROGRESS_TABLE, tuple)
+        self.assertEqual(len(PROGRESS_TABLE), len(WIZARD_FORMS) + 1)
+        for step in range(len(WIZARD_FORMS) + 1):
+            expected = int((sum(field_counts[:step]) / total) * 100)
+            self.assertEqual(compute_weighted_completion(step), expected)
+        self.assertEqual(PROGRESS_TABLE[-1], 100)
+
+    def test_lookup_builds_no_forms(self):
+        with mock.patch.object(WIZARD_FORMS[0], "__init__", side_effect=AssertionError):
+            self.assertEqual(compute_weighted_completion(1), PROGRESS_TABLE[1])
+
+    def test_out_of_range_steps_are_clamped(self):
+        self.assertEqual(compute_weighted_completion(0), 0)
+        self.assertEqual(compute_weighted_completion(99), 100)
+
+
+class ProfileProgressTests(TestCase):
+    """
+    completion_percentage, next_wizard_screen and civic_interest_count are
+    stored snapshots: save() refreshes them only when a counted field changes,
+    and interest changes from either side of the relation refresh them too.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.age_range = AgeRange.objects.create(code="age_25_34", label="25–34", position=1)
+        cls.gender = Gender.objects.create(code="female", label="Female")
+        cls.education = EducationLevel.objects.create(code="degree", label="Degree", position=1)
+        cls.residency = ResidencyType.objects.create(code="urban", label="Urban", position=1)
+        cls.county = County.objects.create(code="047", name="Nairobi")
+        cls.constituency = Constituency.objects.create(name="Westlands", county=cls.county)
+        cls.ward = Ward.objects.create(name="Parklands", constituency=cls.constituency)
+        cls.interest = CivicInterestArea.objects.create(code="health", label="Health")
+
+    def setUp(self):
+        user = User.objects.create_user(
+            phone_number="+254712345678", nickname="Wanjiru", password="a-long-civic-passphrase"
+        )
+        self.profile = user.userprofile
+        for name, value in {
+            "age_range": self.age_range, "gender": self.gender, "education_level": self.education,
+            "county": self.county, "constituency": self.constituency, "ward": self.ward,
+            "county_of_origin": self.county, "current_country_of_residence": "KE",
+            "residency_type": self.residency, "has_voted_before": True, "knows_voting_process": False,
+        }.items():
+            setattr(self.profile, name, value)
+        self.profile.save()
+
+    def stored_screen(self):
+        return UserProfile.objects.values_list("next_wizard_screen", flat=True).get(pk=self.profile.pk)
+
+    def test_save_stores_next_screen(self):
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_4")
+
+    def test_save_with_update_fields_stores_next_screen(self):
+        self.profile.civic_interest_areas.add(self.interest)
+        self.profile.wants_bill_notifications = False
+        self.profile.save(update_fields=["wants_bill_notifications"])
+
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_6")
+
+    def test_interest_changes_refresh_next_screen(self):
+        self.profile.civic_interest_areas.add(self.interest)
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_5")
+        self.assertEqual(self.profile.next_wizard_screen, "user_profiles:screen_5")
+
+        self.profile.civic_interest_areas.clear()
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_4")
+
+    def test_reverse_interest_changes_refresh_next_screen(self):
+        self.interest.userprofile_set.add(self.profile)
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_5")
+
+        self.interest.userprofile_set.clear()
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_4")
+
+    def test_save_without_counted_changes_skips_recompute(self):
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+
+        with self.assertNumQueries(1):
+            profile.last_wizard_login_at = timezone.now()
+            profile.save(update_fields=["last_wizard_login_at"])
+        with self.assertNumQueries(1):
+            profile.registration_ip = "127.0.0.1"
+            profile.save()
+
+    def test_partial_save_keeps_other_unsaved_changes_dirty(self):
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        before = profile.completion_percentage
+
+        profile.wants_bill_notifications = False
+        profile.last_wizard_login_at = timezone.now()
+        profile.save(update_fields=["last_wizard_login_at"])
+        # wants_bill_notifications was not saved, so this save must recompute
+        profile.save()
+
+        profile.refresh_from_db()
+        self.assertIs(profile.wants_bill_notifications, False)
+        self.assertGreater(profile.completion_percentage, before)
+        self.assertEqual(profile.completion_percentage, profile.calculate_completion())
+
+    def test_dirty_counted_field_recomputes_completion(self):
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        before = profile.completion_percentage
+
+        profile.wants_bill_notifications = False
+        profile.save()
+
+        profile.refresh_from_db()
+        self.assertGreater(profile.completion_percentage, before)
+        self.assertEqual(profile.next_wizard_screen, "user_profiles:screen_4")
+
+    def test_interest_changes_update_count_and_completion(self):
+        before = self.profile.completion_percentage
+
+        self.profile.civic_interest_areas.add(self.interest)
+
+        profile = UserProfile.objects.get(pk=self.profile.pk)
+        self.assertEqual(profile.civic_interest_count, 1)
+        self.assertGreater(profile.completion_percentage, before)
+
+    def test_recompute_command_repairs_snapshots(self):
+        self.profile.civic_interest_areas.add(self.interest)
+        expected = UserProfile.objects.values_list(
+            "civic_interest_count", "completion_percentage", "next_wizard_screen"
+        ).get(pk=self.profile.pk)
+        UserProfile.objects.update(
+            civic_interest_count=0, completion_percentage=0, next_wizard_screen="user_profiles:screen_1"
+        )
+
+        call_command("recompute_profile_completion", batch_size=1, stdout=StringIO())
+
+        self.assertEqual(
+            UserProfile.objects.values_list(
+                "civic_interest_count", "completion_percentage", "next_wizard_screen"
+            ).get(pk=self.profile.pk),
+            expected,
+        )
+
+    def test_migration_backfills_next_screen(self):
+        migration = importlib.import_module("apps.user_profiles.migrations.0008_userprofile_next_wizard_screen")
+        UserProfile.objects.update(next_wizard_screen="user_profiles:screen_1")
+
+        migration.backfill_next_wizard_screen(django_apps, None)
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_4")
+
+        self.profile.civic_interest_areas.add(self.interest)
+        UserProfile.objects.update(
+            wants_bill_notifications=True, next_wizard_screen="user_profiles:screen_1"
+        )
+        migration.backfill_next_wizard_screen(django_apps, None)
+        # Opted in without a WhatsApp number
+        self.assertEqual(self.stored_screen(), "user_profiles:screen_5")
+        self.assertEqual(self.stored_screen(), UserProfile.objects.get(pk=self.profile.pk).get_next_incomplete_screen())
+
+
+class LocationBundleTests(SimpleTestCase):
+    """
+    The static location bundle mirrors the in-memory hierarchy.
+    """
+
+    def setUp(self):
+        self.hierarchy = LocationHierarchy(
+            counties=[(2, "047", "Nairobi"), (1, "001", "Mombasa")],
+            constituencies=[(20, "Westlands", 2), (10, "Nyali", 1), (21, "Embakasi", 2)],
+            wards=[(200, "Parklands", 20, -1.26, 36.81), (100, "Kongowea", 10, None, None)],
+        )
+
+    def test_payload_is_parent_indexed(self):
+        payload = serialize_hierarchy(self.hierarchy)
+
+        self.assertEqual(payload["counties"], [[1, "Mombasa"], [2, "Nairobi"]])
+        self.assertEqual(payload["constituencies"], [[10, "Nyali", 0], [21, "Embakasi", 1], [20, "Westlands", 1]])
+        self.assertEqual(payload["wards"], [[100, "Kongowea", 0], [200, "Parklands", 2]])
+        self.assertEqual(
+            serialize_hierarchy(self.hierarchy, coordinates=True)["wards"][1],
+            [200, "Parklands", 2, -1.26, 36.81],
+        )
+
+    def test_bundle_name_follows_content(self):
+        with tempfile.TemporaryDirectory() as directory:
+            manifest = write_location_bundle(self.hierarchy, output_dir=directory)
+            again = write_location_bundle(self.hierarchy, output_dir=directory)
+            with_coordinates = write_location_bundle(self.hierarchy, output_dir=directory, coordinates=True, keep=1)
+
+            self.assertEqual(manifest["bundle"], again["bundle"])
+            self.assertNotEqual(manifest["bundle"], with_coordinates["bundle"])
+            self.assertEqual(
+                json.loads((Path(directory) / "manifest.json").read_text())["bundle"],
+                with_coordinates["bundle"],
+            )
+            # Older bundles pruned down to --keep
+            self.assertEqual(
+                [path.name for path in Path(directory).glob("locations.*.json")],
+                [Path(with_coordinates["bundle"]).name],
+            )
+
+
+class LocationDisplayPathTests(TestCase):
+    """
+    Location labels and ordering come from stored columns, not parent lookups.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.county = County.objects.create(code="047", name="Nairobi")
+        cls.constituency = Constituency.objects.create(name="Westlands", county=cls.county)
+        cls.ward = Ward.objects.create(name="Parklands", constituency=cls.constituency)
+        Ward.objects.create(name="Kangemi", constituency=cls.constituency)
+
+    def test_listing_wards_is_one_query(self):
+        with self.assertNumQueries(1):
+            labels = [str(ward) for ward in Ward.objects.all()]
+        self.assertEqual(labels, ["Kangemi — Westlands, Nairobi", "Parklands — Westlands, Nairobi"])
+
+        with self.assertNumQueries(1):
+            self.assertEqual([str(c) for c in Constituency.objects.all()], ["Westlands — Nairobi"])
+
+    def test_renaming_a_parent_rewrites_paths(self):
+        self.constituency.name = "Westlands East"
+        self.constituency.save()
+        self.county.name = "Nairobi City"
+        self.county.code = "048"
+        self.county.save()
+
+        self.ward.refresh_from_db()
+        self.assertEqual(self.ward.display_path, "Parklands — Westlands East, Nairobi City")
+        self.assertEqual((self.ward.county_code, self.ward.constituency_name), ("048", "Westlands East"))
+        self.assertEqual(str(Constituency.objects.get()), "Westlands East — Nairobi City")
+
+
+class LocationOptionsViewTests(TestCase):
+    """
+    The HTMX option endpoints serve pre-rendered fragments from the
+    in-memory hierarchy, revalidated by ETag.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.county = County.objects.create(code="047", name="Nairobi")
+        cls.constituency = Constituency.objects.create(name="Westlands", county=cls.county)
+        cls.ward = Ward.objects.create(name="Parklands", constituency=cls.constituency)
+        cls.user = User.objects.create_user(
+            phone_number="+254712345678", nickname="Wanjiru", password="a-long-civic-passphrase"
+        )
+
+    def setUp(self):
+        # Hierarchies built by other test classes hold their (rolled back) rows
+        location_hierarchy.invalidate()
+        self.addCleanup(location_hierarchy.invalidate)
+
+    def get(self, view, etag=None, **params):
+        headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+        request = RequestFactory().get("/profile/register/htmx/", params, **headers)
+        request.user = self.user
+        return view(request)
+
+    def test_matching_etag_returns_304(self):
+        response = self.get(htmx_load_constituencies, county=self.county.pk)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Westlands", response.content.decode())
+        self.assertTrue(response["ETag"])
+
+        revalidated = self.get(htmx_load_constituencies, etag=response["ETag"], county=self.county.pk)
+        self.assertEqual(revalidated.status_code, 304)
+
+    def test_location_edit_changes_etag(self):
+        before = self.get(htmx_load_wards, constituency=self.constituency.pk)
+
+        # post_save → location_hierarchy_sync invalidates on commit
+        with self.captureOnCommitCallbacks(execute=True):
+            Ward.objects.create(name="Kangemi", constituency=self.constituency)
+
+        after = self.get(htmx_load_wards, etag=before["ETag"], constituency=self.constituency.pk)
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        self.assertIn("Kangemi", after.content.decode())
+
+    def test_warm_hierarchy_serves_without_queries(self):
+        self.get(htmx_load_constituencies, county=self.county.pk)
+
+        with self.assertNumQueries(0):
+            constituencies = self.get(htmx_load_constituencies, county=self.county.pk)
+            wards = self.get(htmx_load_wards, constituency=self.constituency.pk)
+        self.assertEqual((constituencies.status_code, wards.status_code), (200, 200))
+
+    def test_missing_parameter_is_rejected(self):
+        self.assertEqual(self.get(htmx_load_constituencies).status_code, 400)
+        self.assertEqual(self.get(htmx_load_wards).status_code, 400)
+
+
+class LocationAutocompleteTests(TestCase):
+    """
+    Typed autocomplete queries rank only the index matches needed up to the
+    requested page, and Select2 pagination still reports further pages.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        county = County.objects.create(code="047", name="Nairobi")
+        cls.constituency = Constituency.objects.create(name="Westlands", county=county)
+        Ward.objects.bulk_create([
+            Ward(name=f"Karura {number:02}", constituency=cls.constituency) for number in range(1, 26)
+        ])
+        rebuild_location_paths()
+
+    def setUp(self):
+        location_hierarchy.invalidate()
+        self.addCleanup(location_hierarchy.invalidate)
+
+    def get_page(self, page):
+        request = RequestFactory().get("/profiles/autocomplete/wards/", {"q": "karura", "page": page})
+        request.user = AnonymousUser()
+        with mock.patch(
+            "apps.user_profiles.views.autocomplete.search_locations", wraps=search_locations,
+        ) as search:
+            response = WardAutocomplete.as_view()(request)
+        return json.loads(response.content), search.call_args.kwargs["limit"]
+
+    def test_search_is_limited_to_the_requested_page(self):
+        first, limit = self.get_page(1)
+        self.assertEqual(limit, 11)
+        self.assertEqual(len(first["results"]), 10)
+        self.assertTrue(first["pagination"]["more"])
+
+        last, limit = self.get_page(3)
+        self.assertEqual(limit, 31)
+        self.assertEqual(len(last["results"]), 5)
+        self.assertFalse(last["pagination"]["more"])
+
+        pages = [result["text"] for page in (1, 2, 3) for result in self.get_page(page)[0]["results"]]
+        self.assertEqual(len(set(pages)), 25)
+
+
+class LocationSearchTests(SimpleTestCase):
+    """
+    Prefix search ignores accents and punctuation and ranks by match, then popularity.
+    """
+
+    def setUp(self):
+        self.index = PrefixIndex([
+            (1, "Lang’ata", 47, "Nairobi 047"),
+            (2, "Kibra", 47, "Nairobi 047"),
+            (3, "Mathare North", 47, "Nairobi 047"),
+            (4, "North Mugirango", 46, "Nyamira 046"),
+            (5, "Northern Kibra", 47, "Nairobi 047"),
+            (6, "South B", 47, "Nairobi 047"),
+        ])
+
+    def test_normalization(self):
+        self.assertEqual(normalize_search_text("Lang’ata"), "langata")
+        self.assertEqual(normalize_search_text("  Kabete-Kiambaa "), "kabete kiambaa")
+        self.assertEqual(normalize_search_text("Kéllo"), "kello")
+
+    def test_apostrophes_and_case_do_not_matter(self):
+        for query in ("langata", "Lang'ata", "LANG’A"):
+            self.assertEqual(self.index.search(query), [1])
+
+    def test_words_and_run_together_names(self):
+        self.assertEqual(self.index.search("north ma"), [3])
+        self.assertEqual(self.index.search("southb"), [6])
+        self.assertEqual(self.index.search("ibra"), [])
+
+    def test_ranking(self):
+        # Name prefix before later-word prefix; popularity breaks ties
+        self.assertEqual(self.index.search("north"), [4, 5, 3])
+        self.assertEqual(self.index.search("north", popularity={5: 10}), [5, 4, 3])
+
+    def test_parent_filter_and_context(self):
+        self.assertEqual(self.index.search("north", parent_id=46), [4])
+        self.assertEqual(self.index.search("nyamira"), [])
+        self.assertEqual(self.index.search("nyamira", include_context=True), [4])
+
+
+class WardLocatorTests(SimpleTestCase):
+    """
+    The grid locator returns the same wards as a brute-force distance sort.
+    """
+
+    def setUp(self):
+        rng = random.Random(7)
+        self.wards = [
+            (pk, f"Ward {pk}", 10 + pk % 5, rng.uniform(-4.5, 4.5), rng.uniform(34.0, 41.5))
+            for pk in range(1, 301)
+        ]
+        self.wards.append((999, "Unmapped", 10, None, None))
+        hierarchy = LocationHierarchy(
+            counties=[(1, "047", "Nairobi")],
+            constituencies=[(10 + i, f"Constituency {i}", 1) for i in range(5)],
+            wards=self.wards,
+        )
+        self.locator = WardLocator(hierarchy, cell_degrees=0.5)
+
+    def brute_force(self, latitude, longitude, limit):
+        mapped = [ward for ward in self.wards if ward[3] is not None]
+        mapped.sort(key=lambda ward: haversine_km(latitude, longitude, ward[3], ward[4]))
+        return [ward[0] for ward in mapped[:limit]]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(11)
+        for _ in range(200):
+            latitude, longitude = rng.uniform(-5, 5), rng.uniform(33.5, 42)
+            found = [ward.ward_id for ward in self.locator.nearest(latitude, longitude, limit=3)]
+            self.assertEqual(found, self.brute_force(latitude, longitude, 3))
+
+    def test_results_carry_parents_and_skip_unmapped_wards(self):
+        self.assertEqual(len(self.locator), 300)
+        nearest = self.locator.nearest(self.wards[0][3], self.wards[0][4], limit=1)[0]
+        self.assertEqual((nearest.ward_id, nearest.constituency_id, nearest.county_name), (1, 11, "Nairobi"))
+        self.assertAlmostEqual(nearest.distance_km, 0.0)
+
+    def test_max_km(self):
+        self.assertEqual(self.locator.nearest(51.5, -0.12, max_km=50), [])
+
+
+class ImportKenyanLocationsTests(TestCase):
+    """
+    The bulk importer loads the hierarchy in one pass and reports a diff.
+    """
+
+    HEADER = "County,Constituency,Ward,Latitude,Longitude\n"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.counties_file = Path(self.directory.name) / "counties.csv"
+        self.counties_file.write_text("code,name\n047,Nairobi\n001,Mombasa\n", encoding="utf-8")
+        # Keep the rebuilt location bundle out of build/static
+        self.build_dir = Path(self.directory.name) / "static"
+        build_settings = override_settings(CEENI_STATIC_BUILD_DIR=self.build_dir)
+        build_settings.enable()
+        self.addCleanup(build_settings.disable)
+
+    def run_import(self, rows, **options):
+        locations_file = Path(self.directory.name) / "locations.csv"
+        locations_file.write_text(self.HEADER + "".join(f"{row}\n" for row in rows), encoding="utf-8")
+        out = StringIO()
+        call_command(
+            "import_kenyan_locations",
+            counties_file=self.counties_file,
+            locations_file=locations_file,
+            stdout=out,
+            **options,
+        )
+        return out.getvalue()
+
+    def test_import_then_diff(self):
+        self.run_import([
+            "Nairobi,Westlands,Parklands,-1.26,36.81",
+            "Nairobi,Westlands,Karura,-1.23,36.83",
+            "Nairobi,Westlands,Karura,-9,-9",  # duplicate row: first wins
+            "Nairobi,Langata,Karen,-1.32,36.71",
+            "Mombasa,Nyali,Kongowea,,",
+        ])
+        self.assertEqual(Ward.objects.count(), 4)
+        self.assertEqual(str(Ward.objects.get(name="Karura")), "Karura — Westlands, Nairobi")
+        self.assertEqual(County.objects.get(name="Mombasa").code, "001")
+
+        karura = Ward.objects.get(name="Karura")
+        karen = Ward.objects.get(name="Karen")
+        output = self.run_import([
+            "Nairobi,Westlands,Parklands,-1.27,36.81",      # coordinates
+            "Nairobi,Westlands,Karura Forest,-1.23,36.83",  # renamed
+            "Nairobi,Westlands,Karen,-1.32,36.71",          # moved
+            "Mombasa,Nyali,Kongowea,,",
+        ])
+
+        self.assertRegex(output, r"wards\s+0\s+1\s+1\s+0\s+1\s+1\s+0")
+        karura.refresh_from_db()
+        karen.refresh_from_db()
+        self.assertEqual(karura.display_path, "Karura Forest — Westlands, Nairobi")
+        self.assertEqual(karen.display_path, "Karen — Westlands, Nairobi")
+        self.assertEqual(Ward.objects.get(name="Parklands").latitude, -1.27)
+
+    def test_dry_run_writes_nothing(self):
+        output = self.run_import(["Nairobi,Westlands,Parklands,-1.26,36.81"], dry_run=True)
+        self.assertIn("[dry run]", output)
+        self.assertFalse(County.objects.exists())
+        self.assertIsNone(read_location_manifest())
+
+    def test_import_rebuilds_the_location_bundle(self):
+        self.run_import(["Nairobi,Westlands,Parklands,-1.26,36.81"])
+        manifest = read_location_manifest()
+        self.assertEqual(manifest["wards"], 1)
+        self.assertTrue((self.build_dir / manifest["bundle"]).exists())
+        self.assertEqual(get_location_bundle_url(), f"/static/{manifest['bundle']}")
+
+        # Skipped (unchanged) import: the existing bundle stays
+        output = self.run_import(["Nairobi,Westlands,Parklands,-1.26,36.81"])
+        self.assertIn("skipped", output)
+        self.assertEqual(read_location_manifest(), manifest)
+
+        self.run_import(["Nairobi,Westlands,Parklands,-1.26,36.81", "Nairobi,Westlands,Karura,-1.23,36.83"])
+        self.assertEqual(read_location_manifest()["wards"], 2)
+
+        self.run_import(["Mombasa,Nyali,Kongowea,,"], skip_bundle=True)
+        self.assertEqual(read_location_manifest()["wards"], 2)
+
+
+class ReferenceImportTests(TestCase):
+    """
+    Declarative reference importers sync in bulk and skip unchanged files.
+    """
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.csv_dir = Path(directory.name)
+        settings_override = override_settings(CSV_DATA_DIR=self.csv_dir)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def import_genders(self, content):
+        (self.csv_dir / "genders.csv").write_text(content, encoding="utf-8")
+        out = StringIO()
+        call_command("import_genders", stdout=out)
+        return out.getvalue()
+
+    def test_create_skip_update(self):
+        output = self.import_genders("code,label\nM,Male\nF,Female\n,Missing code\n")
+        self.assertIn("2 created", output)
+        self.assertEqual(list(Gender.objects.values_list("code", "position")), [("M", 1), ("F", 2)])
+
+        self.assertIn("skipped", self.import_genders("code,label\nM,Male\nF,Female\n,Missing code\n"))
+
+        output = self.import_genders("code,label\nF,Female\nM,Man\n")
+        self.assertIn("0 created, 2 updated", output)
+        self.assertEqual(list(Gender.objects.values_list("code", "label", "position")), [("F", "Female", 1), ("M", "Man", 2)])
+
+    def test_wiped_table_is_reseeded(self):
+        content = "code,label\nM,Male\n"
+        self.import_genders(content)
+        Gender.objects.all().delete()
+        self.assertIn("1 created", self.import_genders(content))
+
+
+class ReferenceChoicesTests(TestCase):
+    """
+    Wizard choice fields render and validate from per-process snapshots of
+    the reference tables, kept current by the signals and the importers.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.genders = [
+            Gender.objects.create(code="female", label="Female", position=1),
+            Gender.objects.create(code="male", label="Male", position=2),
+        ]
+        cls.interests = [
+            CivicInterestArea.objects.create(code=code, label=code.title())
+            for code in ("youth", "health", "elections", "land", "water", "roads")
+        ]
+
+    def setUp(self):
+        invalidate_reference_choices()
+
+    def test_snapshot_is_loaded_once(self):
+        with self.assertNumQueries(1):
+            snapshot = get_choice_snapshot(Gender)
+        with self.assertNumQueries(0):
+            self.assertIs(get_choice_snapshot(Gender), snapshot)
+
+        # Default ordering; handed-out rows are copies
+        self.assertEqual([gender.label for gender in snapshot.objects], ["Female", "Male"])
+        self.assertEqual(snapshot.get(self.genders[1].pk), self.genders[1])
+        self.assertIsNot(snapshot.get(self.genders[1].pk), snapshot.get(self.genders[1].pk))
+        self.assertIsNone(snapshot.get("999"))
+
+    def test_wizard_forms_use_cached_fields(self):
+        form = Screen1BasicInfoForm()
+        self.assertIsInstance(form.fields["gender"], CachedModelChoiceField)
+        self.assertIsInstance(Screen4CivicInterestsForm().fields["civic_interest_areas"], CachedModelMultipleChoiceField)
+
+        get_choice_snapshot(Gender)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [str(value) for value, _ in form.fields["gender"].choices],
+                ["", str(self.genders[0].pk), str(self.genders[1].pk)],
+            )
+
+    def test_validation_needs_no_queries(self):
+        for model in (AgeRange, Gender, EducationLevel, CivicInterestArea):
+            get_choice_snapshot(model)
+
+        with self.assertNumQueries(0):
+            form = Screen1BasicInfoForm({"gender": self.genders[1].pk, "age_range": "999", "education_level": ""})
+            self.assertFalse(form.is_valid())
+        self.assertEqual(form.cleaned_data["gender"], self.genders[1])
+        self.assertEqual(form.errors["age_range"][0].split(".")[0], "Select a valid choice")
+
+        data = {
+            "civic_interest_areas": [interest.pk for interest in self.interests],
+            "has_voted_before": "True",
+            "knows_voting_process": "True",
+        }
+        with self.assertNumQueries(0):
+            form = Screen4CivicInterestsForm(data)
+            self.assertFalse(form.is_valid())
+        self.assertIn("up to 5", form.errors["civic_interest_areas"][0])
+
+        data["civic_interest_areas"] = [self.interests[0].pk, self.interests[1].pk]
+        with self.assertNumQueries(0):
+            form = Screen4CivicInterestsForm(data)
+            self.assertTrue(form.is_valid())
+        # Snapshot (label) order, not posted order
+        self.assertEqual([interest.code for interest in form.cleaned_data["civic_interest_areas"]], ["health", "youth"])
+
+    def test_edits_invalidate_the_snapshot(self):
+        get_choice_snapshot(Gender)
+        version = reference_choices[Gender].version
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Gender.objects.create(code="other", label="Other", position=3)
+
+        self.assertIsNone(reference_choices[Gender].version)
+        self.assertEqual(len(get_choice_snapshot(Gender)), 3)
+        self.assertNotEqual(reference_choices[Gender].version, version)
+
+    def test_imports_invalidate_the_snapshot(self):
+        get_choice_snapshot(Gender)
+
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "genders.csv").write_text("code,label\nfemale,Woman\n", encoding="utf-8")
+            with override_settings(CSV_DATA_DIR=Path(directory)), self.captureOnCommitCallbacks(execute=True):
+                call_command("import_genders", stdout=StringIO())
+
+        self.assertIsNone(reference_choices[Gender].version)
+        self.assertEqual(get_choice_snapshot(Gender).get(self.genders[0].pk).label, "Woman")
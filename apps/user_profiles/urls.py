@@ -16,6 +16,7 @@ from .views.profile_resume_prompt import resume_or_logout
 
 # Utility and AJAX-related views
 from .views.htmx_autocomplete import htmx_load_constituencies, htmx_load_wards
+from .views.nearest_wards import nearest_wards
 from .views.profile_checker import profile_checker
 
 # ===============================
@@ -45,6 +46,11 @@ urlpatterns = [
     path('htmx/constituencies/', htmx_load_constituencies, name='htmx_constituencies'),
     path('htmx/wards/', htmx_load_wards, name='htmx_wards'),
 
+    # ------------------------------
+    # "Detect my ward": nearest wards to the browser's coordinates (JSON)
+    # ------------------------------
+    path('location/nearest-wards/', nearest_wards, name='nearest_wards'),
+
     # ------------------------------
     # Profile Completion Enforcer
     # Redirects incomplete user profiles back to the wizard
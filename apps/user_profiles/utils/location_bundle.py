@@ -0,0 +1,148 @@
+# apps/user_profiles/utils/location_bundle.py
+
+"""
+Static, content-hashed JSON bundle of the County → Constituency → Ward
+hierarchy, for client-side filtering of the location dropdowns.
+
+`build_location_bundle` writes `locations.<hash>.json` plus `manifest.json`
+under `user_profiles/locations/` in CEENI_STATIC_BUILD_DIR (build/static, a
+STATICFILES_DIRS entry kept out of the source tree); `import_kenyan_locations`
+rebuilds it after every import. The bundle is compact:
+
+    {
+      "version": 1,
+      "counties":       [[id, name], ...],
+      "constituencies": [[id, name, county_index], ...],
+      "wards":          [[id, name, constituency_index(, latitude, longitude)], ...]
+    }
+
+Indexes point into the parent array, and children are ordered by name within
+their parent, exactly like `LocationHierarchy`. Because the file name changes
+with the content, it can be cached forever; the manifest says which one is
+current.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.templatetags.static import static
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_STATIC_DIR = "user_profiles/locations"
+MANIFEST_NAME = "manifest.json"
+
+
+def serialize_hierarchy(hierarchy, coordinates=False):
+    """
+    Returns the bundle payload for a `LocationHierarchy`.
+    With `coordinates`, wards carry their latitude and longitude.
+    """
+    wards = []
+    for i, pk in enumerate(hierarchy.ward_ids):
+        ward = [pk, hierarchy.ward_names[i], hierarchy.ward_constituency[i]]
+        if coordinates:
+            ward += [hierarchy.ward_latitudes[i], hierarchy.ward_longitudes[i]]
+        wards.append(ward)
+
+    return {
+        "version": BUNDLE_FORMAT_VERSION,
+        "counties": [list(row) for row in zip(hierarchy.county_ids, hierarchy.county_names)],
+        "constituencies": [
+            list(row) for row in zip(
+                hierarchy.constituency_ids,
+                hierarchy.constituency_names,
+                hierarchy.constituency_county,
+            )
+        ],
+        "wards": wards,
+    }
+
+
+def default_bundle_dir():
+    return Path(settings.CEENI_STATIC_BUILD_DIR) / BUNDLE_STATIC_DIR
+
+
+def write_location_bundle(hierarchy, output_dir=None, coordinates=False, keep=3):
+    """
+    Writes the hashed bundle and its manifest. Older bundles beyond the `keep`
+    most recent are removed. Returns the manifest dict.
+    """
+    output_dir = Path(output_dir or default_bundle_dir())
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    payload = json.dumps(
+        serialize_hierarchy(hierarchy, coordinates),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    digest = hashlib.sha256(payload).hexdigest()
+    filename = f"locations.{digest[:12]}.json"
+
+    (output_dir / filename).write_bytes(payload)
+
+    manifest = {
+        "version": BUNDLE_FORMAT_VERSION,
+        "bundle": f"{BUNDLE_STATIC_DIR}/{filename}",
+        "sha256": digest,
+        "bytes": len(payload),
+        "coordinates": coordinates,
+        "counties": len(hierarchy.county_ids),
+        "constituencies": len(hierarchy.constituency_ids),
+        "wards": len(hierarchy.ward_ids),
+    }
+    manifest_path = output_dir / MANIFEST_NAME
+    temporary = manifest_path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    os.replace(temporary, manifest_path)  # Readers never see a half-written manifest
+
+    bundles = sorted(output_dir.glob("locations.*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for stale in bundles[max(keep, 1):]:
+        if stale.name != filename:
+            stale.unlink()
+
+    return manifest
+
+
+def rebuild_location_bundle(hierarchy, keep=3):
+    """
+    Rewrites the default bundle from `hierarchy`, keeping the coordinates
+    option of the current one. Returns the manifest, or None without counties.
+    """
+    if not hierarchy.county_ids:
+        return None
+    current = read_location_manifest() or {}
+    return write_location_bundle(hierarchy, coordinates=current.get("coordinates", False), keep=keep)
+
+
+_manifest_cache = {"path": None, "mtime": None, "manifest": None}
+
+
+def read_location_manifest():
+    """
+    Returns the current manifest, or None if no bundle has been built.
+    The manifest lives at a fixed path, so each call costs one stat(); the
+    file is re-read only when it changes.
+    """
+    path = default_bundle_dir() / MANIFEST_NAME
+
+    try:
+        mtime = os.stat(path).st_mtime
+        if _manifest_cache["path"] != path or _manifest_cache["mtime"] != mtime:
+            with open(path, encoding="utf-8") as f:
+                manifest = json.load(f)
+            _manifest_cache.update(path=path, mtime=mtime, manifest=manifest)
+    except (OSError, ValueError):
+        return None
+
+    return _manifest_cache["manifest"]
+
+
+def get_location_bundle_url():
+    """Static URL of the current location bundle, or None."""
+    manifest = read_location_manifest()
+    if not manifest or manifest.get("version") != BUNDLE_FORMAT_VERSION:
+        return None
+    return static(manifest["bundle"])
@@ -0,0 +1,172 @@
+# apps/user_profiles/utils/location_hierarchy.py
+
+"""
+In-memory County → Constituency → Ward hierarchy.
+
+The location tables change roughly once per electoral boundary review, yet
+the wizard's dependent dropdowns used to query and re-render them on every
+change. The hierarchy is now read once per process (three queries) into
+compact, parent-indexed arrays:
+
+    county_ids / county_codes / county_names
+    constituency_ids / constituency_names / constituency_county   (county index)
+    ward_ids / ward_names / ward_constituency / ward_latitudes / ward_longitudes
+
+Children are stored contiguously, ordered by name, so `constituency_spans[i]`
+and `ward_spans[j]` give the (start, stop) slice of county `i`'s
+constituencies and constituency `j`'s wards.
+
+The `<option>` fragments served by the HTMX endpoints are pre-rendered per
+parent id, each with a strong ETag derived from its content. The snapshot
+is a `ProcessCache`, invalidated by the location signals and by
+`import_kenyan_locations`.
+"""
+
+import hashlib
+from typing import NamedTuple
+
+from django.template.loader import render_to_string
+
+from apps.common.utils.process_cache import ProcessCache
+from apps.user_profiles.models import County, Constituency, Ward
+
+CONSTITUENCY_OPTIONS_TEMPLATE = "user_profiles/partials/_constituency_options.html"
+WARD_OPTIONS_TEMPLATE = "user_profiles/partials/_ward_options.html"
+
+
+class LocationOption(NamedTuple):
+    """What the option templates read from each location."""
+    id: int
+    name: str
+
+
+class OptionsFragment(NamedTuple):
+    """A pre-rendered `<option>` list and its strong ETag."""
+    html: str
+    etag: str
+
+
+def make_fragment(template_name, context):
+    html = render_to_string(template_name, context)
+    return OptionsFragment(html, hashlib.sha1(html.encode("utf-8")).hexdigest())
+
+
+def children_spans(parent_indexes, parent_count):
+    """
+    (start, stop) of each parent's children in an array sorted by parent index.
+    """
+    spans = [(0, 0)] * parent_count
+    start = 0
+    for position in range(1, len(parent_indexes) + 1):
+        if position == len(parent_indexes) or parent_indexes[position] != parent_indexes[start]:
+            spans[parent_indexes[start]] = (start, position)
+            start = position
+    return tuple(spans)
+
+
+class LocationHierarchy:
+    """
+    Immutable snapshot of the location tables.
+
+    Built from (id, code, name) counties, (id, name, county_id) constituencies
+    and (id, name, constituency_id, latitude, longitude) wards.
+    """
+
+    def __init__(self, counties, constituencies, wards):
+        counties = sorted(counties, key=lambda row: row[1])
+        self.county_ids = tuple(row[0] for row in counties)
+        self.county_codes = tuple(row[1] for row in counties)
+        self.county_names = tuple(row[2] for row in counties)
+        self.county_index = {pk: i for i, pk in enumerate(self.county_ids)}
+
+        constituencies = sorted(
+            (row for row in constituencies if row[2] in self.county_index),
+            key=lambda row: (self.county_index[row[2]], row[1]),
+        )
+        self.constituency_ids = tuple(row[0] for row in constituencies)
+        self.constituency_names = tuple(row[1] for row in constituencies)
+        self.constituency_county = tuple(self.county_index[row[2]] for row in constituencies)
+        self.constituency_index = {pk: i for i, pk in enumerate(self.constituency_ids)}
+        self.constituency_spans = children_spans(self.constituency_county, len(self.county_ids))
+
+        wards = sorted(
+            (row for row in wards if row[2] in self.constituency_index),
+            key=lambda row: (self.constituency_index[row[2]], row[1]),
+        )
+        self.ward_ids = tuple(row[0] for row in wards)
+        self.ward_names = tuple(row[1] for row in wards)
+        self.ward_constituency = tuple(self.constituency_index[row[2]] for row in wards)
+        self.ward_latitudes = tuple(row[3] for row in wards)
+        self.ward_longitudes = tuple(row[4] for row in wards)
+        self.ward_spans = children_spans(self.ward_constituency, len(self.constituency_ids))
+
+        self.empty_constituency_options = make_fragment(CONSTITUENCY_OPTIONS_TEMPLATE, {"constituencies": []})
+        self.empty_ward_options = make_fragment(WARD_OPTIONS_TEMPLATE, {"wards": []})
+
+        # Keyed by the id as sent in the query string
+        self._constituency_options = {
+            str(county_id): make_fragment(
+                CONSTITUENCY_OPTIONS_TEMPLATE,
+                {"constituencies": self.constituencies_of(county_id)},
+            )
+            for county_id in self.county_ids
+        }
+        self._ward_options = {
+            str(constituency_id): make_fragment(
+                WARD_OPTIONS_TEMPLATE,
+                {"wards": self.wards_of(constituency_id)},
+            )
+            for constituency_id in self.constituency_ids
+        }
+
+    def __len__(self):
+        return len(self.county_ids) + len(self.constituency_ids) + len(self.ward_ids)
+
+    # =============================
+    # Lookups
+    # =============================
+
+    def constituencies_of(self, county_id):
+        """Constituencies of a county, ordered by name ([] if unknown)."""
+        index = self.county_index.get(county_id)
+        if index is None:
+            return []
+        start, stop = self.constituency_spans[index]
+        return [
+            LocationOption(self.constituency_ids[i], self.constituency_names[i])
+            for i in range(start, stop)
+        ]
+
+    def wards_of(self, constituency_id):
+        """Wards of a constituency, ordered by name ([] if unknown)."""
+        index = self.constituency_index.get(constituency_id)
+        if index is None:
+            return []
+        start, stop = self.ward_spans[index]
+        return [LocationOption(self.ward_ids[i], self.ward_names[i]) for i in range(start, stop)]
+
+    def constituency_options(self, county_id):
+        """Pre-rendered constituency options for a county id (str or int)."""
+        return self._constituency_options.get(str(county_id).strip(), self.empty_constituency_options)
+
+    def ward_options(self, constituency_id):
+        """Pre-rendered ward options for a constituency id (str or int)."""
+        return self._ward_options.get(str(constituency_id).strip(), self.empty_ward_options)
+
+
+def build_location_hierarchy():
+    """Reads the three location tables (one query each) into a `LocationHierarchy`."""
+    return LocationHierarchy(
+        County.objects.order_by().values_list("pk", "code", "name"),
+        Constituency.objects.order_by().values_list("pk", "name", "county_id"),
+        Ward.objects.order_by().values_list("pk", "name", "constituency_id", "latitude", "longitude"),
+    )
+
+
+# Shared, process-level instance
+location_hierarchy = ProcessCache("location_hierarchy", build_location_hierarchy)
+
+
+def get_location_hierarchy():
+    """Returns this process's current location hierarchy."""
+    return location_hierarchy.get()
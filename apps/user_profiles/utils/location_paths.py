@@ -0,0 +1,55 @@
+# apps/user_profiles/utils/location_paths.py
+
+"""
+Bulk maintenance of the denormalized location columns
+(`county_code`, `constituency_name`, `display_path`).
+
+`save()` on County, Constituency and Ward keeps them current row by row;
+this rebuilds them for the whole table after bulk loads or raw edits,
+with three reads and bulk updates of the rows that actually changed.
+"""
+
+from django.db import transaction
+
+from apps.user_profiles.models import Constituency, County, Ward
+
+
+def rebuild_location_paths(batch_size=1000):
+    """
+    Recomputes the stored sort keys and display paths of every constituency
+    and ward. Returns (constituencies_updated, wards_updated).
+    """
+    counties = {
+        pk: (code, name)
+        for pk, code, name in County.objects.order_by().values_list("pk", "code", "name")
+    }
+
+    changed_constituencies = []
+    constituency_names = {}
+    for constituency in Constituency.objects.order_by().only("pk", "name", "county_id", "county_code", "display_path"):
+        code, county_name = counties[constituency.county_id]
+        constituency_names[constituency.pk] = (constituency.name, code, county_name)
+        path = Constituency.build_display_path(constituency.name, county_name)
+        if (constituency.county_code, constituency.display_path) != (code, path):
+            constituency.county_code, constituency.display_path = code, path
+            changed_constituencies.append(constituency)
+
+    changed_wards = []
+    for ward in Ward.objects.order_by().only(
+        "pk", "name", "constituency_id", "county_code", "constituency_name", "display_path",
+    ):
+        constituency_name, code, county_name = constituency_names[ward.constituency_id]
+        path = Ward.build_display_path(ward.name, constituency_name, county_name)
+        if (ward.county_code, ward.constituency_name, ward.display_path) != (code, constituency_name, path):
+            ward.county_code, ward.constituency_name, ward.display_path = code, constituency_name, path
+            changed_wards.append(ward)
+
+    with transaction.atomic():
+        Constituency.objects.bulk_update(
+            changed_constituencies, ["county_code", "display_path"], batch_size=batch_size,
+        )
+        Ward.objects.bulk_update(
+            changed_wards, ["county_code", "constituency_name", "display_path"], batch_size=batch_size,
+        )
+
+    return len(changed_constituencies), len(changed_wards)
@@ -0,0 +1,253 @@
+# apps/user_profiles/utils/location_search.py
+
+"""
+In-memory prefix search over constituency and ward names.
+
+Names are normalized before indexing and searching: accents are stripped,
+apostrophes dropped and other punctuation treated as spaces, so `langata`,
+`Lang'ata` and `Lang’ata` are the same word. Each location is indexed under
+every word of its name plus the whole name run together (`southb` finds
+"South B"). The tokens sit in one sorted array per model and a prefix is
+answered with two bisections.
+
+A query matches a location when every query word is a prefix of one of its
+tokens. Admin searches may also match the parents' names and county code
+(context tokens), as the old `display_path` search did. Matches are ranked:
+
+    1. the name equals the query
+    2. the name starts with the query
+    3. a later word starts with the query
+    4. only the context matches
+    then by popularity (profiles registered there), then by name.
+
+The index is derived from the location hierarchy snapshot and rebuilt when
+that changes. Popularity counts are a separate snapshot refreshed every
+CEENI_LOCATION_POPULARITY_MAX_AGE seconds. Both the DAL autocomplete views
+and the admin (search_fields / autocomplete_fields) search through here.
+"""
+
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, Count, IntegerField, When
+
+from apps.common.utils.process_cache import ProcessCache
+from apps.user_profiles.models import UserProfile
+from apps.user_profiles.utils.location_hierarchy import get_location_hierarchy
+
+APOSTROPHES = {"'", "’", "‘", "`", "´", "ʼ"}
+
+CONSTITUENCIES = "constituency"
+WARDS = "ward"
+
+
+def normalize_search_text(text):
+    """
+    Lower-cased, accent-free words separated by single spaces.
+    "Lang’ata" → "langata", "Kabete-Kiambaa" → "kabete kiambaa".
+    """
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    characters = []
+    for char in decomposed:
+        if unicodedata.combining(char) or char in APOSTROPHES:
+            continue
+        characters.append(char if char.isalnum() else " ")
+    return " ".join("".join(characters).casefold().split())
+
+
+def name_tokens(text):
+    """Tokens of a normalized name: its words, plus the words run together."""
+    words = text.split()
+    return words + ["".join(words)] if len(words) > 1 else words
+
+
+class TokenArray:
+    """Sorted (token, entry position) pairs answering prefix lookups by bisection."""
+
+    def __init__(self, pairs):
+        pairs = sorted(set(pairs))
+        self.tokens = tuple(token for token, _ in pairs)
+        self.entries = tuple(position for _, position in pairs)
+
+    def prefix_matches(self, prefix):
+        start = bisect_left(self.tokens, prefix)
+        stop = bisect_left(self.tokens, prefix + "\U0010ffff", start)
+        return set(self.entries[start:stop])
+
+
+class PrefixIndex:
+    """
+    Token arrays over one kind of location.
+
+    Built from (id, name, parent_id, context) rows; `ids`, `names`,
+    `normalized` and `parents` are parallel tuples.
+    """
+
+    def __init__(self, rows):
+        rows = list(rows)
+        self.ids = tuple(row[0] for row in rows)
+        self.names = tuple(row[1] for row in rows)
+        self.parents = tuple(row[2] for row in rows)
+        self.normalized = tuple(normalize_search_text(name) for name in self.names)
+
+        self.name_tokens = TokenArray(
+            (token, position)
+            for position, text in enumerate(self.normalized)
+            for token in name_tokens(text)
+        )
+        self.context_tokens = TokenArray(
+            (token, position)
+            for position, row in enumerate(rows)
+            for token in name_tokens(normalize_search_text(row[3]))
+        )
+
+    def search(self, query, parent_id=None, popularity=None, limit=None, include_context=False):
+        """
+        Ids of the entries matching `query`, best first.
+        Restricted to children of `parent_id` when given; parent names and
+        codes are searched too with `include_context`.
+        """
+        normalized = normalize_search_text(query)
+        words = normalized.split()
+        if not words:
+            return []
+
+        def matches(word):
+            found = self.name_tokens.prefix_matches(word)
+            if include_context:
+                found |= self.context_tokens.prefix_matches(word)
+            return found
+
+        # Rarest (longest) word first keeps the candidate set small
+        words.sort(key=len, reverse=True)
+        candidates = matches(words[0])
+        for word in words[1:]:
+            if not candidates:
+                break
+            candidates &= matches(word)
+
+        if parent_id is not None:
+            candidates = {position for position in candidates if self.parents[position] == parent_id}
+
+        popularity = popularity or {}
+
+        def rank(position):
+            text = self.normalized[position]
+            tokens = name_tokens(text)
+            if text == normalized:
+                match = 0
+            elif text.startswith(normalized) or text.replace(" ", "").startswith(normalized.replace(" ", "")):
+                match = 1
+            elif all(any(token.startswith(word) for token in tokens) for word in words):
+                match = 2
+            else:
+                match = 3
+            return match, -popularity.get(self.ids[position], 0), self.names[position]
+
+        ranked = sorted(candidates, key=rank)
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.ids[position] for position in ranked]
+
+
+class LocationSearchIndex:
+    """Prefix indexes over the constituencies and wards of a `LocationHierarchy`."""
+
+    def __init__(self, hierarchy):
+        self.hierarchy = hierarchy
+        self.indexes = {
+            CONSTITUENCIES: PrefixIndex(
+                self._constituency_row(hierarchy, i) for i in range(len(hierarchy.constituency_ids))
+            ),
+            WARDS: PrefixIndex(
+                self._ward_row(hierarchy, i) for i in range(len(hierarchy.ward_ids))
+            ),
+        }
+
+    @staticmethod
+    def _constituency_row(hierarchy, i):
+        county = hierarchy.constituency_county[i]
+        return (
+            hierarchy.constituency_ids[i],
+            hierarchy.constituency_names[i],
+            hierarchy.county_ids[county],
+            f"{hierarchy.county_names[county]} {hierarchy.county_codes[county]}",
+        )
+
+    @staticmethod
+    def _ward_row(hierarchy, i):
+        constituency = hierarchy.ward_constituency[i]
+        county = hierarchy.constituency_county[constituency]
+        return (
+            hierarchy.ward_ids[i],
+            hierarchy.ward_names[i],
+            hierarchy.constituency_ids[constituency],
+            f"{hierarchy.constituency_names[constituency]} {hierarchy.county_names[county]}",
+        )
+
+    def search(self, kind, query, parent_id=None, limit=None, include_context=False):
+        popularity = location_popularity.get()[kind]
+        return self.indexes[kind].search(
+            query, parent_id=parent_id, popularity=popularity, limit=limit, include_context=include_context,
+        )
+
+
+def build_location_popularity():
+    """Registered profiles per constituency and per ward (two GROUP BY queries)."""
+    return {
+        kind: Counter(dict(
+            UserProfile.objects
+            .filter(**{f"{kind}__isnull": False})
+            .order_by()
+            .values_list(kind)
+            .annotate(total=Count("pk"))
+        ))
+        for kind in (CONSTITUENCIES, WARDS)
+    }
+
+
+# Popularity drifts slowly and only affects ordering, so it simply expires
+location_popularity = ProcessCache(
+    "location_popularity",
+    build_location_popularity,
+    max_age=getattr(settings, "CEENI_LOCATION_POPULARITY_MAX_AGE", 600),
+)
+
+_index_lock = threading.Lock()
+_index = None
+
+
+def get_location_search_index():
+    """
+    Returns this process's search index, rebuilt whenever the location
+    hierarchy snapshot it was derived from has been replaced.
+    """
+    global _index
+    hierarchy = get_location_hierarchy()
+    index = _index
+    if index is None or index.hierarchy is not hierarchy:
+        with _index_lock:
+            if _index is None or _index.hierarchy is not hierarchy:
+                _index = LocationSearchIndex(hierarchy)
+            index = _index
+    return index
+
+
+def search_locations(queryset, kind, query, parent_id=None, limit=None, include_context=False):
+    """
+    Narrows a Constituency or Ward queryset to the index matches for `query`,
+    ordered by rank.
+    """
+    ids = get_location_search_index().search(
+        kind, query, parent_id=parent_id, limit=limit, include_context=include_context,
+    )
+    if not ids:
+        return queryset.none()
+    ranking = Case(
+        *(When(pk=pk, then=position) for position, pk in enumerate(ids)),
+        output_field=IntegerField(),
+    )
+    return queryset.filter(pk__in=ids).order_by(ranking)
@@ -1,6 +1,6 @@
 # apps/user_profiles/utils/progress.py
 
-from typing import List, Type
+from typing import List, Tuple, Type
 from django import forms
 
 from apps.user_profiles.forms.screen_1_basic_info import Screen1BasicInfoForm
@@ -21,20 +21,39 @@ WIZARD_FORMS: List[Type[forms.Form]] = [
     Screen7ConfirmationAndSaveForm,
 ]
 
-def compute_weighted_completion(step_number: int) -> int:
+
+def build_progress_table(weights: Tuple[int, ...]) -> Tuple[int, ...]:
     """
-    Calculates a weighted completion percentage based on how many fields
-    each screen’s form has. Screens with more inputs count for more of the bar.
+    Cumulative weighted completion for each step: entry N is the percentage
+    reached once steps 1..N are done (entry 0 is always 0).
     """
-    # Count fields on each form
-    field_counts = [len(form_class().fields) for form_class in WIZARD_FORMS]
-    total_fields = sum(field_counts)
+    total = sum(weights)
+    table = [0]
+    completed = 0
+    for weight in weights:
+        completed += weight
+        table.append(int((completed / total) * 100) if total else 0)
+    return tuple(table)
+
+
+# Field names of each screen, read from the form classes' declared fields
+# (`base_fields`), so no form is ever instantiated to count them
+SCREEN_FIELDS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(form_class.base_fields) for form_class in WIZARD_FORMS
+)
 
-    if total_fields == 0:
-        return 0
+# Weight of each screen in the progress bar: its number of fields
+SCREEN_FIELD_WEIGHTS: Tuple[int, ...] = tuple(len(fields) for fields in SCREEN_FIELDS)
 
-    # Sum up all fields in completed steps
-    # step_number is 1-based
-    completed_fields = sum(field_counts[:step_number])
+# Built once per process, at import
+PROGRESS_TABLE: Tuple[int, ...] = build_progress_table(SCREEN_FIELD_WEIGHTS)
 
-    return int((completed_fields / total_fields) * 100)
+
+def compute_weighted_completion(step_number: int) -> int:
+    """
+    Calculates a weighted completion percentage based on how many fields
+    each screen’s form has. Screens with more inputs count for more of the bar.
+    step_number is 1-based; this is a lookup in PROGRESS_TABLE.
+    """
+    step = min(max(step_number, 0), len(SCREEN_FIELD_WEIGHTS))
+    return PROGRESS_TABLE[step]
@@ -0,0 +1,100 @@
+# apps/user_profiles/utils/reference_choices.py
+
+"""
+Process-level choice snapshots of the reference tables behind the wizard's
+selects: age ranges, genders, education levels, residency types, referral
+sources, civic interest areas and counties.
+
+These tables change only when an importer or an admin edits them, yet every
+wizard request used to read them twice: once to render the options and once
+more to validate the posted id. Each table is now read once per process, in
+its default ordering, into an immutable `ChoiceSnapshot`; the cached choice
+fields (forms/reference_fields.py) render and validate against it without
+touching the database.
+
+Each snapshot is its own versioned `ProcessCache`, invalidated by the model
+signals (admin edits) and by `reference_data_synced`, which the bulk
+importers send once their changes commit.
+"""
+
+import copy
+from functools import partial
+from types import MappingProxyType
+
+from apps.common.utils.process_cache import ProcessCache
+from apps.user_profiles.models import (
+    AgeRange,
+    CivicInterestArea,
+    County,
+    EducationLevel,
+    Gender,
+    ReferralSource,
+    ResidencyType,
+)
+
+REFERENCE_CHOICE_MODELS = (
+    AgeRange,
+    Gender,
+    EducationLevel,
+    ResidencyType,
+    ReferralSource,
+    CivicInterestArea,
+    County,
+)
+
+
+class ChoiceSnapshot:
+    """
+    The rows of one reference table, in the model's default ordering.
+
+    `objects` and `by_key` (str(pk) → row) are shared by every request in
+    the process and never modified; `get()` and `select()` hand out copies,
+    so callers may attach the rows to other instances freely.
+    """
+
+    __slots__ = ("model", "objects", "by_key")
+
+    def __init__(self, model, objects):
+        self.model = model
+        self.objects = tuple(objects)
+        self.by_key = MappingProxyType({str(obj.pk): obj for obj in self.objects})
+
+    def __len__(self):
+        return len(self.objects)
+
+    def __contains__(self, key):
+        return str(key) in self.by_key
+
+    def get(self, key):
+        """A copy of the row with primary key `key`, or None."""
+        obj = self.by_key.get(str(key))
+        return copy.copy(obj) if obj is not None else None
+
+    def select(self, keys):
+        """Copies of the rows whose keys are in `keys`, in snapshot order."""
+        keys = {str(key) for key in keys}
+        return [copy.copy(obj) for obj in self.objects if str(obj.pk) in keys]
+
+
+def build_choice_snapshot(model):
+    return ChoiceSnapshot(model, model._default_manager.all())
+
+
+reference_choices = {
+    model: ProcessCache(
+        f"reference_choices:{model._meta.label_lower}",
+        partial(build_choice_snapshot, model),
+    )
+    for model in REFERENCE_CHOICE_MODELS
+}
+
+
+def get_choice_snapshot(model):
+    """This process's snapshot of `model` (one query on first use or after a change)."""
+    return reference_choices[model].get()
+
+
+def invalidate_reference_choices(*models):
+    """Drops the snapshots of `models` (default: all) in every process."""
+    for model in models or REFERENCE_CHOICE_MODELS:
+        reference_choices[model].invalidate()
@@ -0,0 +1,111 @@
+# apps/user_profiles/utils/request_profile.py
+
+"""
+Per-request access to the signed-in user's profile.
+
+`get_request_profile(request)` loads the profile once per request, with its
+foreign keys joined in a single query, and memoizes it on the request. The
+context processor and views all share that one instance, so a
+page never pays for `request.user.userprofile` more than once.
+
+Wizard views are wrapped with `@with_request_profile`, which attaches the
+fully hydrated profile (civic interests prefetched) as `request.profile`;
+`get_next_wizard_screen(request)` then reads the next incomplete screen from
+the profile's stored column without further queries.
+"""
+
+from functools import wraps
+
+from django.db.models import prefetch_related_objects
+
+from apps.user_profiles.models import UserProfile
+
+# Foreign keys joined whenever the profile is loaded for a request
+PROFILE_RELATED_FIELDS = (
+    "user",
+    "age_range",
+    "gender",
+    "education_level",
+    "residency_type",
+    "referral_source",
+    "county",
+    "constituency",
+    "ward",
+    "county_of_origin",
+)
+
+# Many-to-many relations prefetched for views that read or edit them
+PROFILE_PREFETCH_FIELDS = ("civic_interest_areas",)
+
+# Request attributes holding the memoized profile and next wizard screen
+REQUEST_PROFILE_ATTR = "_ceeni_profile"
+REQUEST_NEXT_SCREEN_ATTR = "_ceeni_next_wizard_screen"
+
+
+def load_profile(user):
+    """
+    Returns the user's profile with every foreign key joined (one query),
+    or None if the user has no profile.
+    """
+    return (
+        UserProfile.objects
+        .select_related(*PROFILE_RELATED_FIELDS)
+        .filter(user=user)
+        .first()
+    )
+
+
+def get_request_profile(request, prefetch=False):
+    """
+    Returns the signed-in user's profile, loaded at most once per request.
+    Anonymous users get None without touching the database.
+
+    With `prefetch=True` the many-to-many relations are prefetched too (one
+    query each, only the first time they are asked for).
+    """
+    if not hasattr(request, REQUEST_PROFILE_ATTR):
+        setattr(request, REQUEST_PROFILE_ATTR, _load_request_profile(request))
+
+    profile = getattr(request, REQUEST_PROFILE_ATTR)
+    if prefetch and profile is not None:
+        prefetch_related_objects([profile], *PROFILE_PREFETCH_FIELDS)
+    return profile
+
+
+def _load_request_profile(request):
+    """Loads the profile of `request.user`, or None (anonymous / no profile)."""
+    user = getattr(request, "user", None)
+    profile = None
+
+    if user is not None and user.is_authenticated:
+        profile = load_profile(user)
+        if profile is not None:
+            # Later `request.user.userprofile` reads reuse this instance
+            user.userprofile = profile
+
+    return profile
+
+
+def get_next_wizard_screen(request):
+    """
+    Returns the URL name of the next incomplete wizard screen for the request's
+    profile, read once per request from the stored `next_wizard_screen`.
+    """
+    if not hasattr(request, REQUEST_NEXT_SCREEN_ATTR):
+        profile = get_request_profile(request)
+        setattr(request, REQUEST_NEXT_SCREEN_ATTR, profile.next_wizard_screen)
+    return getattr(request, REQUEST_NEXT_SCREEN_ATTR)
+
+
+def with_request_profile(view_func):
+    """
+    View decorator attaching the fully hydrated profile as `request.profile`
+    (foreign keys joined, civic interests prefetched). Use below
+    `@login_required`.
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        request.profile = get_request_profile(request, prefetch=True)
+        return view_func(request, *args, **kwargs)
+
+    return _wrapped_view
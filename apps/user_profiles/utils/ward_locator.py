@@ -0,0 +1,167 @@
+# apps/user_profiles/utils/ward_locator.py
+
+"""
+Nearest-ward lookup ("detect my ward") over the ward coordinates.
+
+Wards with coordinates are bucketed into a grid of `cell_degrees` squares.
+A query scans the cell containing the point, then rings of cells around it,
+and stops once no unscanned cell can be closer than the k-th best match
+found so far. At Kenya's density (~1,450 wards) that is a few dozen
+haversine evaluations per query instead of all of them.
+
+The locator is derived from the location hierarchy snapshot (no queries of
+its own) and rebuilt when that snapshot is replaced.
+"""
+
+import heapq
+import math
+import threading
+from typing import NamedTuple
+
+from apps.user_profiles.utils.location_hierarchy import get_location_hierarchy
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Great-circle distance in kilometres between two points in degrees."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class NearestWard(NamedTuple):
+    """A ward near the queried point, with its parents."""
+    ward_id: int
+    ward_name: str
+    constituency_id: int
+    constituency_name: str
+    county_id: int
+    county_name: str
+    distance_km: float
+
+
+class WardLocator:
+    """
+    Grid index over the wards of a `LocationHierarchy` that have coordinates.
+    """
+
+    def __init__(self, hierarchy, cell_degrees=0.25):
+        self.hierarchy = hierarchy
+        self.cell_degrees = cell_degrees
+
+        self.positions = tuple(
+            i for i in range(len(hierarchy.ward_ids))
+            if hierarchy.ward_latitudes[i] is not None and hierarchy.ward_longitudes[i] is not None
+        )
+
+        cells = {}
+        for i in self.positions:
+            cells.setdefault(self._cell(hierarchy.ward_latitudes[i], hierarchy.ward_longitudes[i]), []).append(i)
+        self.cells = {cell: tuple(members) for cell, members in cells.items()}
+
+        if self.cells:
+            rows = [row for row, _ in self.cells]
+            cols = [col for _, col in self.cells]
+            self.bounds = (min(rows), max(rows), min(cols), max(cols))
+            max_abs_latitude = max(abs(hierarchy.ward_latitudes[i]) for i in self.positions)
+        else:
+            self.bounds = None
+            max_abs_latitude = 0.0
+
+        # Shortest ground distance one cell can span, used to bound each ring
+        self.min_cell_km = (
+            cell_degrees * KM_PER_DEGREE * math.cos(math.radians(min(90.0, max_abs_latitude + cell_degrees)))
+        )
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _cell(self, latitude, longitude):
+        return math.floor(latitude / self.cell_degrees), math.floor(longitude / self.cell_degrees)
+
+    def _ring(self, row, col, radius):
+        """Cells at Chebyshev distance `radius` from (row, col)."""
+        if radius == 0:
+            yield row, col
+            return
+        for c in range(col - radius, col + radius + 1):
+            yield row - radius, c
+            yield row + radius, c
+        for r in range(row - radius + 1, row + radius):
+            yield r, col - radius
+            yield r, col + radius
+
+    def _max_radius(self, row, col):
+        """Ring beyond which there are no more cells at all."""
+        min_row, max_row, min_col, max_col = self.bounds
+        return max(abs(row - min_row), abs(row - max_row), abs(col - min_col), abs(col - max_col))
+
+    def nearest(self, latitude, longitude, limit=3, max_km=None):
+        """
+        Up to `limit` wards closest to the point, nearest first, optionally
+        only those within `max_km`.
+        """
+        if not self.cells or limit < 1:
+            return []
+
+        h = self.hierarchy
+        row, col = self._cell(latitude, longitude)
+        best = []  # max-heap of (-distance, position), at most `limit` long
+
+        for radius in range(self._max_radius(row, col) + 1):
+            # Everything not yet scanned is at least this far away
+            ring_floor_km = max(0, radius - 1) * self.min_cell_km
+            if len(best) == limit and ring_floor_km > -best[0][0]:
+                break
+            if max_km is not None and ring_floor_km > max_km:
+                break
+
+            for cell in self._ring(row, col, radius):
+                for i in self.cells.get(cell, ()):
+                    distance = haversine_km(latitude, longitude, h.ward_latitudes[i], h.ward_longitudes[i])
+                    if max_km is not None and distance > max_km:
+                        continue
+                    if len(best) < limit:
+                        heapq.heappush(best, (-distance, i))
+                    elif distance < -best[0][0]:
+                        heapq.heapreplace(best, (-distance, i))
+
+        return [self._result(i, -negative) for negative, i in sorted(best, reverse=True)]
+
+    def _result(self, i, distance):
+        h = self.hierarchy
+        constituency = h.ward_constituency[i]
+        county = h.constituency_county[constituency]
+        return NearestWard(
+            ward_id=h.ward_ids[i],
+            ward_name=h.ward_names[i],
+            constituency_id=h.constituency_ids[constituency],
+            constituency_name=h.constituency_names[constituency],
+            county_id=h.county_ids[county],
+            county_name=h.county_names[county],
+            distance_km=distance,
+        )
+
+
+_locator_lock = threading.Lock()
+_locator = None
+
+
+def get_ward_locator():
+    """
+    Returns this process's ward locator, rebuilt whenever the location
+    hierarchy snapshot it was derived from has been replaced.
+    """
+    global _locator
+    hierarchy = get_location_hierarchy()
+    locator = _locator
+    if locator is None or locator.hierarchy is not hierarchy:
+        with _locator_lock:
+            if _locator is None or _locator.hierarchy is not hierarchy:
+                _locator = WardLocator(hierarchy)
+            locator = _locator
+    return locator
@@ -3,14 +3,40 @@
 # PURPOSE:
 #     - Provides Select2-powered autocomplete views for user profile forms.
 #     - Dynamically filters Constituency and Ward choices based on forwarded fields.
+#     - Labels come from the stored `display_path` column: one query per page,
+#       no parent lookups per result.
+#     - Typed text is matched by the in-memory prefix index
+#       (utils/location_search.py): accent/punctuation-insensitive, ranked
+#       by prefix match and popularity. Only the matches needed up to the
+#       requested page are ranked and fetched.
 # DEPENDENCIES:
 #     - django-autocomplete-light (dal, dal_select2)
 #     - user_profiles.models.Constituency, Ward
 # ───────────────────────────────────────────────────────────────────────────────
 
 from dal import autocomplete
-from django.db.models import Q
 from apps.user_profiles.models import Constituency, Ward
+from apps.user_profiles.utils.location_search import CONSTITUENCIES, WARDS, search_locations
+
+
+def forwarded_id(value):
+    """Forwarded parent id as an int (None if missing or malformed)."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def search_limit(view):
+    """
+    Index matches needed to fill the pages up to the requested one, plus one
+    so the paginator can still tell Select2 that more results follow.
+    """
+    try:
+        page = max(int(view.request.GET.get(view.page_kwarg) or 1), 1)
+    except ValueError:
+        page = 1
+    return page * view.paginate_by + 1
 
 
 class ConstituencyAutocomplete(autocomplete.Select2QuerySetView):
@@ -19,14 +45,17 @@ class ConstituencyAutocomplete(autocomplete.Select2QuerySetView):
     """
 
     def get_queryset(self):
-        qs = Constituency.objects.all()
+        qs = Constituency.objects.only('id', 'display_path')
 
-        county_id = self.forwarded.get('county', None)
-        if county_id:
-            qs = qs.filter(county_id=county_id)
+        county_id = forwarded_id(self.forwarded.get('county', None))
 
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
+            return search_locations(
+                qs, CONSTITUENCIES, self.q, parent_id=county_id, limit=search_limit(self),
+            )
+
+        if county_id:
+            qs = qs.filter(county_id=county_id)
 
         return qs
 
@@ -37,13 +66,16 @@ class WardAutocomplete(autocomplete.Select2QuerySetView):
     """
 
     def get_queryset(self):
-        qs = Ward.objects.all()
+        qs = Ward.objects.only('id', 'display_path')
 
-        constituency_id = self.forwarded.get('constituency', None)
-        if constituency_id:
-            qs = qs.filter(constituency_id=constituency_id)
+        constituency_id = forwarded_id(self.forwarded.get('constituency', None))
 
         if self.q:
-            qs = qs.filter(name__icontains=self.q)
+            return search_locations(
+                qs, WARDS, self.q, parent_id=constituency_id, limit=search_limit(self),
+            )
+
+        if constituency_id:
+            qs = qs.filter(constituency_id=constituency_id)
 
         return qs
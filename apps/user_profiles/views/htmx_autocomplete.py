@@ -1,40 +1,57 @@
 # apps/user_profiles/views/htmx_autocomplete.py
 
-from django.http import HttpResponseBadRequest
-from django.shortcuts import render
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.contrib.auth.decorators import login_required
-from apps.user_profiles.models import Constituency, Ward
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import etag
+
+from apps.user_profiles.utils.location_hierarchy import get_location_hierarchy
+
+
+def constituency_options_etag(request):
+    county_id = request.GET.get("county")
+    return get_location_hierarchy().constituency_options(county_id).etag if county_id else None
+
+
+def ward_options_etag(request):
+    constituency_id = request.GET.get("constituency")
+    return get_location_hierarchy().ward_options(constituency_id).etag if constituency_id else None
+
+
+def options_response(fragment):
+    """
+    Serves a pre-rendered options fragment. Browsers keep it but revalidate
+    each time, so repeat requests are answered with 304 Not Modified.
+    """
+    response = HttpResponse(fragment.html)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
 
 @login_required
+@etag(constituency_options_etag)
 def htmx_load_constituencies(request):
     """
     HTMX view: Returns <option> list of constituencies for a given county.
     Expects GET ?county=<county_id>
+    Served from the in-memory location hierarchy (no queries).
     """
     county_id = request.GET.get("county")
     if not county_id:
         return HttpResponseBadRequest("Missing county parameter")
 
-    constituencies = Constituency.objects.filter(county_id=county_id).order_by("name")
-    return render(
-        request,
-        "user_profiles/partials/_constituency_options.html",
-        {"constituencies": constituencies},
-    )
+    return options_response(get_location_hierarchy().constituency_options(county_id))
 
 @login_required
+@etag(ward_options_etag)
 def htmx_load_wards(request):
     """
     HTMX view: Returns <option> list of wards for a given constituency.
     Expects GET ?constituency=<constituency_id>
+    Served from the in-memory location hierarchy (no queries).
     """
     constituency_id = request.GET.get("constituency")
     if not constituency_id:
         return HttpResponseBadRequest("Missing constituency parameter")
 
-    wards = Ward.objects.filter(constituency_id=constituency_id).order_by("name")
-    return render(
-        request,
-        "user_profiles/partials/_ward_options.html",
-        {"wards": wards},
-    )
+    return options_response(get_location_hierarchy().ward_options(constituency_id))
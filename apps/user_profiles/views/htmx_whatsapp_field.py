@@ -3,6 +3,7 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from apps.user_profiles.forms.screen_5_communication import Screen5CommunicationForm
+from apps.user_profiles.utils.request_profile import get_request_profile
 
 
 @login_required
@@ -11,7 +12,7 @@ def render_whatsapp_field(request):
     HTMX partial to conditionally render WhatsApp number field
     ONLY if wants_bill_notifications is explicitly True.
     """
-    profile = request.user.userprofile
+    profile = get_request_profile(request)
     form = Screen5CommunicationForm(request.POST or None, instance=profile)
 
     raw_value = request.POST.get("wants_bill_notifications")
@@ -0,0 +1,57 @@
+# apps/user_profiles/views/nearest_wards.py
+
+import math
+
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.http import HttpResponseBadRequest, JsonResponse
+from django.views.decorators.http import require_GET
+
+from apps.user_profiles.utils.ward_locator import get_ward_locator
+
+MAX_NEAREST_WARDS = 10
+
+
+def coordinate(value, limit):
+    """Parses a latitude/longitude within ±limit (None if invalid)."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) and -limit <= number <= limit else None
+
+
+@login_required
+@require_GET
+def nearest_wards(request):
+    """
+    JSON view: wards nearest to the browser's position, for pre-filling Step 2.
+    Expects GET ?lat=<latitude>&lng=<longitude>[&limit=<n>]
+    Served from the in-memory ward locator (no queries). Wards further than
+    CEENI_NEAREST_WARD_MAX_KM are not returned, so positions outside Kenya
+    get an empty list.
+    """
+    latitude = coordinate(request.GET.get("lat"), 90)
+    longitude = coordinate(request.GET.get("lng"), 180)
+    if latitude is None or longitude is None:
+        return HttpResponseBadRequest("Missing or invalid lat/lng parameters")
+
+    try:
+        limit = min(max(int(request.GET.get("limit", 3)), 1), MAX_NEAREST_WARDS)
+    except ValueError:
+        return HttpResponseBadRequest("Invalid limit parameter")
+
+    wards = get_ward_locator().nearest(
+        latitude, longitude, limit=limit, max_km=settings.CEENI_NEAREST_WARD_MAX_KM,
+    )
+    return JsonResponse({
+        "wards": [
+            {
+                "ward": {"id": ward.ward_id, "name": ward.ward_name},
+                "constituency": {"id": ward.constituency_id, "name": ward.constituency_name},
+                "county": {"id": ward.county_id, "name": ward.county_name},
+                "distance_km": round(ward.distance_km, 2),
+            }
+            for ward in wards
+        ],
+    })
@@ -6,14 +6,17 @@ from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 from django.utils import timezone
 
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
+
 
 @login_required
+@with_request_profile
 def resume_or_logout(request):
     """
     Prompt returning user to resume where they left off or logout.
     Only shown if profile is incomplete.
     """
-    profile = request.user.userprofile
+    profile = request.profile
 
     # Auto-redirect complete users
     if profile.is_complete():
@@ -26,7 +29,7 @@ def resume_or_logout(request):
     # Handle decision
     if request.method == "POST":
         if "continue" in request.POST:
-            return redirect(profile.get_next_incomplete_screen())
+            return redirect(get_next_wizard_screen(request))
         elif "cancel" in request.POST:
             logout(request)
             return redirect("user_accounts:login")  # or your login page
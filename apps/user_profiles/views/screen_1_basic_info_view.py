@@ -3,20 +3,23 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_1_basic_info import Screen1BasicInfoForm
 
 
 @login_required
+@with_request_profile
 def screen_1_basic_info(request):
     """
     Step 1 of the 7-step profile wizard.
     If the user's next incomplete screen is NOT screen 1, redirect them to the correct step.
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 👁️ Redirect user forward if they already filled this screen
-    if profile.get_next_incomplete_screen() != 'user_profiles:screen_1':
-        return redirect(profile.get_next_incomplete_screen())
+    if next_screen != 'user_profiles:screen_1':
+        return redirect(next_screen)
 
     # Display or process this screen normally
     step_number = 1
@@ -3,21 +3,24 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_2_location import Screen2LocationForm
 
 
 @login_required
+@with_request_profile
 def screen_2_location_info(request):
     """
     Step 2 of the 7-step profile wizard: Location info.
     Redirects forward if the user's current step is beyond screen 2,
     unless the user explicitly requests to return via ?force=true.
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🚧 Block backward access unless ?force=true
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_2':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_2':
+        return redirect(next_screen)
 
     step_number = 2
     completion = compute_weighted_completion(step_number)
@@ -10,20 +10,23 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_3_origin_residency import Screen3OriginResidencyForm
 
 
 @login_required
+@with_request_profile
 def screen_3_origin_and_residency(request):
     """
     Step 3 of the profile wizard: Origin & Residency.
     Blocks users from skipping ahead unless explicitly overridden via ?force=true.
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🔐 Enforce screen order unless user forced backward visit (e.g. via "Back" button)
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_3':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_3':
+        return redirect(next_screen)
 
     # Setup form and progress context
     step_number = 3
@@ -5,20 +5,23 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_4_civic_interests import Screen4CivicInterestsForm
 
 
 @login_required
+@with_request_profile
 def screen_4_civic_interests(request):
     """
     Step 4 of the profile wizard: Civic Interests.
     Prevents unauthorized skipping unless user arrives via a forced back link (?force=true).
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🔐 Guard access unless coming from previous step or with ?force=true
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_4':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_4':
+        return redirect(next_screen)
 
     # Wizard UI progress metadata
     step_number = 4
@@ -29,9 +32,6 @@ def screen_4_civic_interests(request):
         form = Screen4CivicInterestsForm(request.POST, instance=profile)
         if form.is_valid():
             form.save()
-            # Refresh the profile from the database to ensure M2M fields (like civic_interest_areas)
-            # are up-to-date in memory—especially important for logic like get_next_incomplete_screen()
-            profile.refresh_from_db()
             return redirect("user_profiles:screen_5")
     else:
         form = Screen4CivicInterestsForm(instance=profile)
@@ -5,20 +5,23 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_5_communication import Screen5CommunicationForm
 
 
 @login_required
+@with_request_profile
 def screen_5_communication(request):
     """
     Step 5 of the profile wizard: Communication preferences & profile photo.
     Redirects forward only if this is the correct next step, unless ?force=true.
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🔐 Enforce correct screen access unless explicitly forced
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_5':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_5':
+        return redirect(next_screen)
 
     # Wizard progress UI
     step_number = 5
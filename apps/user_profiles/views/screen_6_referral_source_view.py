@@ -5,20 +5,23 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_6_referral_source import Screen6ReferralSourceForm
 
 
 @login_required
+@with_request_profile
 def screen_6_referral_source(request):
     """
     Step 6 of the profile wizard: Referral Source.
     Enforces correct progression unless ?force=true is present.
     """
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🔐 Guard to prevent jumping ahead in the wizard
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_6':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_6':
+        return redirect(next_screen)
 
     # Progress bar and wizard visuals
     step_number = 6
@@ -5,21 +5,24 @@ from django.contrib.auth.decorators import login_required
 
 from apps.user_profiles.constants import TOTAL_WIZARD_STEPS
 from apps.user_profiles.utils.progress import compute_weighted_completion
+from apps.user_profiles.utils.request_profile import get_next_wizard_screen, with_request_profile
 from apps.user_profiles.forms.screen_7_confirmation_and_save import Screen7ConfirmationAndSaveForm
 
 
 @login_required
+@with_request_profile
 def screen_7_confirmation_and_save(request):
     """
     Step 7 (Final Confirmation) of the CEENI profile wizard.
     Displays a summary. On submit, triggers save to ensure final state.
     """
 
-    profile = request.user.userprofile
+    profile = request.profile
+    next_screen = get_next_wizard_screen(request)
 
     # 🚫 Prevent early access unless explicitly forced
-    if not request.GET.get("force") and profile.get_next_incomplete_screen() != 'user_profiles:screen_7':
-        return redirect(profile.get_next_incomplete_screen())
+    if not request.GET.get("force") and next_screen != 'user_profiles:screen_7':
+        return redirect(next_screen)
 
     # Progress tracker (final step)
     step_number = 7
@@ -138,6 +138,24 @@ DATABASES = {
 }
 
 
+# ------------------------------------------------------------------------------
+# CACHE (Default: per-process memory — overridden in prod)
+# ------------------------------------------------------------------------------
+# Process-level snapshots (captcha pool, blocklist, locations, reference
+# choices) tell other workers to rebuild through a version key in this cache,
+# and signed captcha tokens are burned in it. A local-memory cache is only
+# correct for a single process (runserver), so prod uses a shared backend.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+# With a per-process cache, invalidations cannot reach other workers: their
+# snapshots are rebuilt at least this often (seconds) instead
+CEENI_PROCESS_CACHE_LOCAL_MAX_AGE = 300
+
+
 # ------------------------------------------------------------------------------
 # PASSWORD VALIDATION
 # ------------------------------------------------------------------------------
@@ -161,7 +179,10 @@ USE_TZ = True
 # STATIC / MEDIA
 # ------------------------------------------------------------------------------
 STATIC_URL = "/static/"
-STATICFILES_DIRS = [BASE_DIR / "static"]
+# Generated assets (e.g. the location bundle) are written to build/static,
+# outside the source tree; finders and collectstatic read it like static/
+CEENI_STATIC_BUILD_DIR = BASE_DIR / "build" / "static"
+STATICFILES_DIRS = [BASE_DIR / "static", CEENI_STATIC_BUILD_DIR]
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
 MEDIA_URL = "/media/"
@@ -179,6 +200,38 @@ AUTH_USER_MODEL = "user_accounts.CustomUser"
 # ------------------------------------------------------------------------------
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# ------------------------------------------------------------------------------
+# CEENI CAPTCHA
+# ------------------------------------------------------------------------------
+# Token mode: challenges travel as signed, expiring tokens instead of slugs,
+# so answers are checked without DB queries or session writes.
+CEENI_CAPTCHA_TOKEN_MODE = os.getenv("CEENI_CAPTCHA_TOKEN_MODE", "False") == "True"
+CEENI_CAPTCHA_TOKEN_MAX_AGE = 600  # seconds
+
+# Attempt telemetry: counted in memory, flushed to the DB in batches
+CEENI_CAPTCHA_TELEMETRY = True
+CEENI_CAPTCHA_TELEMETRY_FLUSH_SECONDS = 60
+
+# Optional (low, high) calibrated solve-rate band for challenge selection,
+# e.g. (0.6, 0.9). None disables targeting.
+CEENI_CAPTCHA_SOLVE_RATE_BAND = None
+
+# ------------------------------------------------------------------------------
+# CEENI LOCATIONS
+# ------------------------------------------------------------------------------
+# Filter the wizard's location dropdowns in the browser from the static bundle
+# written by `build_location_bundle` and rebuilt by `import_kenyan_locations`
+# (HTMX endpoints remain the fallback).
+CEENI_LOCATION_CLIENT_FILTER = os.getenv("CEENI_LOCATION_CLIENT_FILTER", "True") == "True"
+
+# How long (seconds) each process keeps its per-location profile counts used
+# to rank autocomplete matches
+CEENI_LOCATION_POPULARITY_MAX_AGE = 600
+
+# "Detect my ward": wards further than this (km) from the browser's position
+# are not suggested
+CEENI_NEAREST_WARD_MAX_KM = 50
+
 # ------------------------------------------------------------------------------
 # LOGGING
 # ------------------------------------------------------------------------------
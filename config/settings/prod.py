@@ -19,3 +19,22 @@ DATABASES = {
         "PORT": os.getenv("DB_PORT", "5432"),       # DB port with fallback to default PostgreSQL port
     }
 }
+
+# Shared cache, so every worker sees snapshot invalidations and burned
+# captcha tokens. Set REDIS_URL (e.g. redis://localhost:6379/1) to use Redis,
+# which CEENI_CAPTCHA_TOKEN_MODE requires; otherwise the database cache is
+# used (create its table once with `python manage.py createcachetable`).
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "ceeni_cache",
+        }
+    }
@@ -0,0 +1,85 @@
+/*
+ * static/user_profiles/js/location_filter.js
+ *
+ * Client-side filtering of the Step 2 location dropdowns.
+ *
+ * The county select carries `data-location-bundle`: the URL of the hashed
+ * JSON bundle written by `manage.py build_location_bundle`. Once it has
+ * loaded, HTMX requests from the county/constituency selects are cancelled
+ * and the dependent options are filled locally. If the bundle cannot be
+ * fetched, nothing is intercepted and the HTMX endpoints do the work.
+ */
+(function () {
+  "use strict";
+
+  var county = document.getElementById("id_county");
+  if (!county || !county.dataset.locationBundle) {
+    return;
+  }
+
+  var index = null; // {constituencies: {countyId: [[id, name]]}, wards: {constituencyId: [[id, name]]}}
+
+  function buildIndex(bundle) {
+    var constituencies = {};
+    var wards = {};
+    bundle.constituencies.forEach(function (row) {
+      var countyId = bundle.counties[row[2]][0];
+      (constituencies[countyId] = constituencies[countyId] || []).push([row[0], row[1]]);
+    });
+    bundle.wards.forEach(function (row) {
+      var constituencyId = bundle.constituencies[row[2]][0];
+      (wards[constituencyId] = wards[constituencyId] || []).push([row[0], row[1]]);
+    });
+    return { constituencies: constituencies, wards: wards };
+  }
+
+  function fillOptions(select, rows) {
+    var fragment = document.createDocumentFragment();
+    var placeholder = document.createElement("option");
+    placeholder.value = "";
+    placeholder.textContent = "---------";
+    fragment.appendChild(placeholder);
+    (rows || []).forEach(function (row) {
+      var option = document.createElement("option");
+      option.value = row[0];
+      option.textContent = row[1];
+      fragment.appendChild(option);
+    });
+    select.replaceChildren(fragment);
+  }
+
+  fetch(county.dataset.locationBundle, { credentials: "same-origin" })
+    .then(function (response) {
+      if (!response.ok) {
+        throw new Error("Location bundle: HTTP " + response.status);
+      }
+      return response.json();
+    })
+    .then(function (bundle) {
+      if (bundle.version !== 1) {
+        throw new Error("Location bundle: unsupported version");
+      }
+      index = buildIndex(bundle);
+    })
+    .catch(function () {
+      index = null; // HTMX fallback
+    });
+
+  document.body.addEventListener("htmx:beforeRequest", function (event) {
+    if (!index) {
+      return;
+    }
+    var select = event.detail.elt;
+    var constituency = document.getElementById("id_constituency");
+    var ward = document.getElementById("id_ward");
+
+    if (select.id === "id_county") {
+      event.preventDefault();
+      fillOptions(constituency, index.constituencies[select.value]);
+      fillOptions(ward, []);
+    } else if (select.id === "id_constituency") {
+      event.preventDefault();
+      fillOptions(ward, index.wards[select.value]);
+    }
+  });
+})();
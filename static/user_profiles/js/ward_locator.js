@@ -0,0 +1,110 @@
+/*
+ * static/user_profiles/js/ward_locator.js
+ *
+ * "Detect my ward" on Step 2. The button carries `data-nearest-url`
+ * (user_profiles:nearest_wards). On click, the browser position is sent to
+ * that endpoint and the nearest ward's county, constituency and ward are
+ * selected in turn. Each select fires `change`, so the dependent options load
+ * through HTMX or location_filter.js exactly as if the user had picked them.
+ */
+(function () {
+  "use strict";
+
+  var button = document.getElementById("detect-ward");
+  var status = document.getElementById("detect-ward-status");
+  if (!button || !navigator.geolocation) {
+    if (button) {
+      button.hidden = true;
+    }
+    return;
+  }
+
+  function say(message) {
+    if (status) {
+      status.textContent = message;
+    }
+  }
+
+  function hasOption(select, value) {
+    return Array.prototype.some.call(select.options, function (option) {
+      return option.value === String(value);
+    });
+  }
+
+  // Selects `value` once the select's options contain it (they may still be loading)
+  function selectWhenLoaded(select, value, done) {
+    function apply() {
+      select.value = String(value);
+      select.dispatchEvent(new Event("change", { bubbles: true }));
+      if (done) {
+        done();
+      }
+    }
+
+    if (hasOption(select, value)) {
+      apply();
+      return;
+    }
+    var observer = new MutationObserver(function () {
+      if (hasOption(select, value)) {
+        observer.disconnect();
+        apply();
+      }
+    });
+    observer.observe(select, { childList: true });
+    setTimeout(function () { observer.disconnect(); }, 10000);
+  }
+
+  function prefill(match) {
+    var county = document.getElementById("id_county");
+    var constituency = document.getElementById("id_constituency");
+    var ward = document.getElementById("id_ward");
+
+    selectWhenLoaded(county, match.county.id, function () {
+      selectWhenLoaded(constituency, match.constituency.id, function () {
+        selectWhenLoaded(ward, match.ward.id);
+      });
+    });
+    say(match.ward.name + ", " + match.constituency.name + ", " + match.county.name +
+        " (about " + match.distance_km + " km away). Please confirm.");
+  }
+
+  button.addEventListener("click", function () {
+    button.disabled = true;
+    say("Finding your location…");
+
+    navigator.geolocation.getCurrentPosition(
+      function (position) {
+        var url = button.dataset.nearestUrl +
+          "?lat=" + encodeURIComponent(position.coords.latitude) +
+          "&lng=" + encodeURIComponent(position.coords.longitude);
+
+        fetch(url, { credentials: "same-origin", headers: { "Accept": "application/json" } })
+          .then(function (response) {
+            if (!response.ok) {
+              throw new Error("HTTP " + response.status);
+            }
+            return response.json();
+          })
+          .then(function (data) {
+            if (data.wards.length) {
+              prefill(data.wards[0]);
+            } else {
+              say("No ward found near your location. Please choose it below.");
+            }
+          })
+          .catch(function () {
+            say("Could not look up your ward. Please choose it below.");
+          })
+          .then(function () {
+            button.disabled = false;
+          });
+      },
+      function () {
+        button.disabled = false;
+        say("Location unavailable. Please choose your ward below.");
+      },
+      { enableHighAccuracy: false, timeout: 10000, maximumAge: 300000 }
+    );
+  });
+})();